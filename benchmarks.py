@@ -0,0 +1,1390 @@
+"""
+Benchmarks for the Weather Data Processing Pipeline.
+Times pipeline stages against synthetic multi-station data.
+
+Usage:
+    python benchmarks.py            # run all benchmarks
+    python benchmarks.py output     # run selected benchmarks by name
+"""
+import re
+import sys
+import time
+import warnings
+import subprocess
+import logging
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+import cleanning as wp
+
+# ============================================================================
+# SYNTHETIC DATA
+# ============================================================================
+
+WEATHER_COLUMNS = ['Temperature', 'Rh', 'Dew', 'Wind Speed',
+                   'Wind Gust Speed', 'Wind Direction', 'Rain']
+
+def make_synthetic_weather_data(n_stations=10, days=365, freq='15min',
+                                missing_pct=5.0, with_flags=True, seed=42):
+    """
+    Build a cleaned, pipeline-shaped dataframe for benchmarking.
+
+    Args:
+        n_stations: Number of stations
+        days: Days of data per station
+        freq: Logging interval
+        missing_pct: Percent of values set to NaN (plus a few longer gaps)
+        with_flags: Add *_imputed flag columns (int8)
+        seed: Random seed
+
+    Returns:
+        DataFrame sorted by station and Datetime_UTC
+    """
+    rng = np.random.default_rng(seed)
+    times = pd.date_range('2023-01-01', periods=int(pd.Timedelta(days=days) / pd.Timedelta(freq)),
+                          freq=freq, tz='UTC')
+    n = len(times)
+    frames = []
+
+    for i in range(n_stations):
+        hours = np.arange(n) * pd.Timedelta(freq).total_seconds() / 3600
+        temp = 5 + 12 * np.sin(2 * np.pi * hours / 8766) + 4 * np.sin(2 * np.pi * hours / 24)
+        temp = temp + rng.normal(0, 1, n)
+        rh = np.clip(75 + rng.normal(0, 12, n), 5, 100)
+        wind = np.abs(rng.normal(12, 5, n))
+
+        df = pd.DataFrame({
+            'Datetime_UTC': times,
+            'station': f'Station{i:02d}',
+            'Temperature': temp,
+            'Rh': rh,
+            'Dew': temp - (100 - rh) / 5,
+            'Wind Speed': wind,
+            'Wind Gust Speed': wind + np.abs(rng.normal(6, 3, n)),
+            'Wind Direction': rng.uniform(0, 360, n),
+            'Rain': np.where(rng.random(n) < 0.05, rng.exponential(1.0, n), 0.0),
+        })
+
+        for col in WEATHER_COLUMNS:
+            values = df[col].to_numpy()
+            values[rng.random(n) < missing_pct / 100] = np.nan
+            for start in rng.integers(0, max(n - 50, 1), 3):
+                values[start:start + rng.integers(2, 40)] = np.nan
+            df[col] = values
+
+        frames.append(df)
+
+    df = pd.concat(frames, ignore_index=True)
+    df[WEATHER_COLUMNS] = df[WEATHER_COLUMNS].astype('float32')
+    df['station'] = df['station'].astype('category')
+
+    if with_flags:
+        for col in WEATHER_COLUMNS:
+            df[f'{col}_imputed'] = df[col].isnull().astype('int8')
+
+    return df
+
+def write_synthetic_station_csvs(root, n_stations=50, files_per_station=6, rows_per_file=2000, seed=42,
+                                 sentinel_rate=0.0):
+    """
+    Write a directory of raw, logger-style station CSVs for ingestion benchmarks.
+
+    Files use HOBO-style headers (units in parentheses, serial numbers,
+    battery/solar junk columns) and include a few 'ERROR' cells, so
+    clean_columns does the same work as on real exports.
+
+    Args:
+        root: Target directory (one sub-folder per station)
+        n_stations: Number of station folders
+        files_per_station: CSV files per station
+        rows_per_file: 10-minute readings per file
+        seed: Random seed
+        sentinel_rate: Share of RH cells written as the -9999 missing marker
+
+    Returns:
+        Total number of files written
+    """
+    rng = np.random.default_rng(seed)
+    root = Path(root)
+
+    for i in range(n_stations):
+        station_dir = root / f'Station{i:03d}'
+        station_dir.mkdir(parents=True, exist_ok=True)
+        for j in range(files_per_station):
+            times = pd.date_range('2023-01-01', periods=rows_per_file, freq='10min') + \
+                pd.Timedelta(minutes=10 * rows_per_file * j)
+            temp = 5 + rng.normal(0, 4, rows_per_file)
+            df = pd.DataFrame({
+                'Date': times.strftime('%m/%d/%Y'),
+                'Time': times.strftime('%H:%M:%S'),
+                'Temperature (°C) (LGR S/N: 2051, SEN S/N: 2051)': temp.round(2),
+                'RH (%) (LGR S/N: 2051, SEN S/N: 2051)': np.clip(75 + rng.normal(0, 12, rows_per_file), 5, 100).round(1),
+                'Dew Point (°C) (LGR S/N: 2051)': (temp - 3).round(2),
+                'Wind Speed (km/h) (LGR S/N: 2051)': np.abs(rng.normal(12, 5, rows_per_file)).round(1),
+                'Gust Speed (km/h) (LGR S/N: 2051)': np.abs(rng.normal(18, 6, rows_per_file)).round(1),
+                'Wind Direction (ø) (LGR S/N: 2051)': rng.uniform(0, 360, rows_per_file).round(0),
+                'Rain (mm) (LGR S/N: 2051)': np.where(rng.random(rows_per_file) < 0.05, 0.2, 0.0),
+                'Battery (V) (LGR S/N: 2051)': 3.6,
+                'Solar Radiation (W/m²) (LGR S/N: 2051)': rng.uniform(0, 800, rows_per_file).round(1),
+            })
+            # Text markers need an object column; the float text written is unchanged
+            temp_col = 'Temperature (°C) (LGR S/N: 2051, SEN S/N: 2051)'
+            df[temp_col] = df[temp_col].astype(object)
+            df.loc[rng.random(rows_per_file) < 0.001, temp_col] = 'ERROR'
+            if sentinel_rate:
+                df.loc[rng.random(rows_per_file) < sentinel_rate, 'RH (%) (LGR S/N: 2051, SEN S/N: 2051)'] = -9999
+            df.to_csv(station_dir / f'export_{j:02d}.csv', index=False)
+
+    return n_stations * files_per_station
+
+def write_synthetic_eccc_csv(path, years=2, seed=42):
+    """
+    Write an ECCC bulk-download style hourly CSV (quoted fields, BOM, flag columns).
+
+    Args:
+        path: Output file
+        years: Years of hourly rows
+        seed: Random seed
+
+    Returns:
+        Number of rows written
+    """
+    rng = np.random.default_rng(seed)
+    times = pd.date_range('2022-01-01', periods=int(8760 * years), freq='h')
+    n = len(times)
+    temp = 5 + 12 * np.sin(2 * np.pi * np.arange(n) / 8766) + rng.normal(0, 2, n)
+    df = pd.DataFrame({
+        'Longitude (x)': -63.08, 'Latitude (y)': 46.42, 'Station Name': 'STANHOPE', 'Climate ID': '8300590',
+        'Date/Time (LST)': times.strftime('%Y-%m-%d %H:%M'),
+        'Year': times.year, 'Month': times.month, 'Day': times.day, 'Time (LST)': times.strftime('%H:%M'),
+        'Temp (°C)': temp.round(1), 'Temp Flag': np.where(rng.random(n) < 0.01, 'M', ''),
+        'Dew Point Temp (°C)': (temp - 3).round(1), 'Dew Point Temp Flag': '',
+        'Rel Hum (%)': np.clip(75 + rng.normal(0, 12, n), 5, 100).round(0), 'Rel Hum Flag': '',
+        'Precip. Amount (mm)': np.where(rng.random(n) < 0.05, 0.4, 0.0), 'Precip. Amount Flag': '',
+        'Wind Dir (10s deg)': rng.integers(0, 37, n), 'Wind Dir Flag': '',
+        'Wind Spd (km/h)': np.abs(rng.normal(15, 6, n)).round(0), 'Wind Spd Flag': '',
+        'Visibility (km)': '', 'Visibility Flag': '',
+        'Stn Press (kPa)': (101 + rng.normal(0, 0.8, n)).round(2), 'Stn Press Flag': '',
+        'Hmdx': '', 'Hmdx Flag': '', 'Wind Chill': '', 'Wind Chill Flag': '', 'Weather': '',
+    })
+    df.to_csv(path, index=False, quoting=1, encoding='utf-8-sig')
+    return n
+
+def path_size_mb(path):
+    """Size of a file or directory tree in MB."""
+    path = Path(path)
+    if path.is_dir():
+        return sum(f.stat().st_size for f in path.rglob('*') if f.is_file()) / 1e6
+    return path.stat().st_size / 1e6
+
+def timed(func, *args, **kwargs):
+    """Run func and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def print_table(title, rows):
+    """Print benchmark rows (list of dicts) as an aligned table."""
+    print(f"\n{title}")
+    print(pd.DataFrame(rows).to_string(index=False))
+
+# ============================================================================
+# REFERENCE IMPLEMENTATIONS
+# ============================================================================
+# Previous (loop-based) versions of pipeline stages, kept so benchmarks can
+# report speedups and check that the optimized versions give the same output.
+
+def legacy_impute_missing_values(df):
+    """Per-station x per-column imputation loop (pipeline v2.6)."""
+    CONFIG = wp.CONFIG
+    df = df.sort_values(['station', 'Datetime_UTC']).reset_index(drop=True)
+
+    exclude_from_imputation = [
+        'Date/Time (LST)', 'Year', 'Month', 'Time (LST)', 'Day',
+        'Temp (°C)', 'Dew Point Temp (°C)', 'Rel Hum (%)',
+        'Precip. Amount (mm)', 'Wind Dir (10s deg)', 'Wind Spd (km/h)',
+        'Percipitation'
+    ]
+    numeric_cols = [c for c in df.columns
+                    if c not in ['Datetime_UTC', 'station']
+                    and not c.endswith('_imputed')
+                    and c not in exclude_from_imputation]
+
+    for col in numeric_cols:
+        if df[col].dtype == 'object' or df[col].dtype.name == 'category':
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    for col in numeric_cols:
+        if df[col].isnull().sum() == 0:
+            continue
+
+        flag_col = f'{col}_imputed'
+        df[flag_col] = 0
+        df.loc[df[col].isnull(), flag_col] = 1
+
+        stations_to_impute = []
+        for station in df['station'].unique():
+            station_mask = df['station'] == station
+            station_missing_pct = df.loc[station_mask, col].isnull().sum() / station_mask.sum() * 100
+            if station_missing_pct < CONFIG['IMPUTATION_THRESHOLD_PCT']:
+                stations_to_impute.append(station)
+
+        for station in stations_to_impute:
+            mask = df['station'] == station
+            station_df = df.loc[mask].copy()
+            if station_df['Datetime_UTC'].isnull().any():
+                continue
+            station_df = station_df.set_index('Datetime_UTC')
+            station_df[col] = station_df[col].interpolate(
+                method='time', limit=CONFIG['INTERPOLATE_LIMIT_HOURS'], limit_direction='both')
+            station_df = station_df.reset_index()
+            df.loc[mask, col] = station_df[col].values
+
+        if col == 'Rain':
+            for station in stations_to_impute:
+                mask = df['station'] == station
+                missing_rain = df.loc[mask, col].isnull()
+                df.loc[mask & missing_rain, flag_col] = 2
+                df.loc[mask & missing_rain, col] = 0
+        elif col == 'Wind Gust Speed' and 'Wind Speed' in df.columns:
+            for station in stations_to_impute:
+                mask = df['station'] == station
+                impute_mask = mask & df.loc[mask, col].isnull() & df.loc[mask, 'Wind Speed'].notnull()
+                df.loc[impute_mask, flag_col] = 2
+                df.loc[impute_mask, col] = df.loc[impute_mask, 'Wind Speed']
+        elif col == 'Rh' and 'Temperature' in df.columns and 'Dew' in df.columns:
+            for station in stations_to_impute:
+                mask = df['station'] == station
+                impute_mask = (mask & df.loc[mask, col].isnull() &
+                               df.loc[mask, 'Temperature'].notnull() & df.loc[mask, 'Dew'].notnull())
+                if impute_mask.sum() > 0:
+                    df.loc[impute_mask, flag_col] = 2
+                    df.loc[impute_mask, col] = wp.calculate_rh_from_temp_dew(
+                        df.loc[impute_mask, 'Temperature'], df.loc[impute_mask, 'Dew'])
+
+        if col == 'Temperature':
+            out_of_bounds = (df[col] < CONFIG['TEMP_MIN']) | (df[col] > CONFIG['TEMP_MAX'])
+            df.loc[out_of_bounds, col] = np.nan
+        elif col == 'Rh':
+            df[col] = df[col].clip(CONFIG['RH_MIN'], CONFIG['RH_MAX'])
+        elif col == 'Dew':
+            out_of_bounds = (df[col] < CONFIG['DEW_MIN']) | (df[col] > CONFIG['DEW_MAX'])
+            df.loc[out_of_bounds, col] = np.nan
+            df.loc[out_of_bounds, flag_col] = 0
+
+    return df
+
+def legacy_create_daily_aggregates(df):
+    """Daily aggregation with one groupby per column and statistic (pipeline v2.6)."""
+    df['Datetime_UTC'] = pd.to_datetime(df['Datetime_UTC'], utc=True)
+    df['date_label'] = df['Datetime_UTC'].dt.date
+    flag_cols = [c for c in df.columns if c.endswith('_imputed')]
+    df_for_agg = df.drop(columns=flag_cols)
+
+    agg_list = []
+    for col in df_for_agg.columns:
+        if col in ['station', 'date_label', 'Datetime_UTC']:
+            continue
+        if not pd.api.types.is_numeric_dtype(df_for_agg[col]):
+            continue
+
+        col_lower = col.lower()
+        grouped = lambda: df_for_agg.groupby(['station', 'date_label'], observed=True)[col]
+        if 'wind gust speed' in col_lower or 'gust speed' in col_lower:
+            agg_list.append(grouped().max().rename(col))
+        elif 'rain' in col_lower or 'precipitation' in col_lower:
+            agg_list.append(grouped().sum().rename(col))
+        elif 'wind direction' in col_lower or col == 'Wind Direction':
+            circular = wp.circular_mean_by_group(df_for_agg, ['station', 'date_label'], col,
+                                                 with_steadiness=wp.CONFIG['WIND_DIRECTION_STEADINESS'])
+            agg_list.extend(circular[c] for c in circular.columns)
+        else:
+            agg_list.append(grouped().min().rename(f'{col}_min'))
+            agg_list.append(grouped().max().rename(f'{col}_max'))
+            agg_list.append(grouped().mean().rename(f'{col}_mean'))
+
+    daily_aggregated = pd.concat(agg_list, axis=1).reset_index()
+    daily_aggregated['Datetime_UTC'] = pd.to_datetime(daily_aggregated['date_label'])
+    daily_aggregated = daily_aggregated.drop(columns=['date_label'])
+
+    numeric_columns = daily_aggregated.select_dtypes(include=[np.number]).columns
+    daily_aggregated[numeric_columns] = daily_aggregated[numeric_columns].round(2)
+    col_order = ['Datetime_UTC', 'station'] + [c for c in daily_aggregated.columns
+                                                if c not in ['Datetime_UTC', 'station']]
+    return daily_aggregated[col_order]
+
+def legacy_clean_columns(df):
+    """Split/lower/alias every column of every file, keeping unknown names (pipeline v2.6)."""
+    aliases = {
+        'wind gust  speed': 'Wind Gust Speed', 'wind gust speed': 'Wind Gust Speed',
+        'gust speed': 'Wind Gust Speed', 'avg wind speed': 'Wind Speed',
+        'average wind speed': 'Wind Speed', 'wind spd': 'Wind Speed', 'windspd': 'Wind Speed',
+        'accumulated rain': 'Percipitation', 'precip. amount': 'Percipitation',
+        'temp': 'Temperature', 'wind dir': 'Wind Direction', 'rel hum': 'Rh', 'date/time': 'Date/Time',
+    }
+
+    def standardize(col):
+        lower = str(col).lower().strip()
+        return 'Dew' if 'dew' in lower else aliases.get(lower, str(col).title())
+
+    df.columns = [re.split(r'[\(_]', str(col))[0].strip() for col in df.columns]
+    junk = [col for col in df.columns if any(p in str(col).lower() for p in wp.JUNK_COLUMN_PATTERNS)]
+    df = df.drop(columns=junk)
+    df.columns = ['station' if c == 'station' else standardize(c) for c in df.columns]
+    df = df.loc[:, ~df.columns.duplicated()]
+    return df.drop(columns=df.columns[(df.nunique() <= 1) & (df.columns != 'station')])
+
+def legacy_load_single_csv(file_info):
+    """Untyped read of a whole station CSV, UTF-8 then latin1 (pipeline v2.6)."""
+    full_path, relative_path = file_info
+    try:
+        df = pd.read_csv(full_path, encoding='utf-8', on_bad_lines='skip', low_memory=False)
+    except UnicodeDecodeError:
+        df = pd.read_csv(full_path, encoding='latin1', on_bad_lines='skip', low_memory=False)
+    return df, wp.station_from_path(relative_path), None
+
+def legacy_replace_error_strings(df):
+    """Full-frame 'ERROR' comparison on the combined data (pipeline v2.6 clean_weather_data)."""
+    error_mask = df == 'ERROR'
+    if error_mask.to_numpy().any():
+        df[error_mask] = pd.NA
+    return df
+
+def groupby_quality_control(df):
+    """The QC tests of apply_quality_control as a per-station loop of pandas Series operations."""
+    df = df.sort_values(['station', 'Datetime_UTC']).reset_index(drop=True)
+    flags = np.zeros(len(df), dtype=wp.QC_FLAG_DTYPE)
+    cleaned = {}
+
+    for _, group in df.groupby('station', observed=True, sort=False):
+        times = group['Datetime_UTC']
+        close = times.diff() <= pd.Timedelta(hours=wp.QC_STEP_MAX_GAP_HOURS)
+        values = {}
+        for variable in wp.QC_VARIABLES:
+            x = group[variable].astype('float64')
+            low, high = (wp.CONFIG[b] if isinstance(b, str) else b for b in wp.QC_RANGES[variable])
+            failed = {'range': (x < low) | (x > high)}
+            x = x.clip(low, high) if variable == 'Rh' else x.mask(failed['range'])
+
+            if variable in wp.QC_STEP_LIMITS:
+                diffs = x.diff()
+                jump = close & (diffs.abs() > wp.QC_STEP_LIMITS[variable])
+                rising = diffs > 0
+                spike = jump & jump.shift(-1, fill_value=False) & (rising != rising.shift(-1, fill_value=False))
+                failed['step'] = (jump & ~spike & ~spike.shift(1, fill_value=False)) | spike
+            if variable in wp.QC_FLATLINE_HOURS:
+                runs = (x != x.shift()).cumsum()
+                span = times.groupby(runs).transform('max') - times.groupby(runs).transform('min')
+                failed['flatline'] = ((x.groupby(runs).transform('size') > 1) & x.notna() &
+                                      (span >= pd.Timedelta(hours=wp.QC_FLATLINE_HOURS[variable])))
+            for test, mask in failed.items():
+                if test != 'range':
+                    x = x.mask(mask)
+                flags[mask.index[mask.to_numpy()]] |= np.uint32(wp.qc_bit(variable, test))
+            values[variable] = x
+
+        inconsistent = values['Dew'] > values['Temperature'] + wp.QC_DEW_TOLERANCE
+        values['Dew'] = values['Dew'].mask(inconsistent)
+        flags[inconsistent.index[inconsistent.to_numpy()]] |= np.uint32(wp.qc_bit('Dew', 'consistency'))
+        for variable, x in values.items():
+            cleaned.setdefault(variable, []).append(x)
+
+    for variable, parts in cleaned.items():
+        df[variable] = pd.concat(parts).astype(df[variable].dtype)
+    df[wp.QC_FLAG_COLUMN] = flags
+    return df
+
+def legacy_gap_histogram(df):
+    """Gap-length histogram with a run-length scan per (station, column) pair."""
+    edges = [0] + wp.CONFIG['GAP_HISTOGRAM_HOURS'] + [np.inf]
+    data_cols = [c for c in df.columns
+                 if c not in ['Datetime_UTC', 'station', wp.QC_FLAG_COLUMN] and not c.endswith('_imputed')]
+    rows = []
+    for station in sorted(df['station'].unique()):
+        station_df = df[df['station'] == station].sort_values('Datetime_UTC')
+        times = station_df['Datetime_UTC']
+        for col in data_cols:
+            missing = station_df[col].isnull()
+            if f'{col}_imputed' in station_df.columns:
+                missing |= station_df[f'{col}_imputed'] != 0
+            run = (missing != missing.shift()).cumsum()
+            before = times.where(~missing).ffill().fillna(times.groupby(run).transform('min'))
+            after = times.where(~missing).bfill().fillna(times.groupby(run).transform('max'))
+            hours = ((after - before) / pd.Timedelta(hours=1))[missing].groupby(run[missing]).first()
+            counts = pd.cut(hours, edges, right=True).value_counts(sort=False).to_numpy()
+            rows.append([station, col, len(hours), *counts, round(hours.max(), 2) if len(hours) else np.nan])
+    return pd.DataFrame(rows, columns=['station', 'column'] + wp.gap_histogram_columns())
+
+def legacy_create_data_quality_csv(df):
+    """Per-station x per-column filter, dropna and describe loop (pipeline v2.6)."""
+    data_cols = [c for c in df.columns
+                 if c not in ['Datetime_UTC', 'station'] and not c.endswith('_imputed')]
+
+    def quality_row(station, col, frame):
+        total_rows = len(frame)
+        missing_count = frame[col].isnull().sum()
+        flag_col = f'{col}_imputed'
+        if flag_col in frame.columns:
+            flags = frame[flag_col]
+            original, interpolated, calculated = (flags == 0).sum(), (flags == 1).sum(), (flags == 2).sum()
+        else:
+            original, interpolated, calculated = total_rows - missing_count, 0, 0
+        total_imputed = interpolated + calculated
+        valid = frame[col].dropna()
+        stats = ([valid.mean(), valid.median(), valid.min(), valid.max(), valid.quantile(0.25), valid.quantile(0.75)]
+                 if len(valid) > 0 else [np.nan] * 6)
+        stats.append(stats[5] - stats[4])
+        return dict(zip(
+            ['station', 'column', 'total_rows', 'missing_count', 'missing_percent', 'original_data_count',
+             'interpolated_count', 'calculated_count', 'total_imputed_count', 'imputation_percent',
+             'mean', 'median', 'min', 'max', 'q1', 'q3', 'iqr'],
+            [station, col, total_rows, missing_count,
+             round(missing_count / total_rows * 100, 2) if total_rows > 0 else 0,
+             original, interpolated, calculated, total_imputed,
+             round(total_imputed / total_rows * 100, 2) if total_rows > 0 else 0]
+            + [round(v, 2) if not np.isnan(v) else np.nan for v in stats]))
+
+    rows = []
+    for station in sorted(df['station'].unique()):
+        station_df = df[df['station'] == station]
+        rows += [quality_row(station, col, station_df) for col in data_cols]
+    rows += [quality_row('ALL_STATIONS', col, df) for col in data_cols]
+    return pd.DataFrame(rows)
+
+def legacy_remove_duplicates(df):
+    """Count, report and drop full-row duplicates with three duplicated() passes (pipeline v2.6)."""
+    dup_count = df.duplicated().sum()
+    if dup_count > 0:
+        dup_mask = df.duplicated(keep=False)
+        df[dup_mask].groupby('station', observed=True).size()
+        df = df.drop_duplicates(keep='first')
+    return df
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def benchmark_output_backends(df=None):
+    """Compare write time, read time and size of the CSV and Parquet output backends."""
+    if df is None:
+        df = make_synthetic_weather_data()
+
+    formats = ['csv'] + (['parquet'] if wp.HAS_PYARROW else [])
+    rows = []
+    original_format = wp.CONFIG['OUTPUT_FORMAT']
+    original_output = wp.CONFIG['OUTPUT_ALL_DATA']
+    tmp_dir = Path(tempfile.mkdtemp())
+
+    try:
+        wp.CONFIG['OUTPUT_ALL_DATA'] = str(tmp_dir / 'all_weather_data.csv')
+        for output_format in formats:
+            wp.CONFIG['OUTPUT_FORMAT'] = output_format
+            output_path, write_s = timed(wp.write_output, df, 'OUTPUT_ALL_DATA')
+            result, read_s = timed(wp.read_output, 'OUTPUT_ALL_DATA')
+            rows.append({
+                'format': output_format,
+                'rows': len(df),
+                'write_s': round(write_s, 2),
+                'read_s': round(read_s, 2),
+                'size_mb': round(path_size_mb(output_path), 1),
+                'float32_kept': (result[WEATHER_COLUMNS].dtypes == 'float32').all(),
+            })
+    finally:
+        wp.CONFIG['OUTPUT_FORMAT'] = original_format
+        wp.CONFIG['OUTPUT_ALL_DATA'] = original_output
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print_table("Output backends (all_weather_data)", rows)
+    return rows
+
+def long_gap_rows(df, col, limit_hours):
+    """Rows of df (station/time ordered) inside gaps of col longer than limit_hours."""
+    layout = wp.StationLayout(df)
+    times = df['Datetime_UTC'].to_numpy(dtype='datetime64[ns]').view('i8').astype(np.float64)
+    gaps = wp.find_gaps(df[col].isnull().to_numpy(), times, layout.starts, layout.stops)
+    rows = np.zeros(len(df), dtype=bool)
+    for first, stop in zip(gaps['first'][gaps['hours'] > limit_hours], gaps['stop'][gaps['hours'] > limit_hours]):
+        rows[first:stop] = True
+    return rows
+
+def benchmark_imputation(df=None):
+    """
+    Compare the vectorized imputation engine against the v2.6 per-station loop.
+
+    v2.6 passed INTERPOLATE_LIMIT_HOURS to interpolate() as a row limit. On
+    hourly data that matches the duration rule for every gap it fills, so
+    the only difference left is the documented one: gaps longer than the
+    limit are no longer partly interpolated from their ends. Those rows (and
+    the Rh / gust rows derived from them in tier 2) are compared separately.
+    """
+    if df is None:
+        df = make_synthetic_weather_data(n_stations=20, days=480, freq='1h', with_flags=False)
+    df = df.sort_values(['station', 'Datetime_UTC']).reset_index(drop=True)
+
+    legacy, legacy_s = timed(legacy_impute_missing_values, df.copy())
+    current, current_s = timed(wp.impute_missing_values, df.copy())
+
+    limit = wp.CONFIG['INTERPOLATE_LIMIT_HOURS']
+    own_long_rows = {col: long_gap_rows(df, col, limit) for col in WEATHER_COLUMNS}
+    long_rows = dict(own_long_rows)
+    # Tier 2 fills Rh from Temperature and gusts from Wind Speed
+    long_rows['Rh'] = own_long_rows['Rh'] | own_long_rows['Temperature']
+    long_rows['Wind Gust Speed'] = own_long_rows['Wind Gust Speed'] | own_long_rows['Wind Speed']
+
+    differing = 0
+    for col in WEATHER_COLUMNS:
+        same = ~long_rows[col]
+        for name in [col, f'{col}_imputed']:
+            pd.testing.assert_series_equal(legacy.loc[same, name], current.loc[same, name], check_dtype=False)
+        # Inside long gaps nothing is interpolated any more: values stay NaN
+        # unless a tier 2 rule fills them (flag 2)
+        inside = own_long_rows[col] & df[col].isnull().to_numpy()
+        interpolated = inside & current[col].notnull().to_numpy() & (current[f'{col}_imputed'] != 2).to_numpy()
+        assert not interpolated.any(), f"{col}: long gap interpolated"
+        differing += int((~legacy.loc[inside, col].eq(current.loc[inside, col])
+                          & (legacy.loc[inside, col].notnull() | current.loc[inside, col].notnull())).sum())
+
+    rows = [
+        {'engine': 'per-station loop (v2.6)', 'rows': len(df), 'seconds': round(legacy_s, 2)},
+        {'engine': 'vectorized', 'rows': len(df), 'seconds': round(current_s, 2)},
+    ]
+    print_table(f"Imputation ({df['station'].nunique()} stations, speedup {legacy_s / current_s:.1f}x; "
+                f"identical except {differing:,} long-gap values v2.6 partly interpolated)", rows)
+    return rows
+
+def benchmark_circular_mean(df=None):
+    """Compare the per-group circular_mean_degrees callback with the vectorized aggregator."""
+    if df is None:
+        df = make_synthetic_weather_data(n_stations=10, days=180, freq='5min', with_flags=False)
+
+    rows = []
+    for label, freq in [('hourly', 'h'), ('daily', 'D')]:
+        data = df[['station', 'Wind Direction']].assign(period=df['Datetime_UTC'].dt.floor(freq))
+        grouped = data.groupby(['station', 'period'], observed=True)
+
+        legacy, legacy_s = timed(grouped['Wind Direction'].agg, wp.circular_mean_degrees)
+        current, current_s = timed(wp.circular_mean_by_group, data, ['station', 'period'],
+                                   'Wind Direction', with_steadiness=True)
+
+        # 0 and 360 are the same direction
+        diff = np.abs(legacy - current['Wind Direction'])
+        max_diff = np.nanmax(np.minimum(diff, 360 - diff))
+        rows.append({
+            'groups': f'{label} ({len(legacy):,})',
+            'callback_s': round(legacy_s, 3),
+            'vectorized_s': round(current_s, 3),
+            'speedup': round(legacy_s / current_s, 1),
+            'max_diff_deg': float(f'{max_diff:.2g}'),
+        })
+
+    print_table(f"Circular mean of Wind Direction ({len(df):,} rows)", rows)
+    return rows
+
+def benchmark_daily_aggregation(df=None):
+    """Compare single-pass daily aggregation against one groupby per statistic."""
+    if df is None:
+        df = make_synthetic_weather_data(n_stations=20, days=365)
+
+    legacy, legacy_s = timed(legacy_create_daily_aggregates, df.copy())
+    current, current_s = timed(wp.create_daily_aggregates, df.copy())
+
+    pd.testing.assert_frame_equal(legacy, current)
+    rows = [
+        {'engine': 'groupby per statistic', 'rows': len(df), 'seconds': round(legacy_s, 2)},
+        {'engine': 'single named aggregation', 'rows': len(df), 'seconds': round(current_s, 2)},
+    ]
+    print_table(f"Daily aggregation (speedup {legacy_s / current_s:.1f}x, "
+                f"identical schema and values)", rows)
+    return rows
+
+def benchmark_quality_report(df=None):
+    """Compare the per-(station, column) quality report loop against the vectorized pass."""
+    if df is None:
+        df = make_synthetic_weather_data(n_stations=40, days=365)
+
+    legacy, legacy_s = timed(legacy_create_data_quality_csv, df)
+    current, current_s = timed(wp.create_data_quality_csv, df)
+    current = current.drop(columns=wp.gap_histogram_columns())  # not in the legacy report
+
+    # Same rows and columns; the legacy loop keeps float32 statistics, so
+    # compare values at the report's two-decimal precision
+    assert list(legacy.columns) == list(current.columns)
+    pd.testing.assert_frame_equal(legacy, current, check_dtype=False, atol=0.011)
+    rows = [
+        {'engine': 'loop per station x column', 'rows': len(df), 'seconds': round(legacy_s, 2)},
+        {'engine': 'vectorized single pass', 'rows': len(df), 'seconds': round(current_s, 2)},
+    ]
+    print_table(f"Data quality report (speedup {legacy_s / current_s:.1f}x, "
+                f"{df['station'].nunique()} stations, identical schema)", rows)
+    return rows
+
+def benchmark_gap_histogram(n_stations=20, days=365, seed=42):
+    """Compare the gap index histogram with a run-length scan per (station, column) pair."""
+    rng = np.random.default_rng(seed)
+    df = make_synthetic_weather_data(n_stations=n_stations, days=days, freq='5min')
+    # Outages from 5 minutes to two days
+    for col in ['Temperature', 'Rh', 'Wind Speed']:
+        for start, length in zip(rng.choice(len(df), 300, replace=False), rng.geometric(1 / 60, 300)):
+            df.loc[start:start + length, col] = np.nan
+
+    legacy, legacy_s = timed(legacy_gap_histogram, df)
+    _, current_s = timed(lambda: wp.summarize_gaps(wp.StationLayout(df), list(legacy['column'].unique()), False))
+    current = wp.create_data_quality_csv(df, include_summary=False)
+    current = current[['station', 'column'] + wp.gap_histogram_columns()]
+    pd.testing.assert_frame_equal(legacy, current, check_dtype=False)
+
+    rows = [
+        {'engine': 'scan per station x column', 'rows': len(df), 'gaps': int(current['gap_count'].sum()),
+         'seconds': round(legacy_s, 2)},
+        {'engine': 'gap index + bincount', 'rows': len(df), 'gaps': int(current['gap_count'].sum()),
+         'seconds': round(current_s, 2)},
+    ]
+    print_table(f"Gap-length histogram ({n_stations} stations, 5-minute data, identical counts)", rows)
+    return rows
+
+def benchmark_quality_snapshots(n_stations=20, days=365):
+    """Compare cheap (level 1) and full (level 2) stage quality snapshots on a freshly loaded frame."""
+    df = make_synthetic_weather_data(n_stations=n_stations, days=days, with_flags=False)
+    # Freshly loaded frames still carry text date/time columns and object station names
+    df['Date'] = df['Datetime_UTC'].dt.strftime('%m/%d/%Y')
+    df['Time'] = df['Datetime_UTC'].dt.strftime('%H:%M:%S')
+    df['station'] = df['station'].astype(object)
+
+    rows = []
+    for level in [2, 1]:
+        snapshot, seconds = timed(wp.take_quality_snapshot, df, 'After Initial Load', level)
+        rows.append({'level': level, 'rows': len(df), 'seconds': round(seconds, 2),
+                     'memory_mb': snapshot['memory_mb'], 'duplicate_rows': snapshot['duplicate_rows']})
+
+    print_table(f"Stage quality snapshot (level 1 is {rows[0]['seconds'] / rows[1]['seconds']:.1f}x cheaper)", rows)
+    return rows
+
+def benchmark_quality_control(n_stations=10, days=365, seed=42):
+    """Compare the vectorized QC stage with a per-station pandas loop on 5-minute data."""
+    rng = np.random.default_rng(seed)
+    df = make_synthetic_weather_data(n_stations=n_stations, days=days, freq='5min', with_flags=False)
+    # Inject faults: out-of-range values, spikes and a stuck temperature sensor
+    n = len(df)
+    df.loc[rng.choice(n, 200, replace=False), 'Temperature'] = 85.0
+    df.loc[rng.choice(n, 200, replace=False), 'Rh'] = rng.uniform(-20, 0, 200).astype('float32')
+    spikes = rng.choice(np.arange(1, n - 1), 500, replace=False)
+    df.loc[spikes, 'Dew'] = df.loc[spikes, 'Dew'] + 25
+    df.loc[1000:1200, 'Temperature'] = 3.5
+
+    rows = []
+    results = {}
+    for name, qc in [('per-station pandas loop', groupby_quality_control),
+                     ('vectorized (apply_quality_control)', wp.apply_quality_control)]:
+        results[name], seconds = timed(qc, df.copy())
+        rows.append({'engine': name, 'rows': n, 'seconds': round(seconds, 2),
+                     'rows_per_s': f"{n / seconds:,.0f}",
+                     'flagged': int(np.count_nonzero(results[name][wp.QC_FLAG_COLUMN]))})
+
+    # Same flags and the same cleaned values
+    reference, vectorized = results.values()
+    pd.testing.assert_frame_equal(reference[wp.QC_VARIABLES + [wp.QC_FLAG_COLUMN]],
+                                  vectorized[wp.QC_VARIABLES + [wp.QC_FLAG_COLUMN]])
+
+    print_table(f"Quality control ({n_stations} stations x {days} days of 5-minute data)", rows)
+    print(wp.decode_qc_flags(vectorized[wp.QC_FLAG_COLUMN]).sum().to_string())
+    return rows
+
+def benchmark_deduplication(n_stations=20, days=365, overlap=0.05, seed=42):
+    """Compare the three-pass duplicated() stage with single-pass deduplication policies."""
+    rng = np.random.default_rng(seed)
+    df = make_synthetic_weather_data(n_stations=n_stations, days=days, with_flags=False)
+    # Overlapping exports: repeat a slice of rows, some with a re-read value
+    repeats = df.sample(frac=overlap, random_state=seed)
+    changed = rng.random(len(repeats)) < 0.3
+    repeats.loc[changed, 'Temperature'] += np.float32(0.1)
+    df = pd.concat([df, repeats], ignore_index=True)
+
+    legacy, legacy_s = timed(legacy_remove_duplicates, df)
+    rows = [{'policy': 'exact (3 x duplicated)', 'rows': len(df), 'removed': len(df) - len(legacy),
+             'seconds': round(legacy_s, 2)}]
+    for policy in wp.DUPLICATE_POLICIES:
+        # Dtype warnings (e.g. float64 means into float32 columns) become errors in later pandas
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            (result, _), seconds = timed(wp.deduplicate_rows, df, policy)
+        assert (result.dtypes == df.dtypes).all(), f"{policy} changed column dtypes"
+        rows.append({'policy': policy, 'rows': len(df), 'removed': len(df) - len(result),
+                     'seconds': round(seconds, 2)})
+        if policy == 'exact':
+            pd.testing.assert_frame_equal(legacy.reset_index(drop=True), result)
+
+    print_table(f"Deduplication ({overlap:.0%} of rows exported twice, 30% of those re-read)", rows)
+    return rows
+
+def benchmark_station_layout(df=None):
+    """Compare boolean station masks against StationLayout slices."""
+    if df is None:
+        df = make_synthetic_weather_data(n_stations=50, days=365)
+    df['station'] = df['station'].astype('category')
+
+    def mask_selection():
+        return [df.loc[df['station'] == station, 'Temperature'].mean()
+                for station in sorted(df['station'].unique())]
+
+    def layout_selection():
+        layout = wp.StationLayout(df)
+        return [layout.slice(station)['Temperature'].mean() for station in sorted(layout.stations)]
+
+    masked, mask_s = timed(mask_selection)
+    sliced, slice_s = timed(layout_selection)
+    assert np.allclose(masked, sliced)
+
+    rows = [
+        {'operation': 'per-station selection', 'engine': 'boolean masks', 'seconds': round(mask_s, 3)},
+        {'operation': 'per-station selection', 'engine': 'layout slices', 'seconds': round(slice_s, 3)},
+    ]
+    print_table(f"Station layout ({len(df):,} rows, {df['station'].nunique()} stations; "
+                f"selection {mask_s / slice_s:.1f}x)", rows)
+    return rows
+
+def benchmark_resampling(df=None):
+    """Compare rolled-up resampled products against aggregating raw rows for each."""
+    if df is None:
+        df = make_synthetic_weather_data(n_stations=20, days=365, freq='10min')
+
+    products = [
+        {'name': '10min', 'freq': '10min', 'output': 'weather_data_10min'},
+        {'name': '3hour', 'freq': '3h', 'output': 'weather_data_3hour'},
+        {'name': 'daily', 'freq': 'D', 'output': 'weather_data_daily', 'stats': ['min', 'max', 'mean']},
+        {'name': 'monthly', 'freq': 'MS', 'output': 'weather_data_monthly', 'stats': ['min', 'max', 'mean']},
+    ]
+
+    def from_raw_rows():
+        return {p['name']: wp.finalize_partial_aggregates(wp.build_partial_aggregates(df, p['freq']),
+                                                          p.get('stats', ['mean']))
+                for p in products}
+
+    direct, direct_s = timed(from_raw_rows)
+    rolled, rolled_s = timed(wp.resample_weather_data, df, products)
+
+    for name in direct:
+        pd.testing.assert_frame_equal(direct[name], rolled[name], check_exact=False, atol=0.011)
+    rows = [
+        {'engine': 'raw rows per product', 'products': len(products), 'seconds': round(direct_s, 2)},
+        {'engine': 'roll-up from finer', 'products': len(products), 'seconds': round(rolled_s, 2)},
+    ]
+    print_table(f"Resampling (speedup {direct_s / rolled_s:.1f}x, values within rounding)", rows)
+    return rows
+
+def benchmark_schema_harmonization(n_stations=40, files_per_station=12, rows_per_file=2000, seed=42):
+    """Compare per-column name cleaning against the memoized mapping registry, including the concat."""
+    rng = np.random.default_rng(seed)
+    variables = ['Temp (°C)', 'RH (%)', 'Dew Point (°C)', 'Wind Speed (km/h)', 'Gust Speed (km/h)',
+                 'Wind Direction (ø)', 'Rain (mm)']
+    frames = []
+    for i in range(n_stations):
+        # Each logger also records a couple of sensors the registry doesn't know
+        header = variables + [f'Probe {i}-{k}' for k in range(2)] + ['Battery (V)']
+        for _ in range(files_per_station):
+            frame = pd.DataFrame(rng.normal(size=(rows_per_file, len(header))).astype('float32'), columns=header)
+            frame.insert(0, 'Time', '00:00:00')
+            frame.insert(0, 'Date', '01/01/2024')
+            frames.append(frame)
+
+    rows = []
+    for name, clean in [('split/alias per column', legacy_clean_columns), ('mapping registry', wp.clean_columns)]:
+        wp.compile_column_mapping.cache_clear()
+        started = time.perf_counter()
+        cleaned = [clean(frame.copy()) for frame in frames]
+        clean_s = time.perf_counter() - started
+        combined, concat_s = timed(pd.concat, cleaned, ignore_index=True, sort=False)
+        rows.append({'engine': name, 'files': len(frames), 'clean_s': round(clean_s, 2),
+                     'concat_s': round(concat_s, 2), 'columns': combined.shape[1],
+                     'mb': round(combined.memory_usage(deep=True).sum() / 1e6, 1)})
+
+    print_table("Schema harmonization (unknown sensor columns per station)", rows)
+    return rows
+
+def benchmark_assembly(n_stations=30, files_per_station=20, rows_per_file=2000, seed=42):
+    """Compare pd.concat over cleaned source frames with preallocated assembly (time and peak memory)."""
+    import tracemalloc
+
+    rng = np.random.default_rng(seed)
+    variables = list(wp.VARIABLE_DTYPES)
+    frames = []
+    for i in range(n_stations):
+        # Loggers record different subsets; ECCC-style sources add text columns
+        present = [v for v in variables if rng.random() < 0.8]
+        for j in range(files_per_station):
+            frame = pd.DataFrame(rng.normal(size=(rows_per_file, len(present))).astype('float32'), columns=present)
+            frame.insert(0, 'Date/Time', pd.date_range('2024-01-01', periods=rows_per_file, freq='h')
+                         .strftime('%Y-%m-%d %H:%M').to_numpy(dtype=object))
+            if i % 5 == 0:
+                frame['Visibility'] = rng.normal(size=rows_per_file)
+                frame['Weather'] = np.where(rng.random(rows_per_file) < 0.1, 'Rain', None)
+            if i == 1 and j == 0 and 'Rh' in present:
+                frame['Rh'] = frame['Rh'].astype(object)
+                frame.loc[:10, 'Rh'] = 'ERROR'
+            frame['station'] = f'Station{i}'
+            frames.append(frame)
+
+    def concat_and_repair(parts):
+        # What clean_weather_data later does to a plain concat: ERROR -> NaN,
+        # numeric variables back to float32, station to a category
+        combined = wp.merge_duplicate_columns(pd.concat(parts, axis=0, ignore_index=True, sort=False))
+        for col in combined.columns.intersection(list(wp.VARIABLE_DTYPES)):
+            if combined[col].dtype == object:
+                combined[col] = pd.to_numeric(combined[col], errors='coerce').astype(wp.VARIABLE_DTYPES[col])
+        combined['station'] = combined['station'].astype(wp.STATION_DTYPE)
+        return combined
+
+    pd.testing.assert_frame_equal(wp.assemble_frames(frames), concat_and_repair(frames))
+
+    rows = []
+    for name, combine in [('pd.concat', lambda f: pd.concat(f, axis=0, ignore_index=True, sort=False)),
+                          ('pd.concat + dtype repair', concat_and_repair),
+                          ('preallocated', wp.assemble_frames)]:
+        combined, seconds = timed(combine, frames)
+        del combined
+        # Traced separately: tracemalloc slows the Python-level loops
+        tracemalloc.start()
+        combined = combine(frames)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rows.append({'engine': name, 'frames': len(frames), 'seconds': round(seconds, 2),
+                     'peak_mb': round(peak / 1e6, 1),
+                     'result_mb': round(combined.memory_usage().sum() / 1e6, 1),
+                     'result_deep_mb': round(combined.memory_usage(deep=True).sum() / 1e6, 1),
+                     'object_columns': int((combined.dtypes == object).sum())})
+        del combined
+
+    print_table("Combining cleaned frames (traced peak allocation, identical output after repair)", rows)
+    return rows
+
+def benchmark_read_schema(n_stations=50, files_per_station=6):
+    """Compare memory and time of untyped reads against the read-time dtype schema."""
+    tmp_dir = Path(tempfile.mkdtemp())
+    rows = []
+
+    def load_all(reader, csv_files):
+        frames = []
+        for file_info in csv_files:
+            df, station, _ = reader(file_info)
+            df = wp.clean_columns(df)
+            df['station'] = station
+            frames.append(df)
+        return frames
+
+    try:
+        write_synthetic_station_csvs(tmp_dir, n_stations, files_per_station)
+        csv_files = [(str(f), str(f.relative_to(tmp_dir))) for f in sorted(tmp_dir.rglob('*.csv'))]
+        data_mb = path_size_mb(tmp_dir)
+
+        for engine, reader in [('untyped read', legacy_load_single_csv),
+                               ('dtype schema', wp.load_single_csv)]:
+            frames, seconds = timed(load_all, reader, csv_files)
+            loaded_mb = sum(df.memory_usage(deep=True).sum() for df in frames) / 1e6
+            combined = pd.concat(frames, ignore_index=True, sort=False)
+            del frames
+            if reader is legacy_load_single_csv:
+                combined = legacy_replace_error_strings(combined)
+            cleaned = wp.clean_weather_data(combined)
+            rows.append({'engine': engine, 'seconds': round(seconds, 2),
+                         'mb_per_s': round(data_mb / seconds, 1),
+                         'loaded_mb': round(loaded_mb, 1),
+                         'cleaned_mb': round(cleaned.memory_usage(deep=True).sum() / 1e6, 1),
+                         'float64_cols': sum(cleaned.dtypes == 'float64'),
+                         'object_cols': sum(cleaned.dtypes == 'object')})
+            del combined, cleaned
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print_table(f"Read-time dtype schema ({data_mb:.0f} MB of CSV, memory before/after)", rows)
+    return rows
+
+def benchmark_na_sentinels(n_stations=50, files_per_station=6, sentinel_rate=0.002):
+    """Compare the full-frame 'ERROR' scan after concat with parse-time missing-value markers."""
+    import tracemalloc
+
+    tmp_dir = Path(tempfile.mkdtemp())
+    saved_sentinels = wp.CONFIG['NA_SENTINELS']
+    saved_count_text = wp.CONFIG['COUNT_TEXT_SENTINELS']
+    rows = []
+
+    try:
+        write_synthetic_station_csvs(tmp_dir, n_stations, files_per_station, sentinel_rate=sentinel_rate)
+        csv_files = [(str(f), str(f.relative_to(tmp_dir))) for f in sorted(tmp_dir.rglob('*.csv'))]
+
+        markers = ['ERROR', '-9999', '-888.88']
+        for engine, sentinels, scan, count_text in [
+                ('ERROR at parse + full-frame scan', ['ERROR'], True, False),
+                ('parse-time markers', markers, False, False),
+                ('parse-time markers + text counts', markers, False, True)]:
+            wp.CONFIG['NA_SENTINELS'] = {'default': sentinels}
+            wp.CONFIG['COUNT_TEXT_SENTINELS'] = count_text
+            frames, load_s = timed(lambda: [wp.clean_columns(wp.load_single_csv(f)[0]) for f in csv_files])
+            combined = wp.assemble_frames(frames)
+            del frames
+            scan_s, scan_mb = 0.0, 0.0
+            if scan:
+                tracemalloc.start()
+                combined, scan_s = timed(legacy_replace_error_strings, combined)
+                scan_mb = tracemalloc.get_traced_memory()[1] / 1e6
+                tracemalloc.stop()
+            rows.append({'engine': engine, 'load_s': round(load_s, 2), 'scan_s': round(scan_s, 2),
+                         'scan_peak_mb': round(scan_mb, 1),
+                         'markers_left': int((combined.select_dtypes('number') == -9999).sum().sum()),
+                         'object_cols': int((combined.dtypes == object).sum())})
+            del combined
+    finally:
+        wp.CONFIG['NA_SENTINELS'] = saved_sentinels
+        wp.CONFIG['COUNT_TEXT_SENTINELS'] = saved_count_text
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print_table("Missing-value markers (ERROR in Temperature, -9999 in RH)", rows)
+    return rows
+
+def benchmark_dialect_sniffing(n_stations=20, files_per_station=6):
+    """Compare UTF-8-then-latin1 parsing against sniffed, per-folder cached dialects."""
+    tmp_dir = Path(tempfile.mkdtemp())
+    rows = []
+
+    try:
+        write_synthetic_station_csvs(tmp_dir, n_stations, files_per_station)
+        # Half the stations export latin1 throughout; the others are UTF-8
+        # with a stray latin1 degree sign in the last line
+        for i, station_dir in enumerate(sorted(tmp_dir.iterdir())):
+            for path in station_dir.glob('*.csv'):
+                if i % 2 == 0:
+                    path.write_bytes(path.read_text(encoding='utf-8').encode('latin1'))
+                else:
+                    with open(path, 'ab') as f:
+                        f.write('01/01/2030,00:00:00\xb0,,,,,,,,,\n'.encode('latin1'))
+        csv_files = [(str(f), str(f.relative_to(tmp_dir))) for f in sorted(tmp_dir.rglob('*.csv'))]
+        data_mb = path_size_mb(tmp_dir)
+
+        wp._dialect_cache.clear()
+        stats_before = dict(wp.DIALECT_STATS)
+        for engine, reader in [('utf-8 then latin1', legacy_load_single_csv),
+                               ('sniffed dialect', wp.load_single_csv)]:
+            _, seconds = timed(lambda: [reader(file_info) for file_info in csv_files])
+            rows.append({'engine': engine, 'files': len(csv_files), 'seconds': round(seconds, 2),
+                         'mb_per_s': round(data_mb / seconds, 1)})
+        stats = {key: wp.DIALECT_STATS[key] - stats_before[key] for key in stats_before}
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print_table(f"CSV dialect sniffing ({data_mb:.0f} MB; sniffed {stats['sniffed']}, "
+                f"reused {stats['cached']}, re-parsed {stats['retried']}, "
+                f"double parses avoided {stats['direct_latin1']})", rows)
+    return rows
+
+def benchmark_csv_engines(repeats=3):
+    """Compare per-file parse throughput of the C and pyarrow CSV engines."""
+    if not wp.HAS_PYARROW:
+        print("\nCSV engines: pyarrow is not installed, skipping")
+        return []
+
+    tmp_dir = Path(tempfile.mkdtemp())
+    saved_engine = wp.CONFIG['CSV_ENGINE']
+    rows = []
+
+    try:
+        write_synthetic_station_csvs(tmp_dir / 'hobo', n_stations=1, files_per_station=1, rows_per_file=200000)
+        write_synthetic_eccc_csv(tmp_dir / 'eccc.csv', years=10)
+        files = {'HOBO export': next((tmp_dir / 'hobo').rglob('*.csv')), 'ECCC hourly': tmp_dir / 'eccc.csv'}
+
+        for kind, path in files.items():
+            dialect = wp.sniff_csv_dialect(path)
+            size_mb = path_size_mb(path)
+            frames = {}
+            for engine in ['c', 'pyarrow']:
+                wp.CONFIG['CSV_ENGINE'] = engine
+                seconds = min(timed(wp.read_weather_csv, str(path), **dialect,
+                                    on_bad_lines='skip', low_memory=False)[1] for _ in range(repeats))
+                frames[engine] = wp.read_weather_csv(str(path), **dialect, on_bad_lines='skip', low_memory=False)
+                rows.append({'file': kind, 'engine': engine, 'mb': round(size_mb, 1),
+                             'seconds': round(seconds, 3), 'mb_per_s': round(size_mb / seconds, 1)})
+            # pyarrow parses timestamps natively and writes times of day as
+            # HH:MM:SS; the weather variables must match exactly
+            variables = frames['c'].select_dtypes(include='float32').columns
+            assert list(frames['c'].columns) == list(frames['pyarrow'].columns)
+            pd.testing.assert_frame_equal(frames['c'][variables], frames['pyarrow'][variables])
+    finally:
+        wp.CONFIG['CSV_ENGINE'] = saved_engine
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print_table("CSV parse engines (best of 3, schema applied, on_bad_lines='skip')", rows)
+    return rows
+
+def benchmark_datetime_parsing(n_stations=8, rows_per_station=100000, seed=42):
+    """Compare first-value format inference, per-row parsing and per-station formats."""
+    rng = np.random.default_rng(seed)
+    layouts = ['%m/%d/%Y %H:%M:%S', '%Y-%m-%d %H:%M', '%m/%d/%y %I:%M:%S %p', '%d/%m/%Y %H:%M']
+    values, stations = [], []
+    times = pd.date_range('2020-01-01', periods=rows_per_station, freq='5min', tz='UTC')
+    truth = np.tile(times.to_numpy(), n_stations)
+    for i in range(n_stations):
+        text = pd.Series(times.strftime(layouts[i % len(layouts)]))
+        # A logger reconfigured mid-deployment writes a few rows in another layout
+        odd = rng.random(rows_per_station) < 0.001
+        text[odd] = times[odd].strftime('%Y-%m-%dT%H:%M:%S')
+        values.append(text)
+        stations.append(pd.Series(f'Station{i}', index=text.index))
+    values = pd.concat(values, ignore_index=True)
+    stations = pd.concat(stations, ignore_index=True).astype('category')
+
+    runs = {
+        'first-value inference': lambda: pd.to_datetime(values, utc=True, errors='coerce'),
+        'per-row (mixed)': lambda: pd.to_datetime(values, format='mixed', utc=True, errors='coerce'),
+        'per-station format': lambda: wp.parse_station_datetimes(values, stations, 'benchmark'),
+    }
+    rows = []
+    for name, func in runs.items():
+        parsed, seconds = timed(func)
+        rows.append({'method': name, 'rows': len(values), 'seconds': round(seconds, 2),
+                     'rows_per_s': round(len(values) / seconds), 'parsed_pct': round(100 * parsed.notna().mean(), 2),
+                     'correct_pct': round(100 * (parsed.to_numpy() == truth).mean(), 2)})
+
+    print_table("Datetime parsing (4 logger layouts, 0.1% rows in a stray layout)", rows)
+    return rows
+
+def benchmark_ingest_modes(n_stations=50, files_per_station=6):
+    """Compare serial, thread-pool and process-pool ingestion of local station CSVs."""
+    tmp_dir = Path(tempfile.mkdtemp())
+    saved = {key: wp.CONFIG[key] for key in ['LOCAL_DATA_PATH', 'INGEST_MODE', 'INGEST_TRANSPORT',
+                                             'CLEANED_FILE_CACHE']}
+    rows = []
+    results = {}
+
+    try:
+        n_files = write_synthetic_station_csvs(tmp_dir, n_stations, files_per_station)
+        wp.CONFIG['LOCAL_DATA_PATH'] = str(tmp_dir)
+        wp.CONFIG['CLEANED_FILE_CACHE'] = False
+        csv_files = wp.get_csv_files_from_local()
+        data_mb = path_size_mb(tmp_dir)
+
+        runs = [('serial', 'pickle'), ('thread', 'pickle'), ('process', 'pickle')]
+        if wp.HAS_PYARROW:
+            runs.append(('process', 'arrow'))
+
+        for mode, transport in runs:
+            wp.CONFIG['INGEST_MODE'] = mode
+            wp.CONFIG['INGEST_TRANSPORT'] = transport
+            loaded, seconds = timed(wp.load_and_clean_local_data, csv_files, with_paths=True)
+            results[mode, transport] = dict(loaded)
+            workers = {'serial': 1, 'thread': wp.CONFIG['MAX_WORKERS'], 'process': wp.get_ingest_workers()}[mode]
+            rows.append({'mode': mode, 'transport': transport if mode == 'process' else '-',
+                         'workers': workers, 'files': n_files, 'seconds': round(seconds, 2),
+                         'mb_per_s': round(data_mb / seconds, 1)})
+    finally:
+        wp.CONFIG.update(saved)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    for run in runs[1:]:
+        for path, df in results[runs[0]].items():
+            pd.testing.assert_frame_equal(df, results[run][path])
+    print_table(f"Local CSV ingestion ({data_mb:.0f} MB, identical output in every mode)", rows)
+    return rows
+
+def run_pipeline_subprocess(data_dir, out_dir, **config):
+    """
+    Run main() in a fresh interpreter and return (seconds, peak RSS in MB).
+
+    Peak RSS is process-wide and never decreases, so each run needs its own process.
+    """
+    script = (
+        "import sys, resource, logging; sys.path.insert(0, {root!r}); import cleanning as wp; "
+        "wp.logger.setLevel(logging.WARNING); wp.CONFIG.update({config!r}); wp.main(); "
+        "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+    ).format(root=str(Path(wp.__file__).resolve().parent),
+             config={'LOCAL_DATA_PATH': str(data_dir), 'ECCC_STATIONS': [],
+                     'CLEANED_FILE_CACHE': False, **config})
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-c', script], cwd=out_dir, capture_output=True,
+                               text=True, check=True)
+    seconds = time.perf_counter() - start
+    # ru_maxrss is in KB on Linux, bytes on macOS
+    peak_kb = int(completed.stdout.strip().splitlines()[-1])
+    return seconds, peak_kb / (1024 if sys.platform != 'darwin' else 1024 ** 2)
+
+def benchmark_streaming(n_stations=40, files_per_station=6):
+    """Compare peak memory of the full in-memory pipeline and streaming mode (Unix only)."""
+    tmp_dir = Path(tempfile.mkdtemp())
+    rows = []
+
+    try:
+        data_dir = tmp_dir / 'data'
+        write_synthetic_station_csvs(data_dir, n_stations, files_per_station, rows_per_file=4000)
+        for mode, streaming in [('full', False), ('streaming', True)]:
+            out_dir = tmp_dir / mode
+            out_dir.mkdir()
+            seconds, peak_mb = run_pipeline_subprocess(data_dir, out_dir, STREAMING_MODE=streaming)
+            rows.append({'mode': mode, 'stations': n_stations, 'seconds': round(seconds, 1),
+                         'peak_rss_mb': round(peak_mb), 'output_mb': round(path_size_mb(out_dir), 1)})
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print_table("Full vs streaming pipeline (peak RSS of a fresh process)", rows)
+    return rows
+
+def benchmark_incremental(n_stations=6, files_per_station=4, rows_per_file=2000, overlap_hours=1):
+    """
+    Check that an incremental run after editing one source matches a full rebuild.
+
+    The edited station logs local time under a HOBO 'Time, GMT-04:00' header and
+    the edited file is written out of time order, so a window taken in the wrong
+    hours or from the first/last rows shows up as a difference. The overlap
+    margin is cut to 1 hour so its padding can't hide a shifted window.
+    """
+    tmp_dir = Path(tempfile.mkdtemp())
+    config = {'INCREMENTAL_MODE': True, 'INCREMENTAL_OVERLAP_HOURS': overlap_hours}
+    rows = []
+
+    try:
+        data_dir = tmp_dir / 'data'
+        write_synthetic_station_csvs(data_dir, n_stations, files_per_station, rows_per_file)
+        station_files = sorted((data_dir / 'Station000').glob('*.csv'))
+        for path in station_files:
+            pd.read_csv(path).rename(columns={'Time': 'Time, GMT-04:00'}).to_csv(path, index=False)
+
+        incremental_dir, rebuild_dir = tmp_dir / 'incremental', tmp_dir / 'rebuild'
+        incremental_dir.mkdir()
+        rebuild_dir.mkdir()
+        seconds, _ = run_pipeline_subprocess(data_dir, incremental_dir, **config)
+        rows.append({'run': 'full (first run)', 'seconds': round(seconds, 1)})
+
+        # Blank a 50-hour RH stretch, change some temperatures and shuffle the rows
+        edited = pd.read_csv(station_files[1])
+        rh_col = next(c for c in edited.columns if c.startswith('RH'))
+        temp_col = next(c for c in edited.columns if c.startswith('Temperature'))
+        edited.loc[300:600, rh_col] = np.nan
+        edited.loc[900:960, temp_col] = 1.5
+        edited.sample(frac=1, random_state=0).to_csv(station_files[1], index=False)
+
+        seconds, _ = run_pipeline_subprocess(data_dir, incremental_dir, **config)
+        rows.append({'run': 'incremental (1 file changed)', 'seconds': round(seconds, 1)})
+        seconds, _ = run_pipeline_subprocess(data_dir, rebuild_dir, **config)
+        rows.append({'run': 'full rebuild', 'seconds': round(seconds, 1)})
+
+        for key in ['OUTPUT_ALL_DATA', 'OUTPUT_HOURLY', 'OUTPUT_DAILY', 'OUTPUT_DATA_QUALITY']:
+            name = wp.get_output_path(key).name
+            assert (incremental_dir / name).read_bytes() == (rebuild_dir / name).read_bytes(), \
+                f"incremental {name} differs from a full rebuild"
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print_table(f"Incremental update vs full rebuild ({n_stations} stations, identical outputs)", rows)
+    return rows
+
+# ============================================================================
+# CHECKS
+# ============================================================================
+# Small hand-built frames with known answers, for behaviour the synthetic
+# benchmarks can only compare against a reference implementation.
+
+def hand_built_frame(columns, stations, times):
+    """
+    Build a pipeline-shaped frame from per-row lists.
+
+    Args:
+        columns: Dict of variable -> list of values (float32, None = missing)
+        stations: Station name of every row
+        times: Timestamp strings of every row (None = NaT), read as UTC
+    """
+    df = pd.DataFrame({'Datetime_UTC': pd.to_datetime(list(times), utc=True),
+                       'station': pd.Categorical(stations)})
+    for col, values in columns.items():
+        df[col] = np.array([np.nan if v is None else v for v in values], dtype='float32')
+    return df
+
+def check_qc_flags():
+    """QC_Flags bits for a known spike, step, out-of-range values, a dew point above temperature and flat lines."""
+    # 4 bits per variable in QC_VARIABLES order, one per test in QC_TESTS order
+    assert wp.qc_bit('Temperature', 'range') == 1 << 0
+    assert wp.qc_bit('Temperature', 'flatline') == 1 << 2
+    assert wp.qc_bit('Rh', 'range') == 1 << 4
+    assert wp.qc_bit('Dew', 'consistency') == 1 << 11
+    assert wp.qc_bit(wp.QC_VARIABLES[-1], wp.QC_TESTS[-1]) < 2 ** 32
+
+    # A: spike at 2, dew above temperature at 4, out of range at 5 (Temperature)
+    # and 7 (Rh, clipped), step at 8. B: 37 equal readings over 6 h (stuck).
+    # C: 36 equal readings over 5 h 50 min, then a jump 2 h later (not a step).
+    ten_min = pd.date_range('2024-01-01', periods=40, freq='10min').strftime('%Y-%m-%d %H:%M')
+    temp_a = [5.0, 5.1, 25.0, 5.2, 3.0, 60.0, 5.4, 5.5, 20.0, 20.1, 20.2, 20.3]
+    temp_b = [7.0] * 37 + [8.0, 8.1, 8.2]
+    temp_c = [9.0] * 36 + [30.0]
+    df = hand_built_frame(
+        {'Temperature': temp_a + temp_b + temp_c,
+         'Dew': [4.0] * 12 + [None] * 77,
+         'Rh': [80.0] * 7 + [105.0] + [80.0] * 81},
+        ['A'] * 12 + ['B'] * 40 + ['C'] * 37,
+        list(ten_min[:12]) + list(ten_min) + list(ten_min[:36]) + ['2024-01-01 07:50'])
+    result = wp.apply_quality_control(df)
+
+    expected = np.zeros(len(df), dtype=np.uint32)
+    expected[[2, 8]] = wp.qc_bit('Temperature', 'step')
+    expected[4] = wp.qc_bit('Dew', 'consistency')
+    expected[5] = wp.qc_bit('Temperature', 'range')
+    expected[7] = wp.qc_bit('Rh', 'range')
+    expected[12:49] = wp.qc_bit('Temperature', 'flatline')
+    np.testing.assert_array_equal(result[wp.QC_FLAG_COLUMN].to_numpy(), expected)
+    assert set(wp.decode_qc_flags(result[wp.QC_FLAG_COLUMN]).columns) == {
+        'Temperature step', 'Temperature range', 'Temperature flatline', 'Rh range', 'Dew consistency'}
+
+    # Failed readings become NaN, Rh is clipped instead
+    temp = result['Temperature'].to_numpy()
+    assert np.isnan(temp[[2, 5, 8]]).all() and np.isnan(temp[12:49]).all()
+    assert np.isnan(temp[~expected.astype(bool)]).sum() == 0
+    assert np.isnan(result['Dew'].iloc[4]) and result['Rh'].iloc[7] == 100
+    assert result['Temperature'].dtype == np.float32
+
+def check_dedup_policies():
+    """Rows each DUPLICATE_POLICY keeps on a frame with conflicting, identical and NaT rows."""
+    # 0/1: same key, values disagree (1 has more values); 2/3: identical
+    # without a timestamp; 4: different row without one; 5: another station
+    # at the same time; 6/7: identical keyed rows
+    t0, t1 = '2024-01-01 00:00', '2024-01-01 01:00'
+    df = hand_built_frame(
+        {'Temperature': [1.0, 3.0, 5.0, 5.0, 6.0, 1.0, 7.0, 7.0],
+         'Rh': [None, 50.0, 60.0, 60.0, 60.0, None, 70.0, 70.0],
+         'Wind Direction': [350.0, 10.0, 90.0, 90.0, 90.0, 350.0, 180.0, 180.0]},
+        ['A', 'A', 'A', 'A', 'A', 'B', 'A', 'A'],
+        [t0, t0, None, None, None, t0, t1, t1])
+
+    kept = {'exact': [0, 1, 2, 4, 5, 6], 'first': [0, 2, 4, 5, 6],
+            'most_complete': [1, 2, 4, 5, 6], 'mean': [0, 2, 4, 5, 6]}
+    for policy in wp.DUPLICATE_POLICIES:
+        result, removed = wp.deduplicate_rows(df, policy)
+        expected = df.iloc[kept[policy]].reset_index(drop=True)
+        if policy == 'mean':
+            # Means skip NaN; 350 and 10 degrees average to north, not 180
+            expected.loc[0, ['Temperature', 'Rh']] = [2.0, 50.0]
+            north = result.loc[0, 'Wind Direction'] % 360
+            assert min(north, 360 - north) < 1e-3, f"circular mean gave {north}"
+            expected.loc[0, 'Wind Direction'] = result.loc[0, 'Wind Direction']
+        pd.testing.assert_frame_equal(result, expected, obj=f"policy {policy!r}")
+        assert removed.to_dict() == {'A': len(df) - len(kept[policy])}, f"{policy}: {removed.to_dict()}"
+
+def check_gap_index():
+    """Gap runs at station block edges and time-weighted interpolation of the short ones."""
+    # A: leading, uneven interior (50 min) and trailing gap; B: leading gap
+    # right after A's trailing one, trailing 2-row gap; C: no valid reading
+    minutes = [0, 10, 20, 30, 60, 70] + [0, 10, 20, 30, 40, 50] + [0, 10, 20]
+    values = [None, 1.0, None, None, 6.0, None] + [None, 10.0, 11.0, 12.0, None, None] + [None] * 3
+    stations = ['A'] * 6 + ['B'] * 6 + ['C'] * 3
+    times = [f'2024-01-01 {m // 60:02d}:{m % 60:02d}' for m in minutes]
+    df = hand_built_frame({'Temperature': values}, stations, times)
+    layout = wp.StationLayout(df)
+    time_values = df['Datetime_UTC'].to_numpy(dtype='datetime64[ns]').view('i8').astype(np.float64)
+    column = df['Temperature'].to_numpy(dtype=np.float64)
+
+    gaps = wp.find_gaps(np.isnan(column), time_values, layout.starts, layout.stops)
+    np.testing.assert_array_equal(gaps['block'], [0, 0, 0, 1, 1, 2])
+    np.testing.assert_array_equal(gaps['first'], [0, 2, 5, 6, 10, 12])
+    np.testing.assert_array_equal(gaps['stop'], [1, 4, 6, 7, 12, 15])
+    np.testing.assert_array_equal(gaps['before'], [False, True, True, False, True, False])
+    np.testing.assert_array_equal(gaps['after'], [True, True, False, True, False, False])
+    np.testing.assert_allclose(gaps['hours'], np.array([10, 50, 10, 10, 20, 20]) / 60)
+
+    # Values filled earlier still count as gaps with originally_missing=True
+    df['Temperature_imputed'] = np.int8(0)
+    df.loc[1, 'Temperature_imputed'] = 1
+    index = wp.build_gap_index(df, ['Temperature'], layout, originally_missing=True)
+    assert index['station'].tolist() == ['A', 'A', 'B', 'B', 'C']
+    assert index['rows'].tolist() == [4, 1, 1, 2, 3]
+    # start/end are the first and last missing times, as naive UTC
+    assert index['start'].iloc[0] == pd.Timestamp('2024-01-01 00:00')
+    assert index['end'].iloc[3] == pd.Timestamp('2024-01-01 00:50')
+    np.testing.assert_allclose(index['hours'], np.array([60, 10, 10, 20, 20]) / 60)
+
+    blocks = layout.row_blocks()
+    allowed = np.ones(len(df), dtype=bool)
+    nan = np.nan
+    # Interior rows by time (20 and 30 min between 1.0 at 10 and 6.0 at 60),
+    # edges from the nearest value, the station without values untouched
+    filled, fill = wp.interpolate_time_segments(column, time_values, blocks, gaps, allowed, 1)
+    np.testing.assert_allclose(filled, [1, 1, 2, 3, 6, 6, 10, 10, 11, 12, 12, 12, nan, nan, nan])
+    np.testing.assert_array_equal(fill, np.isnan(column) & (blocks != 2))
+    # The 50-minute gap is over a 0.5 h limit; rows outside fill_allowed stay missing
+    filled, _ = wp.interpolate_time_segments(column, time_values, blocks, gaps, allowed, 0.5)
+    np.testing.assert_allclose(filled[:6], [1, 1, nan, nan, 6, 6])
+    allowed[3] = False
+    filled, fill = wp.interpolate_time_segments(column, time_values, blocks, gaps, allowed, 1)
+    np.testing.assert_allclose(filled[:6], [1, 1, 2, nan, 6, 6])
+    assert not fill[3]
+    assert np.isnan(column[[0, 2, 3, 5]]).all(), "input values were modified"
+
+def check_splice_rows():
+    """Rows splice_rows replaces and keeps, for hourly (UTC) and daily (naive, floored) windows."""
+    hours = [f'2024-01-01 {h:02d}:00' for h in range(6)]
+    # Existing output as reloaded from CSV: float64 values, int64 flags
+    existing = hand_built_frame({'Temperature': list(range(12))}, ['A'] * 6 + ['B'] * 6, hours * 2)
+    existing['Temperature'] = existing['Temperature'].astype('float64')
+    existing['Temperature_imputed'] = 0
+    # Recomputed rows, out of order and without flags; B and A at 04:00 fall outside the windows
+    new_rows = hand_built_frame({'Temperature': [103.0, 102.0, 104.0, 201.0, 200.0, 202.0, 150.0]},
+                                ['A', 'A', 'A', 'C', 'C', 'C', 'B'],
+                                [hours[3], hours[2], hours[4], hours[1], hours[0], hours[2], hours[0]])
+    windows = {'A': (pd.Timestamp(hours[2], tz='UTC'), pd.Timestamp(hours[3], tz='UTC')),
+               'C': (pd.Timestamp(hours[0], tz='UTC'), pd.Timestamp(hours[1], tz='UTC'))}
+
+    expected = hand_built_frame(
+        {'Temperature': [0, 1, 102, 103, 4, 5] + list(range(6, 12)) + [200, 201]},
+        ['A'] * 6 + ['B'] * 6 + ['C'] * 2, hours * 2 + hours[:2])
+    expected['Temperature_imputed'] = 0
+    pd.testing.assert_frame_equal(wp.splice_rows(existing, new_rows, windows), expected)
+
+    # Daily outputs are tz-naive dates; windows are floored to whole days
+    days = [f'2024-01-0{d}' for d in range(1, 6)]
+    existing = hand_built_frame({'Temperature': [1.0, 2.0, 3.0, 4.0, 5.0]}, ['A'] * 5, days)
+    existing['Datetime_UTC'] = existing['Datetime_UTC'].dt.tz_localize(None)
+    new_rows = existing.iloc[1:4].assign(Temperature=np.float32([20.0, 30.0, 40.0]))
+    windows = {'A': (pd.Timestamp('2024-01-02 13:00', tz='UTC'), pd.Timestamp('2024-01-03 02:00', tz='UTC'))}
+    spliced = wp.splice_rows(existing, new_rows, windows, time_floor=lambda t: t.floor('D'))
+    assert spliced['Temperature'].tolist() == [1.0, 20.0, 30.0, 4.0, 5.0]
+
+CHECKS = {
+    'qc_flags': check_qc_flags,
+    'dedup_policies': check_dedup_policies,
+    'gap_index': check_gap_index,
+    'splice_rows': check_splice_rows,
+}
+
+def run_checks():
+    """Run every check in CHECKS (python benchmarks.py checks)."""
+    rows = []
+    for name, check in CHECKS.items():
+        _, seconds = timed(check)
+        rows.append({'check': name, 'seconds': round(seconds, 3)})
+    print_table("Deterministic checks (all passed)", rows)
+    return rows
+
+BENCHMARKS = {
+    'output': benchmark_output_backends,
+    'imputation': benchmark_imputation,
+    'circular': benchmark_circular_mean,
+    'daily': benchmark_daily_aggregation,
+    'quality': benchmark_quality_report,
+    'gaps': benchmark_gap_histogram,
+    'snapshots': benchmark_quality_snapshots,
+    'dedup': benchmark_deduplication,
+    'qc': benchmark_quality_control,
+    'layout': benchmark_station_layout,
+    'resample': benchmark_resampling,
+    'schema': benchmark_read_schema,
+    'sentinels': benchmark_na_sentinels,
+    'harmonize': benchmark_schema_harmonization,
+    'assemble': benchmark_assembly,
+    'dialect': benchmark_dialect_sniffing,
+    'engines': benchmark_csv_engines,
+    'datetime': benchmark_datetime_parsing,
+    'ingest': benchmark_ingest_modes,
+    'streaming': benchmark_streaming,
+    'incremental': benchmark_incremental,
+    'checks': run_checks,
+}
+
+if __name__ == '__main__':
+    wp.logger.setLevel(logging.WARNING)
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
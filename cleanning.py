@@ -4,33 +4,98 @@ Fetches, cleans, aggregates, and imputes weather data from multiple sources.
 """
 import pandas as pd
 import gc
+import os
 import re
+import json
+import hashlib
+import functools
+import inspect
+import csv
+import io
+import http.client
+import threading
+import urllib.error
+import urllib.parse
 import urllib.request
 import time
 import numpy as np
 import logging
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import pickle
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import shutil
+import sqlite3
+import tempfile
+import zlib
+from contextlib import closing
 from pathlib import Path
 
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    guess_datetime_format = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as pa_dataset
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
 CONFIG = {
-    'ECCC_STATION_ID': 6545,
+    # ECCC station registry. start_year defaults to ECCC_START_YEAR;
+    # timeframe is 1 (hourly, default), 2 (daily) or 3 (monthly). Add nearby
+    # stations for gap-filling, e.g. {'id': 50621, 'name': 'Charlottetown A'}
+    'ECCC_STATIONS': [
+        {'id': 6545, 'name': 'Stanhope', 'timeframe': 1},
+    ],
     'ECCC_START_YEAR': 2022,
-    'API_DELAY': 0.5,
+    # ECCC downloader settings
+    'ECCC_BASE_URL': 'https://climate.weather.gc.ca/climate_data/bulk_data_e.html',
+    'ECCC_MAX_CONCURRENCY': 4,  # Parallel month downloads
+    'ECCC_REQUESTS_PER_SECOND': 2.0,  # Token bucket rate (network requests only)
+    'ECCC_MAX_RETRIES': 3,
+    'ECCC_RETRY_BACKOFF': 1.0,  # Seconds, doubled on each retry
+    'ECCC_TIMEOUT': 60,
     'LOCAL_DATA_PATH': r'C:\WeatherData\Data',  # Local folder path
     'OUTPUT_ALL_DATA': 'all_weather_data.csv',
     'OUTPUT_HOURLY': 'hourly_weather_data.csv',
     'OUTPUT_DAILY': 'daily_weather_data.csv',
     'OUTPUT_DATA_QUALITY': 'data_quality_report.csv',
     'CACHE_DIR': 'cache',
+    'ECCC_CACHE_DB': 'eccc_cache.sqlite',  # Stored in CACHE_DIR
+    'ECCC_CACHE_TTL_HOURS': 24,  # Refetch current/previous month after this
+    'ECCC_CACHE_MAX_MB': None,  # Evict least recently used downloads above this
+    'CLEANED_FILE_CACHE': True,  # Reuse cleaned local files whose content is unchanged
+    'CLEANED_CACHE_VERSION': 4,  # Bump to invalidate cleaned-file cache entries
     'MAX_WORKERS': 4,
+    'SNIFF_BYTES': 64 * 1024,  # Bytes read to detect a CSV's encoding, delimiter and header row
+    # CSV parser: 'c' (pandas) or 'pyarrow' (multithreaded; falls back to 'c' for files it rejects)
+    'CSV_ENGINE': 'c',
+    # Missing-value markers turned into NaN while CSVs are parsed, looked up
+    # by station name, then source ('local' or 'eccc'), then 'default'.
+    # Blank cells are always missing.
+    'NA_SENTINELS': {'default': ['ERROR', '-9999', '-888.88']},
+    # Count text markers per station for the log. Costs a second scan of each
+    # raw file; numeric markers and other text are always counted
+    'COUNT_TEXT_SENTINELS': False,
+    # Local CSV ingestion: 'thread', 'process' (bypasses the GIL) or 'serial'
+    'INGEST_MODE': 'thread',
+    'INGEST_PROCESSES': None,  # Worker processes; None = one per CPU
+    'INGEST_TRANSPORT': 'pickle',  # Worker results: 'pickle' or 'arrow' (Arrow IPC)
+    # Output backend: 'csv' or 'parquet' (parquet requires pyarrow)
+    'OUTPUT_FORMAT': 'csv',
+    'PARQUET_COMPRESSION': 'zstd',
+    # Loggers that record local time instead of UTC: station -> UTC offset in
+    # hours (e.g. -4 for Atlantic Standard Time all year) or a time zone name
+    # ('America/Halifax' follows daylight saving time)
+    'LOCAL_TIME_ZONES': {},
     # Imputation settings
-    'INTERPOLATE_LIMIT_HOURS': 2,  # Max gap for interpolation
+    'INTERPOLATE_LIMIT_HOURS': 2,  # Longest gap to interpolate (hours between the readings either side)
     'IMPUTATION_THRESHOLD_PCT': 25.0,  # Don't impute if >25% missing
     'TEMP_MIN': -40,  # PEI reasonable bounds (°C)
     'TEMP_MAX': 40,
@@ -38,6 +103,36 @@ CONFIG = {
     'RH_MAX': 100,
     'DEW_MIN': -60,  # Dew point reasonable bounds (°C)
     'DEW_MAX': 50,
+    # Aggregation settings
+    'WIND_DIRECTION_STEADINESS': False,  # Add resultant vector length (0-1) columns
+    # Extra resampled products written alongside the hourly/daily outputs.
+    # Coarser products are rolled up from finer ones. Example:
+    # {'name': '10min', 'freq': '10min', 'output': 'weather_data_10min.csv'},
+    # {'name': '3hour', 'freq': '3h', 'output': 'weather_data_3hour.csv'},
+    # {'name': 'monthly', 'freq': 'MS', 'output': 'weather_data_monthly.csv',
+    #  'stats': ['min', 'max', 'mean']},
+    # {'name': 'noon_local', 'freq': 'D', 'output': 'weather_data_noon.csv',
+    #  'at_local_time': '12:00', 'utc_offset_hours': -4},
+    'RESAMPLE_PRODUCTS': [],
+    # Incremental run settings
+    'INCREMENTAL_MODE': False,  # Only reprocess new/changed source files
+    'MANIFEST_FILE': 'source_manifest.json',  # Stored in CACHE_DIR
+    'INCREMENTAL_OVERLAP_HOURS': 6,  # Context margin around changed windows
+    # Columns the mapping registry (COLUMN_RULES) does not know: 'drop' keeps
+    # every source on the canonical schema, 'keep' adds them as extra columns
+    'UNMAPPED_COLUMNS': 'drop',
+    # Duplicate rows from overlapping logger exports: 'exact' drops repeated
+    # identical rows; 'first', 'most_complete' or 'mean' keep one row per
+    # (station, Datetime_UTC), resolving conflicting values by that policy
+    'DUPLICATE_POLICY': 'exact',
+    # Streaming run settings
+    'STREAMING_MODE': False,  # Process one station at a time (bounded memory)
+    # Stage quality snapshots: 0 = off, 1 = cheap metrics, 2 = adds deep
+    # memory usage and full-row duplicate checks (each a pass over every row)
+    'QUALITY_SNAPSHOT_LEVEL': 1,
+    'QUALITY_SNAPSHOT_FILE': 'quality_snapshots.jsonl',  # JSON lines appended per stage; None = log only
+    # Gap-length histogram bin edges (hours) in the data quality report
+    'GAP_HISTOGRAM_HOURS': [1, 3, 6, 24],
 }
 
 # ============================================================================
@@ -66,31 +161,289 @@ def ensure_cache_dir():
     """Create cache directory if it doesn't exist."""
     Path(CONFIG['CACHE_DIR']).mkdir(exist_ok=True)
 
-def get_cache_path(cache_key):
-    """Get path to cache file."""
-    return Path(CONFIG['CACHE_DIR']) / f"{cache_key}.pkl"
+# Serializes writes to the cache database across download threads
+_cache_lock = threading.Lock()
+
+# Running totals for the current process, reported by log_cache_stats()
+CACHE_STATS = {'hits': 0, 'misses': 0, 'stale': 0, 'bytes_read': 0, 'bytes_written': 0, 'evicted': 0}
+
+def get_cache_db_path():
+    """Get path to the ECCC cache database."""
+    return Path(CONFIG['CACHE_DIR']) / CONFIG['ECCC_CACHE_DB']
+
+def open_cache_db():
+    """
+    Open the cache database, creating the schema on first use.
+
+    Each row holds one downloaded response as zlib-compressed CSV text, so
+    entries stay readable across pandas/Python versions.
+    """
+    ensure_cache_dir()
+    connection = sqlite3.connect(get_cache_db_path(), timeout=30)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS eccc_cache (
+            cache_key TEXT PRIMARY KEY,
+            station_id INTEGER NOT NULL,
+            timeframe INTEGER NOT NULL,
+            year INTEGER NOT NULL,
+            month INTEGER NOT NULL,
+            fetched_at REAL NOT NULL,
+            last_access REAL NOT NULL,
+            raw_bytes INTEGER NOT NULL,
+            stored_bytes INTEGER NOT NULL,
+            body BLOB NOT NULL
+        )""")
+    connection.execute("CREATE INDEX IF NOT EXISTS eccc_cache_station "
+                       "ON eccc_cache (station_id, timeframe, year, month)")
+    return connection
+
+def is_period_settled(timeframe, year, month, at_time):
+    """
+    Check whether a downloaded period could no longer change at a given time.
+
+    Hourly months are settled once they are older than the previous month
+    (ECCC keeps revising the current and previous month). Daily files cover
+    a whole year and monthly files the whole record, so they settle later
+    or never.
+    """
+    at_year, at_month = at_time.year, at_time.month
+    previous_year, previous_month = (at_year, at_month - 1) if at_month > 1 else (at_year - 1, 12)
+    if timeframe == 3:
+        return False
+    if timeframe == 2:
+        return year < previous_year
+    return (year, month) < (previous_year, previous_month)
+
+def is_cache_entry_fresh(timeframe, year, month, fetched_at):
+    """
+    Decide whether a cached download can be used without refetching.
+
+    Entries fetched after their period settled are immutable. Anything
+    fetched while the period was still open is reused for
+    CONFIG['ECCC_CACHE_TTL_HOURS'] and then refetched.
+    """
+    if is_period_settled(timeframe, year, month, datetime.fromtimestamp(fetched_at)):
+        return True
+    return time.time() - fetched_at < CONFIG['ECCC_CACHE_TTL_HOURS'] * 3600
 
 def load_from_cache(cache_key):
-    """Load data from cache if available."""
-    cache_path = get_cache_path(cache_key)
-    if cache_path.exists():
-        try:
-            logger.info(f"Loading from cache: {cache_key}")
-            return pd.read_pickle(cache_path)
-        except Exception as e:
-            logger.warning(f"Failed to load cache {cache_key}: {e}")
-    return None
+    """
+    Load a cached download if present and fresh.
 
-def save_to_cache(df, cache_key):
-    """Save dataframe to cache."""
+    Returns:
+        Raw response bytes, or None on a miss or stale entry
+    """
     try:
-        ensure_cache_dir()
-        cache_path = get_cache_path(cache_key)
-        df.to_pickle(cache_path)
+        with _cache_lock, closing(open_cache_db()) as connection:
+            row = connection.execute(
+                "SELECT timeframe, year, month, fetched_at, stored_bytes, body "
+                "FROM eccc_cache WHERE cache_key = ?", (cache_key,)).fetchone()
+            if row is None:
+                CACHE_STATS['misses'] += 1
+                return None
+            timeframe, year, month, fetched_at, stored_bytes, body = row
+            if not is_cache_entry_fresh(timeframe, year, month, fetched_at):
+                CACHE_STATS['stale'] += 1
+                logger.info(f"Cache entry expired, refetching: {cache_key}")
+                return None
+            connection.execute("UPDATE eccc_cache SET last_access = ? WHERE cache_key = ?",
+                               (time.time(), cache_key))
+            connection.commit()
+        CACHE_STATS['hits'] += 1
+        CACHE_STATS['bytes_read'] += stored_bytes
+        logger.info(f"Loading from cache: {cache_key}")
+        return zlib.decompress(body)
+    except Exception as e:
+        logger.warning(f"Failed to load cache {cache_key}: {e}")
+        return None
+
+def save_to_cache(body, cache_key, station_id, timeframe, year, month):
+    """Store a downloaded response in the cache."""
+    try:
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+        with _cache_lock, closing(open_cache_db()) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO eccc_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, station_id, timeframe, year, month, now, now,
+                 len(body), len(compressed), compressed))
+            connection.commit()
+        CACHE_STATS['bytes_written'] += len(compressed)
         logger.debug(f"Saved to cache: {cache_key}")
     except Exception as e:
         logger.warning(f"Failed to save cache {cache_key}: {e}")
 
+def get_cache_index():
+    """
+    List what the cache holds.
+
+    Returns:
+        DataFrame with one row per cached download (no payloads)
+    """
+    with _cache_lock, closing(open_cache_db()) as connection:
+        index = pd.read_sql_query(
+            "SELECT cache_key, station_id, timeframe, year, month, fetched_at, last_access, "
+            "raw_bytes, stored_bytes FROM eccc_cache ORDER BY station_id, timeframe, year, month",
+            connection)
+    for col in ['fetched_at', 'last_access']:
+        index[col] = pd.to_datetime(index[col], unit='s')
+    return index
+
+def enforce_cache_size_limit(max_mb=None):
+    """
+    Evict least recently used entries until the cache fits in max_mb.
+
+    Args:
+        max_mb: Size limit (defaults to CONFIG['ECCC_CACHE_MAX_MB']; None = unlimited)
+
+    Returns:
+        Number of entries evicted
+    """
+    max_mb = CONFIG['ECCC_CACHE_MAX_MB'] if max_mb is None else max_mb
+    if max_mb is None:
+        return 0
+
+    limit = max_mb * 1024 * 1024
+    with _cache_lock, closing(open_cache_db()) as connection:
+        rows = connection.execute(
+            "SELECT cache_key, stored_bytes FROM eccc_cache ORDER BY last_access DESC").fetchall()
+        sizes = np.cumsum([stored_bytes for _, stored_bytes in rows])
+        evict = [cache_key for (cache_key, _), total in zip(rows, sizes) if total > limit]
+        if evict:
+            connection.executemany("DELETE FROM eccc_cache WHERE cache_key = ?", [(k,) for k in evict])
+            connection.commit()
+            connection.execute("VACUUM")
+
+    if evict:
+        CACHE_STATS['evicted'] += len(evict)
+        logger.info(f"Evicted {len(evict)} cache entries to stay under {max_mb} MB")
+    return len(evict)
+
+def log_cache_stats():
+    """Log cache hit/miss counts and bytes for this run."""
+    lookups = CACHE_STATS['hits'] + CACHE_STATS['misses'] + CACHE_STATS['stale']
+    hit_rate = 100 * CACHE_STATS['hits'] / lookups if lookups else 0.0
+    logger.info(f"ECCC cache: {CACHE_STATS['hits']} hits, {CACHE_STATS['misses']} misses, "
+                f"{CACHE_STATS['stale']} expired ({hit_rate:.1f}% hit rate), "
+                f"{CACHE_STATS['bytes_read'] / 1024:.1f} KB read, "
+                f"{CACHE_STATS['bytes_written'] / 1024:.1f} KB written, "
+                f"{CACHE_STATS['evicted']} evicted")
+
+# Cleaned local files are cached by content hash, so unchanged CSVs skip
+# read_csv/clean_columns entirely. Entries are pickles, which is safe here
+# because the pandas version is part of the pipeline version in every key.
+
+CLEANED_CACHE_STATS = {'hits': 0, 'misses': 0, 'load_seconds': 0.0, 'saved_seconds': 0.0}
+
+@functools.lru_cache(maxsize=None)
+def get_pipeline_version():
+    """
+    Version tag for cleaned-file cache entries.
+
+    Changes whenever the parsing/cleaning code, the dtype schema, the CSV
+    engine, the pandas version or CONFIG['CLEANED_CACHE_VERSION'] changes,
+    which invalidates old entries.
+    """
+    sha = hashlib.sha256()
+    for func in (sniff_csv_dialect, read_weather_csv, read_csv_with_pyarrow, read_schema_for_header,
+                 get_na_sentinels, scrub_numeric_sentinels, load_single_csv, parse_column_header,
+                 map_column, clean_columns):
+        sha.update(inspect.getsource(func).encode('utf-8'))
+    sha.update(repr((COLUMN_RULES, UNIT_CONVERSIONS, CONFIG['UNMAPPED_COLUMNS'],
+                     CONFIG['NA_SENTINELS'], VARIABLE_DTYPES,
+                     resolve_csv_engine(CONFIG['CSV_ENGINE']))).encode('utf-8'))
+    sha.update(pd.__version__.encode('utf-8'))
+    sha.update(str(CONFIG['CLEANED_CACHE_VERSION']).encode('utf-8'))
+    return sha.hexdigest()[:12]
+
+def get_cleaned_cache_dir():
+    """Get the folder holding cleaned-file cache entries."""
+    return Path(CONFIG['CACHE_DIR']) / 'cleaned'
+
+def get_cleaned_cache_path(content_hash):
+    """Get the cache file for a cleaned dataframe."""
+    return get_cleaned_cache_dir() / f"{get_pipeline_version()}_{content_hash}.pkl"
+
+def load_cleaned_index():
+    """
+    Load the cleaned-file cache index.
+
+    Returns:
+        Dict with 'files' (relative_path -> size/mtime/sha256 fingerprint, so
+        unchanged files are not re-hashed) and 'entries' (content hash ->
+        seconds the original parse and clean took)
+    """
+    index_path = get_cleaned_cache_dir() / 'index.json'
+    if index_path.exists():
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == get_pipeline_version():
+                return index
+        except Exception as e:
+            logger.warning(f"Failed to load cleaned-file cache index: {e}")
+    return {'version': get_pipeline_version(), 'files': {}, 'entries': {}}
+
+def save_cleaned_index(index):
+    """Save the cleaned-file cache index atomically and drop stale entries."""
+    try:
+        cache_dir = get_cleaned_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        index_path = cache_dir / 'index.json'
+        tmp_path = index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+        tmp_path.replace(index_path)
+
+        # Entries written by an older pipeline version can never be hit again
+        for stale_path in cache_dir.glob('*.pkl'):
+            if not stale_path.name.startswith(f"{get_pipeline_version()}_"):
+                stale_path.unlink()
+    except Exception as e:
+        logger.warning(f"Failed to save cleaned-file cache index: {e}")
+
+def load_cleaned_frame(content_hash, index):
+    """Load a cleaned dataframe from the cache (None on a miss)."""
+    cache_path = get_cleaned_cache_path(content_hash)
+    if not cache_path.exists():
+        CLEANED_CACHE_STATS['misses'] += 1
+        return None
+    try:
+        started = time.perf_counter()
+        df = pd.read_pickle(cache_path)
+        elapsed = time.perf_counter() - started
+    except Exception as e:
+        logger.warning(f"Failed to load cleaned cache entry {cache_path.name}: {e}")
+        CLEANED_CACHE_STATS['misses'] += 1
+        return None
+
+    CLEANED_CACHE_STATS['hits'] += 1
+    CLEANED_CACHE_STATS['load_seconds'] += elapsed
+    CLEANED_CACHE_STATS['saved_seconds'] += max(index['entries'].get(content_hash, 0.0) - elapsed, 0.0)
+    return df
+
+def save_cleaned_frame(content_hash, df, clean_seconds, index):
+    """Store a cleaned dataframe and how long it took to produce."""
+    try:
+        cache_path = get_cleaned_cache_path(content_hash)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        df.to_pickle(tmp_path)
+        tmp_path.replace(cache_path)
+        index['entries'][content_hash] = round(clean_seconds, 4)
+    except Exception as e:
+        logger.warning(f"Failed to save cleaned cache entry: {e}")
+
+def log_cleaned_cache_report():
+    """Log the cleaned-file cache hit rate and time saved this run."""
+    lookups = CLEANED_CACHE_STATS['hits'] + CLEANED_CACHE_STATS['misses']
+    if not lookups:
+        return
+    hit_rate = 100 * CLEANED_CACHE_STATS['hits'] / lookups
+    logger.info(f"Cleaned-file cache: {CLEANED_CACHE_STATS['hits']}/{lookups} hits ({hit_rate:.1f}%), "
+                f"loaded in {CLEANED_CACHE_STATS['load_seconds']:.2f}s, "
+                f"saved ~{CLEANED_CACHE_STATS['saved_seconds']:.2f}s of parsing and cleaning")
+
 # ============================================================================
 # LOCAL DATA FETCHING
 # ============================================================================
@@ -120,27 +473,441 @@ def get_csv_files_from_local():
     logger.info(f"Found {len(csv_files)} CSV files")
     return csv_files
 
-def load_single_csv(file_info):
+# Byte order marks, checked before anything else when sniffing encodings
+CSV_BOMS = [
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+]
+
+# Dialects detected per station folder (files from one logger share a format)
+_dialect_cache = {}
+_dialect_lock = threading.Lock()
+
+# Running totals for the current process, reported by log_dialect_stats()
+DIALECT_STATS = {'sniffed': 0, 'cached': 0, 'direct_latin1': 0, 'retried': 0}
+
+def sniff_csv_dialect(path, sniff_bytes=None):
+    """
+    Detect a CSV file's encoding, delimiter and header row from its first bytes.
+
+    A BOM decides the encoding outright. Otherwise the sample must decode as
+    UTF-8 (ignoring a character cut off by the end of the sample) or latin1
+    is used; pure-ASCII samples give UTF-8. If the first lines already read as
+    the same number of comma-separated fields, the file gets the comma/first-row
+    default without running csv.Sniffer. Otherwise the header row is the first
+    line with at least the usual number of fields, which skips title lines above it.
+
+    Args:
+        path: CSV file path
+        sniff_bytes: Sample size (defaults to CONFIG['SNIFF_BYTES'])
+
+    Returns:
+        Dict with encoding, delimiter and header_row (read_weather_csv arguments)
+    """
+    sniff_bytes = sniff_bytes or CONFIG['SNIFF_BYTES']
+    with open(path, 'rb') as f:
+        sample = f.read(sniff_bytes)
+
+    encoding = next((enc for bom, enc in CSV_BOMS if sample.startswith(bom)), None)
+    if encoding is None:
+        try:
+            sample.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError as e:
+            truncated = len(sample) == sniff_bytes and e.start >= len(sample) - 3
+            encoding = 'utf-8' if truncated and e.reason == 'unexpected end of data' else 'latin1'
+
+    lines = sample.decode(encoding, errors='ignore').lstrip('\ufeff').splitlines()
+    if len(sample) == sniff_bytes:
+        lines = lines[:-1]  # Last line may be cut off
+    lines = lines[:50]
+
+    head = [row for row in csv.reader(lines[:5]) if row]
+    if len(head) > 1 and len(head[0]) > 1 and all(len(row) == len(head[0]) for row in head):
+        return {'encoding': encoding, 'delimiter': ',', 'header_row': 0}
+
+    try:
+        delimiter = csv.Sniffer().sniff('\n'.join(lines), delimiters=',;\t|').delimiter
+    except csv.Error:
+        delimiter = ','
+
+    field_counts = [len(row) if row else 0 for row in csv.reader(lines, delimiter=delimiter)]
+    usual = max(set(field_counts) - {0}, key=field_counts.count, default=0)
+    header_row = next((i for i, count in enumerate(field_counts) if count >= usual), 0) if usual > 1 else 0
+
+    return {'encoding': encoding, 'delimiter': delimiter, 'header_row': header_row}
+
+def get_csv_dialect(path):
+    """
+    Get the dialect for a local CSV, sniffing only the first file per station folder.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        Dict with encoding, delimiter and header_row
+    """
+    folder = str(Path(path).parent)
+    with _dialect_lock:
+        dialect = _dialect_cache.get(folder)
+        if dialect is not None:
+            DIALECT_STATS['cached'] += 1
+
+    if dialect is None:
+        dialect = sniff_csv_dialect(path)
+        with _dialect_lock:
+            dialect = _dialect_cache.setdefault(folder, dialect)
+            DIALECT_STATS['sniffed'] += 1
+
+    if dialect['encoding'] == 'latin1':
+        with _dialect_lock:
+            DIALECT_STATS['direct_latin1'] += 1
+    return dict(dialect)
+
+def note_dialect_retry(path):
+    """Record a UTF-8 parse that had to be repeated as latin1, and remember it for the folder."""
+    folder = str(Path(path).parent)
+    with _dialect_lock:
+        DIALECT_STATS['retried'] += 1
+        if folder in _dialect_cache:
+            _dialect_cache[folder] = dict(_dialect_cache[folder], encoding='latin1')
+
+def log_dialect_stats():
+    """Log how local CSV dialects were found and how many double parses were avoided."""
+    files = DIALECT_STATS['sniffed'] + DIALECT_STATS['cached']
+    if not files:
+        return
+    logger.info(f"CSV dialects: {DIALECT_STATS['sniffed']} sniffed, {DIALECT_STATS['cached']} reused "
+                f"from the station folder; {DIALECT_STATS['direct_latin1']} files read as latin1 "
+                f"on the first try (double parses avoided), {DIALECT_STATS['retried']} re-parsed as latin1")
+
+# Declarative dtype schema for the canonical weather variables, applied while
+# CSVs are parsed so values never pass through object/float64 columns
+VARIABLE_DTYPES = {
+    'Temperature': 'float32',
+    'Rh': 'float32',
+    'Dew': 'float32',
+    'Wind Speed': 'float32',
+    'Wind Gust Speed': 'float32',
+    'Wind Direction': 'float32',
+    'Rain': 'float32',
+}
+STATION_DTYPE = 'category'
+FLAG_DTYPE = 'int8'
+
+# Logger housekeeping columns that are never read into memory
+JUNK_COLUMN_PATTERNS = ['serial', 'battery', 'solar']
+
+def get_na_sentinels(station=None, source='local'):
+    """
+    Missing-value markers for one source (see CONFIG['NA_SENTINELS']).
+
+    Returns:
+        Tuple of (text markers, [(marker, float value)] for numeric markers).
+        Text markers are given to the parser as na_values; numeric ones are
+        matched on the parsed values, so "-9999.0" and "-9999" both count.
+    """
+    sentinels = CONFIG['NA_SENTINELS']
+    markers = next((sentinels[key] for key in (station, source, 'default') if key in sentinels), [])
+
+    text, numeric = [], []
+    for marker in map(str, markers):
+        try:
+            numeric.append((marker, float(marker)))
+        except ValueError:
+            text.append(marker)
+    return text, numeric
+
+def count_text_sentinels(source, markers, encoding, delimiter):
+    """
+    Count whole-field occurrences of text markers in a raw CSV.
+
+    The parser turns markers into NaN like blank cells, so the counts need
+    another read of the raw bytes; only done with CONFIG['COUNT_TEXT_SENTINELS'].
+    Each marker is located with bytes.find, so files without markers cost
+    one fast scan; only the hits are checked for field boundaries.
+
+    Args:
+        source: File path or BytesIO
+        markers: Text markers (see get_na_sentinels)
+        encoding: Text encoding (UTF-16 files are not counted)
+        delimiter: Field delimiter
+
+    Returns:
+        Dict of marker -> count for markers that occur
+    """
+    markers = [marker for marker in markers if marker]
+    if not markers or encoding.lower().startswith('utf-16'):
+        return {}
+    if hasattr(source, 'getvalue'):
+        data = source.getvalue()
+    else:
+        with open(source, 'rb') as f:
+            data = f.read()
+
+    bounds = {delimiter.encode(encoding), b'\n', b'\r', b'"', b''}
+    counts = {}
+    for marker in markers:
+        token = marker.encode(encoding)
+        found = 0
+        start = data.find(token)
+        while start != -1:
+            end = start + len(token)
+            if data[start - 1:start] in bounds and data[end:end + 1] in bounds:
+                found += 1
+            start = data.find(token, end)
+        if found:
+            counts[marker] = found
+    return counts
+
+def scrub_numeric_sentinels(df, markers):
+    """
+    Set numeric marker values (e.g. -9999) to NaN in every numeric column.
+
+    Returns:
+        Dict of marker -> count for markers that occur
+    """
+    counts = {}
+    if not markers:
+        return counts
+    masked = {}
+    for col, series in df.items():
+        values = series.to_numpy()
+        if values.dtype.kind not in 'if':
+            continue
+        hits = None
+        for marker, number in markers:
+            if values.dtype.kind == 'i' and not number.is_integer():
+                continue
+            mask = values == values.dtype.type(number)
+            found = int(np.count_nonzero(mask))
+            if found:
+                counts[marker] = counts.get(marker, 0) + found
+                hits = mask if hits is None else hits | mask
+        if hits is not None:
+            masked[col] = series.mask(hits)
+    for col, values in masked.items():
+        df[col] = values
+    return counts
+
+def log_na_sentinel_report(sources):
+    """
+    Log how many cells each missing-value marker replaced, per station.
+
+    Args:
+        sources: Iterable of (station, dataframe) pairs; counts are read
+            from df.attrs['na_sentinels'] (see read_weather_csv)
+    """
+    totals = {}
+    for station, df in sources:
+        for marker, count in df.attrs.get('na_sentinels', {}).items():
+            station_counts = totals.setdefault(station, {})
+            station_counts[marker] = station_counts.get(marker, 0) + count
+    if not totals:
+        return
+    logger.info("Missing-value markers read as NaN:")
+    for station, counts in sorted(totals.items()):
+        counts = sorted(counts.items(), key=lambda item: -item[1])
+        logger.info(f"  {station}: " + ", ".join(f"'{marker}' x{count:,}" for marker, count in counts))
+
+def read_schema_for_header(header, na_values=()):
+    """
+    Build read_csv arguments that apply the dtype schema to a file's header.
+
+    Args:
+        header: List of raw column names in file order
+        na_values: Text markers parsed as NaN in every read column
+
+    Returns:
+        Dict with usecols, dtype and na_values keyed by column position, so
+        duplicate header names need no special handling
+    """
+    usecols, dtype = [], {}
+    for position, (variable, _, status) in enumerate(column_mapping(tuple(header))):
+        if status == 'junk':
+            continue
+        usecols.append(position)
+        if variable in VARIABLE_DTYPES:
+            dtype[position] = VARIABLE_DTYPES[variable]
+    return {'usecols': usecols, 'dtype': dtype,
+            'na_values': {position: list(na_values) for position in usecols}}
+
+def read_csv_header(source, encoding, delimiter=',', header_row=0):
+    """Parse only the header line of a CSV file or seekable binary buffer."""
+    if hasattr(source, 'seek'):
+        for _ in range(header_row + 1):
+            header_line = source.readline().decode(encoding)
+        source.seek(0)
+    else:
+        with open(source, 'r', encoding=encoding, newline='') as f:
+            for _ in range(header_row + 1):
+                header_line = f.readline()
+    return next(csv.reader([header_line.lstrip('\ufeff')], delimiter=delimiter), [])
+
+def unique_column_names(header):
+    """Name columns the way read_csv does (blank -> 'Unnamed: i', repeats -> 'name.1')."""
+    names, seen = [], {}
+    for position, col in enumerate(header):
+        name = col or f'Unnamed: {position}'
+        base, count = name, seen.get(name, 0)
+        while name in seen:
+            count += 1
+            name = f'{base}.{count}'
+        seen[base] = count
+        seen[name] = 0
+        names.append(name)
+    return names
+
+def reject_short_row(row):
+    """
+    pyarrow invalid-row handler matching read_csv(on_bad_lines='skip').
+
+    Rows with extra fields are skipped; rows with missing fields are
+    rejected so the file goes to the C engine, which pads them with NaN.
+    """
+    return 'skip' if row.actual_columns > row.expected_columns else 'error'
+
+def read_csv_with_pyarrow(source, header, schema, encoding, delimiter, header_row):
+    """
+    Parse a CSV with the multithreaded pyarrow reader.
+
+    Applies the same usecols/dtype/na_values schema as the C engine path.
+    Timestamps are parsed natively; dates and times of day are turned back
+    into ISO text (times as HH:MM:SS), as the datetime step expects strings.
+
+    Raises:
+        pa.ArrowInvalid: If pyarrow cannot parse the file as read_csv would
+    """
+    names = unique_column_names(header)
+    encoding = 'utf8' if encoding in ('utf-8', 'utf-8-sig') else encoding
+    null_values = pa_csv.ConvertOptions().null_values + sorted(set().union(*schema['na_values'].values()))
+
+    table = pa_csv.read_csv(
+        source,
+        read_options=pa_csv.ReadOptions(column_names=names, skip_rows=header_row + 1,
+                                        encoding=encoding, use_threads=True),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter, invalid_row_handler=reject_short_row),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=[names[position] for position in schema['usecols']],
+            column_types={names[position]: pa.type_for_alias(dtype)
+                          for position, dtype in schema['dtype'].items()},
+            null_values=null_values, strings_can_be_null=True))
+
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date(field.type) or pa.types.is_time(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table.to_pandas()
+
+@functools.lru_cache(maxsize=None)
+def resolve_csv_engine(engine):
+    """
+    CSV engine actually used for CONFIG['CSV_ENGINE'].
+
+    'pyarrow' falls back to 'c' when pyarrow is not installed; the fallback
+    is logged once per process and CONFIG is left as configured.
+    """
+    if engine == 'pyarrow' and not HAS_PYARROW:
+        logger.warning("pyarrow is not installed - falling back to the C CSV engine")
+        return 'c'
+    return engine
+
+def read_weather_csv(source, encoding='utf-8', delimiter=',', header_row=0, station=None,
+                     source_kind='local', **kwargs):
+    """
+    Read a station or ECCC CSV with the dtype schema applied at parse time.
+
+    Junk columns are skipped via usecols and canonical variables are parsed
+    directly as float32. The source's missing-value markers (see
+    get_na_sentinels) become NaN: text ones while parsing, numeric ones
+    right after. If a variable column holds other text, it is re-read
+    untyped and coerced (bad cells become NaN). With CONFIG['CSV_ENGINE'] =
+    'pyarrow' the pyarrow reader is tried first; files it rejects are read
+    with the C engine.
+
+    Args:
+        source: File path or seekable binary buffer
+        encoding: Text encoding
+        delimiter: Field delimiter
+        header_row: Line number of the header (lines above it are skipped)
+        station: Station name, for per-station markers
+        source_kind: 'local' or 'eccc', for per-source markers
+        **kwargs: Extra pd.read_csv arguments
+
+    Returns:
+        DataFrame; df.attrs['na_sentinels'] holds marker -> cell count, with
+        other text read as NaN counted under 'other text' (text markers only
+        with CONFIG['COUNT_TEXT_SENTINELS'])
+    """
+    text_markers, numeric_markers = get_na_sentinels(station, source_kind)
+    header = read_csv_header(source, encoding, delimiter, header_row)
+    schema = read_schema_for_header(header, text_markers)
+    df, other_text = None, 0
+
+    engine = resolve_csv_engine(CONFIG['CSV_ENGINE'])
+    if engine == 'pyarrow':
+        try:
+            df = read_csv_with_pyarrow(source, header, schema, encoding, delimiter, header_row)
+        except (pa.ArrowException, ValueError) as e:
+            source_name = source if isinstance(source, (str, Path)) else 'downloaded CSV'
+            reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+            logger.info(f"pyarrow CSV engine rejected {source_name} ({reason}); using the C engine")
+            if hasattr(source, 'seek'):
+                source.seek(0)
+
+    if df is None:
+        kwargs = dict(kwargs, sep=delimiter, skiprows=header_row)
+        try:
+            df = pd.read_csv(source, encoding=encoding, **schema, **kwargs)
+        except UnicodeDecodeError:
+            raise
+        except ValueError:
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            df = pd.read_csv(source, encoding=encoding, usecols=schema['usecols'],
+                             na_values=schema['na_values'], **kwargs)
+            for position, dtype in schema['dtype'].items():
+                col = df.columns[schema['usecols'].index(position)]
+                values = pd.to_numeric(df[col], errors='coerce')
+                other_text += int(values.isna().sum() - df[col].isna().sum())
+                df[col] = values.astype(dtype)
+
+    counts = {}
+    if CONFIG['COUNT_TEXT_SENTINELS']:
+        counts = count_text_sentinels(source, text_markers, encoding, delimiter)
+    counts.update(scrub_numeric_sentinels(df, numeric_markers))
+    if other_text:
+        counts['other text'] = other_text
+    df.attrs['na_sentinels'] = counts
+    return df
+
+def load_single_csv(file_info, dialect=None):
     """
     Load a single CSV file from local disk with error handling.
 
+    The encoding, delimiter and header row come from the station folder's
+    sniffed dialect, so each file is normally parsed once. A UTF-8 file with
+    bad bytes past the sniffed sample is parsed again as latin1.
+
     Args:
         file_info: Tuple of (full_file_path, relative_path)
+        dialect: Dialect from get_csv_dialect (looked up if not given)
 
     Returns:
         Tuple of (dataframe, station_name, error_message)
     """
     full_path, relative_path = file_info
+    station = station_from_path(relative_path)
 
     try:
-        # Try UTF-8 first
-        df = pd.read_csv(full_path, encoding='utf-8',
-                         on_bad_lines='skip', low_memory=False)
+        dialect = dialect or get_csv_dialect(full_path)
+        df = read_weather_csv(full_path, **dialect, station=station, on_bad_lines='skip', low_memory=False)
     except UnicodeDecodeError:
+        note_dialect_retry(full_path)
         try:
             # Fallback to latin1
-            df = pd.read_csv(full_path, encoding='latin1',
-                             on_bad_lines='skip', low_memory=False)
+            df = read_weather_csv(full_path, **dict(dialect, encoding='latin1'), station=station,
+                                  on_bad_lines='skip', low_memory=False)
         except Exception as e:
             logger.error(f"Failed to load {relative_path}: {e}")
             return None, None, str(e)
@@ -152,90 +919,257 @@ def load_single_csv(file_info):
         logger.warning(f"Empty dataframe from {relative_path}")
         return None, None, "Empty dataframe"
 
-    # Extract station from relative path (first folder level)
-    path_parts = str(relative_path).replace('\\', '/').split('/')
-    station = path_parts[0] if len(path_parts) > 0 else 'unknown'
-
     return df, station, None
 
+def station_from_path(relative_path):
+    """Extract station from relative path (first folder level)."""
+    path_parts = str(relative_path).replace('\\', '/').split('/')
+    return path_parts[0] if len(path_parts) > 0 else 'unknown'
+
 # ============================================================================
 # ECCC DATA FETCHING WITH CACHING
 # ============================================================================
 
-def download_eccc_month(year, month, station_id):
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill at `rate` per second up to `capacity`; acquire() blocks
+    until a token is available. Only real network requests take a token,
+    so cache hits are never delayed.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class RetryableHTTPError(Exception):
+    """HTTP response worth retrying (429 or 5xx)."""
+
+# Per-thread persistent connections, keyed by (scheme, host, port)
+_http_connections = threading.local()
+
+def get_http_connection(scheme, host, port):
+    """Get (or open) this thread's keep-alive connection to a host."""
+    pool = getattr(_http_connections, 'pool', None)
+    if pool is None:
+        pool = _http_connections.pool = {}
+    key = (scheme, host, port)
+    if key not in pool:
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        pool[key] = connection_class(host, port, timeout=CONFIG['ECCC_TIMEOUT'])
+    return pool[key]
+
+def close_http_connection(scheme, host, port):
+    """Drop this thread's connection to a host (after an error)."""
+    pool = getattr(_http_connections, 'pool', {})
+    connection = pool.pop((scheme, host, port), None)
+    if connection is not None:
+        connection.close()
+
+def http_get(url, rate_limiter=None):
+    """
+    GET a URL over a reused connection, retrying with exponential backoff.
+
+    Connection errors, 429 and 5xx responses are retried up to
+    CONFIG['ECCC_MAX_RETRIES'] times; other HTTP errors fail immediately.
+
+    Args:
+        url: URL to fetch
+        rate_limiter: Optional TokenBucket; one token is taken per attempt
+
+    Returns:
+        Response body as bytes
+    """
+    parts = urllib.parse.urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    path = parts.path + (f"?{parts.query}" if parts.query else '')
+
+    for attempt in range(CONFIG['ECCC_MAX_RETRIES'] + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            connection = get_http_connection(parts.scheme, parts.hostname, port)
+            connection.request('GET', path, headers={'User-Agent': 'Mozilla/5.0',
+                                                     'Connection': 'keep-alive'})
+            response = connection.getresponse()
+            body = response.read()
+            if response.status == 429 or response.status >= 500:
+                raise RetryableHTTPError(f"HTTP {response.status}")
+            if response.status != 200:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            if response.will_close:
+                close_http_connection(parts.scheme, parts.hostname, port)
+            return body
+        except (RetryableHTTPError, http.client.HTTPException, OSError) as e:
+            close_http_connection(parts.scheme, parts.hostname, port)
+            if isinstance(e, urllib.error.HTTPError) or attempt == CONFIG['ECCC_MAX_RETRIES']:
+                raise
+            delay = CONFIG['ECCC_RETRY_BACKOFF'] * (2 ** attempt)
+            logger.warning(f"Request failed ({e}), retrying in {delay:.1f}s: {url}")
+            time.sleep(delay)
+
+ECCC_TIMEFRAMES = {1: 'hourly', 2: 'daily', 3: 'monthly'}
+
+def get_eccc_stations():
+    """
+    Get the ECCC station registry with defaults filled in.
+
+    Returns:
+        List of dicts with 'id', 'name', 'start_year' and 'timeframe'
+    """
+    stations = []
+    for entry in CONFIG['ECCC_STATIONS']:
+        timeframe = entry.get('timeframe', 1)
+        if timeframe not in ECCC_TIMEFRAMES:
+            raise ValueError(f"Unknown ECCC timeframe {timeframe} for station {entry['id']}")
+        stations.append({
+            'id': entry['id'],
+            'name': entry.get('name', f"ECCC_{entry['id']}"),
+            'start_year': entry.get('start_year', CONFIG['ECCC_START_YEAR']),
+            'timeframe': timeframe,
+        })
+    return stations
+
+def eccc_month_url(station_id, year, month, timeframe=1):
+    """Build the ECCC bulk-data URL for one station period."""
+    return (f"{CONFIG['ECCC_BASE_URL']}?"
+            f"format=csv&stationID={station_id}&Year={year}&Month={month}&"
+            f"Day=14&timeframe={timeframe}&submit=Download+Data")
+
+def eccc_cache_key(station, year, month):
+    """Cache key for one download, namespaced by station and timeframe."""
+    timeframe_name = ECCC_TIMEFRAMES[station['timeframe']]
+    return f"eccc_{station['id']}/{timeframe_name}_{year}_{month:02d}"
+
+def download_eccc_month(year, month, station, rate_limiter=None):
     """
     Download a single month of ECCC data with caching.
 
+    Daily and monthly timeframes return a whole year or the whole record
+    per request, so they are called with month=1 only.
+
     Args:
         year: Year to download
         month: Month to download
-        station_id: ECCC station ID
+        station: Registry entry (see get_eccc_stations)
+        rate_limiter: Optional TokenBucket applied to network requests only
 
     Returns:
         DataFrame or None if failed
     """
-    cache_key = f"eccc_{station_id}_{year}_{month:02d}"
-
-    # Try to load from cache first
-    cached_df = load_from_cache(cache_key)
-    if cached_df is not None:
-        return cached_df
-
-    # Download if not cached
-    url = (f"https://climate.weather.gc.ca/climate_data/bulk_data_e.html?"
-           f"format=csv&stationID={station_id}&Year={year}&Month={month}&"
-           f"Day=14&timeframe=1&submit=Download+Data")
+    station_id = station['id']
+    cache_key = eccc_cache_key(station, year, month)
 
     try:
-        req = urllib.request.Request(url)
-        req.add_header('User-Agent', 'Mozilla/5.0')
-        df = pd.read_csv(urllib.request.urlopen(req), encoding='utf-8', on_bad_lines='skip')
+        # Try to load from cache first, download if missing or expired
+        body = load_from_cache(cache_key)
+        from_cache = body is not None
+        if not from_cache:
+            url = eccc_month_url(station_id, year, month, station['timeframe'])
+            body = http_get(url, rate_limiter)
+            save_to_cache(body, cache_key, station_id, station['timeframe'], year, month)
+
+        df = read_weather_csv(io.BytesIO(body), encoding='utf-8', station=station['name'],
+                              source_kind='eccc', on_bad_lines='skip')
 
         if not df.empty:
-            df['station'] = 'Stanhope'
-            save_to_cache(df, cache_key)
-            logger.info(f"Downloaded ECCC data: {year}-{month:02d} ({len(df)} rows)")
+            df['station'] = station['name']
+            df.attrs['eccc_station_id'] = station_id
+            df.attrs['eccc_period'] = (station['timeframe'], year, month)
+            if not from_cache:
+                logger.info(f"Downloaded ECCC data: {station['name']} {year}-{month:02d} ({len(df)} rows)")
             return df
         else:
-            logger.warning(f"Empty ECCC data for {year}-{month:02d}")
+            logger.warning(f"Empty ECCC data for {station['name']} {year}-{month:02d}")
             return None
 
     except Exception as e:
-        logger.error(f"Failed to download ECCC data for {year}-{month:02d}: {e}")
+        logger.error(f"Failed to download ECCC data for {station['name']} {year}-{month:02d}: {e}")
         return None
 
-def download_eccc_stanhope_data():
+def eccc_download_periods(station):
     """
-    Download hourly data from ECCC Stanhope station with caching.
-    ECCC times are in UTC.
+    List the (year, month) requests needed for a station.
+
+    Hourly data is served one month per request, daily data one year per
+    request and monthly data as a single file for the whole record.
     """
-    station_id = CONFIG['ECCC_STATION_ID']
     current_year = datetime.now().year
     current_month = datetime.now().month
+    start_year = station['start_year']
 
-    logger.info(f"Downloading ECCC Stanhope data (Station ID: {station_id})")
-    logger.info(f"Date range: {CONFIG['ECCC_START_YEAR']}-01 to {current_year}-{current_month:02d}")
+    if station['timeframe'] == 3:
+        return [(start_year, 1)] if start_year <= current_year else []
+    if station['timeframe'] == 2:
+        return [(year, 1) for year in range(start_year, current_year + 1)]
+    return [(year, month)
+            for year in range(start_year, current_year + 1)
+            for month in range(1, (current_month if year == current_year else 12) + 1)]
 
-    eccc_dataframes = []
-    failed_downloads = []
+def download_eccc_data(stations=None):
+    """
+    Download data for every registered ECCC station with caching.
+    ECCC times are in UTC.
 
-    for year in range(CONFIG['ECCC_START_YEAR'], current_year + 1):
-        last_month = current_month if year == current_year else 12
+    All (station, month) requests share one thread pool
+    (CONFIG['ECCC_MAX_CONCURRENCY'] threads, each reusing its HTTP
+    connection) and one token bucket limiting real requests to
+    CONFIG['ECCC_REQUESTS_PER_SECOND']; cached months are free.
 
-        for month in range(1, last_month + 1):
-            df = download_eccc_month(year, month, station_id)
+    Args:
+        stations: Registry entries (defaults to get_eccc_stations())
 
-            if df is not None:
-                eccc_dataframes.append(df)
-            else:
-                failed_downloads.append(f"{year}-{month:02d}")
+    Returns:
+        List of DataFrames in (station, year, month) order
+    """
+    stations = get_eccc_stations() if stations is None else stations
+    tasks = [(station, year, month) for station in stations for year, month in eccc_download_periods(station)]
+
+    for station in stations:
+        logger.info(f"Downloading ECCC {station['name']} data (Station ID: {station['id']}, "
+                    f"{ECCC_TIMEFRAMES[station['timeframe']]}, from {station['start_year']})")
 
-            time.sleep(CONFIG['API_DELAY'])
+    rate_limiter = TokenBucket(CONFIG['ECCC_REQUESTS_PER_SECOND'])
+    results = [None] * len(tasks)
+
+    with ThreadPoolExecutor(max_workers=CONFIG['ECCC_MAX_CONCURRENCY']) as executor:
+        futures = {
+            executor.submit(download_eccc_month, year, month, station, rate_limiter): i
+            for i, (station, year, month) in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    eccc_dataframes = [df for df in results if df is not None]
+    failed_downloads = [f"{station['name']} {year}-{month:02d}"
+                        for (station, year, month), df in zip(tasks, results) if df is None]
 
     if failed_downloads:
         logger.warning(f"Failed to download {len(failed_downloads)} months: {failed_downloads[:5]}...")
 
-    logger.info(f"Successfully downloaded {len(eccc_dataframes)} months of ECCC data")
+    logger.info(f"Successfully downloaded {len(eccc_dataframes)} months of ECCC data "
+                f"from {len(stations)} station(s)")
+    enforce_cache_size_limit()
+    log_cache_stats()
+    log_na_sentinel_report(((station['name'], df) for (station, _, _), df in zip(tasks, results)
+                            if df is not None))
 
     return eccc_dataframes
 
@@ -243,65 +1177,268 @@ def download_eccc_stanhope_data():
 # DATA CLEANING
 # ============================================================================
 
-def clean_columns(df):
+# Canonical schema every cleaned source is mapped onto, in output order
+CANONICAL_COLUMNS = (['Datetime_UTC', 'Date/Time', 'Date', 'Time'] + list(VARIABLE_DTYPES)
+                     + ['Percipitation', 'Visibility', 'Stn Press', 'Weather'])
+
+# Column mapping registry: (regex on the lower-cased header name, canonical
+# name), first match wins. None marks known columns that are never kept.
+COLUMN_RULES = [
+    (r'flag$', None),
+    (r'dew', 'Dew'),
+    (r'^datetime utc$', 'Datetime_UTC'),
+    (r'^date ?/? ?time', 'Date/Time'),
+    (r'^date$', 'Date'),
+    (r'^time$', 'Time'),
+    (r'^(air )?temp(erature)?$', 'Temperature'),
+    (r'^(rh|rel(ative)? hum(idity)?)$', 'Rh'),
+    (r'^(wind )?gust\s+speed$', 'Wind Gust Speed'),
+    (r'^(avg |average )?wind\s*(speed|spd)$', 'Wind Speed'),
+    (r'^wind\s*dir(ection)?$', 'Wind Direction'),
+    (r'^rain$', 'Rain'),
+    (r'^(accumulated rain|precip\. amount)$', 'Percipitation'),
+    (r'^visibility$', 'Visibility'),
+    (r'^stn press$', 'Stn Press'),
+    (r'^weather$', 'Weather'),
+    (r'^(hmdx|wind chill|year|month|day|longitude|latitude|station name|climate id)$', None),
+    (r'^(water pressure|diff pressure|barometric pressure|water temperature|water level)$', None),
+]
+COMPILED_COLUMN_RULES = [(re.compile(pattern), name) for pattern, name in COLUMN_RULES]
+
+# Header units converted to the canonical unit of the variables they apply
+# to: canonical = (value + offset) * scale
+TEMPERATURE_VARIABLES = ('Temperature', 'Dew')
+SPEED_VARIABLES = ('Wind Speed', 'Wind Gust Speed')
+PRECIPITATION_VARIABLES = ('Rain', 'Percipitation')
+UNIT_CONVERSIONS = {
+    'f': (TEMPERATURE_VARIABLES, -32.0, 5 / 9),
+    'degf': (TEMPERATURE_VARIABLES, -32.0, 5 / 9),
+    'mph': (SPEED_VARIABLES, 0.0, 1.609344),
+    'm/s': (SPEED_VARIABLES, 0.0, 3.6),
+    'mps': (SPEED_VARIABLES, 0.0, 3.6),
+    'kt': (SPEED_VARIABLES, 0.0, 1.852),
+    'knots': (SPEED_VARIABLES, 0.0, 1.852),
+    'in': (PRECIPITATION_VARIABLES, 0.0, 25.4),
+    '10sdeg': (('Wind Direction',), 0.0, 10.0),
+}
+# Units already canonical (recognized so they can be split off underscored names)
+CANONICAL_UNITS = {'c', 'degc', 'km/h', 'kmh', 'kph', 'mm', '%', 'pct', 'deg'}
+
+MANGLED_NAME_SUFFIX = re.compile(r'\.\d+$')
+
+# UTC offset in logger timestamp headers, e.g. HOBO 'Date Time, GMT-03:00'
+HEADER_UTC_OFFSET = re.compile(r'\b(?:gmt|utc)\s*([+-])\s*(\d{1,2})(?::?(\d{2}))?', re.IGNORECASE)
+# Per-row offset (hours) of local timestamps, carried from clean_columns to process_datetime_columns
+UTC_OFFSET_COLUMN = 'UTC Offset'
+TIMESTAMP_COLUMNS = ('Date/Time', 'Date', 'Time')
+
+# Running totals for the current process, reported by log_schema_report()
+SCHEMA_STATS = {'files': 0, 'signatures': 0}
+UNMAPPED_COLUMNS = {}  # Unmapped header name -> number of files
+CONVERTED_UNITS = {}  # (column, unit) -> number of files
+_schema_lock = threading.Lock()
+
+def normalize_unit(unit):
+    """Reduce a unit label to a lookup key, e.g. '°F' -> 'f', 'km/h' -> 'km/h', '10s deg' -> '10sdeg'."""
+    return re.sub(r'[^a-z0-9/%]', '', str(unit).lower())
+
+def is_known_unit(unit):
+    """Whether a unit label is convertible or already canonical."""
+    key = normalize_unit(unit)
+    return key in UNIT_CONVERSIONS or key in CANONICAL_UNITS
+
+def header_utc_offset(col):
+    """UTC offset in hours from a timestamp header ('Date Time, GMT-03:00' -> -3.0), or None."""
+    match = HEADER_UTC_OFFSET.search(str(col))
+    if match is None:
+        return None
+    sign, hours, minutes = match.groups()
+    offset = int(hours) + int(minutes or 0) / 60
+    return -offset if sign == '-' else offset
+
+def parse_column_header(col):
     """
-    Clean and standardize column names.
+    Split a raw header into its name and unit.
+
+    'Temp (°C)' -> ('Temp', '°C'), 'Wind_Speed_mph' -> ('Wind Speed', 'mph'),
+    'Temp, °F (LGR S/N: 1)' -> ('Temp', '°F'). Suffixes read_csv adds to
+    repeated names ('Rain.1') are removed. A UTC offset ('Date Time,
+    GMT-03:00') is taken out first; header_utc_offset() reads it.
+    """
+    text = MANGLED_NAME_SUFFIX.sub('', str(col)).strip()
+    text = HEADER_UTC_OFFSET.sub('', text).strip().rstrip(',').strip()
+    name, _, rest = text.partition('(')
+    unit = rest.split(')')[0].strip()
+    name = name.strip()
+
+    if ',' in name:
+        name, _, comma_unit = name.partition(',')
+        if is_known_unit(comma_unit):
+            unit = comma_unit.strip()
+
+    tokens = [t for t in name.split('_') if t]
+    for width in (2, 1):
+        if len(tokens) > width and is_known_unit('/'.join(tokens[-width:])):
+            unit = '/'.join(tokens[-width:])
+            tokens = tokens[:-width]
+            break
+    return ' '.join(tokens).strip(), unit
+
+def map_column(col, unmapped_policy='drop'):
+    """
+    Look up a raw header in the mapping registry.
 
     Args:
-        df: Input dataframe
+        col: Raw header
+        unmapped_policy: CONFIG['UNMAPPED_COLUMNS'] ('drop' or 'keep')
 
     Returns:
-        Cleaned dataframe
-    """
-    # Split parens/underscores
-    df.columns = [re.split(r'[\(_]', str(col))[0].strip() for col in df.columns]
-
-    # Drop junk columns
-    junk_patterns = ['serial', 'battery', 'solar',]
-    cols_to_drop = [col for col in df.columns if any(p in str(col).lower() for p in junk_patterns)]
-    df = df.drop(columns=[c for c in cols_to_drop if c in df.columns])
-
-    # Standard replacements
-    def standardize(col):
-        lower = str(col).lower().strip()
-        replacements = {
-            'wind gust  speed': 'Wind Gust Speed',
-            'wind gust speed': 'Wind Gust Speed',
-            'gust speed': 'Wind Gust Speed',
-            'avg wind speed': 'Wind Speed',
-            'average wind speed': 'Wind Speed',
-            'wind spd': 'Wind Speed',
-            'windspd': 'Wind Speed',
-            'accumulated rain': 'Percipitation',
-            'precip. amount': 'Percipitation',
-            'temp': 'Temperature',
-            'wind dir': 'Wind Direction',
-            'rel hum': 'Rh',
-            'date/time': 'Date/Time',
-        }
-        if 'dew' in lower:
-            return 'Dew'
-        return replacements.get(lower, str(col).title())
+        Tuple of (canonical name or None, unit conversion (offset, scale) or
+        None, status): status is 'mapped', 'dropped' (known but not kept),
+        'junk' (logger housekeeping) or 'unmapped'
+    """
+    name, unit = parse_column_header(col)
+    lower = name.lower()
+    if any(p in lower for p in JUNK_COLUMN_PATTERNS):
+        return None, None, 'junk'
+
+    for pattern, canonical in COMPILED_COLUMN_RULES:
+        if pattern.search(lower):
+            if canonical is None:
+                return None, None, 'dropped'
+            conversion = UNIT_CONVERSIONS.get(normalize_unit(unit))
+            if conversion is not None and canonical in conversion[0]:
+                return canonical, (conversion[1], conversion[2], unit), 'mapped'
+            return canonical, None, 'mapped'
+
+    if unmapped_policy == 'keep':
+        return name.title(), None, 'unmapped'
+    return None, None, 'unmapped'
+
+def column_mapping(header):
+    """
+    Mapping for one header signature under the configured unmapped policy.
+
+    Args:
+        header: Tuple of raw column names in file order
+
+    Returns:
+        Tuple with map_column()'s result for each column
+    """
+    return compile_column_mapping(header, CONFIG['UNMAPPED_COLUMNS'])
+
+@functools.lru_cache(maxsize=None)
+def compile_column_mapping(header, unmapped_policy):
+    """Match every column of a header signature once (memoized: files from one logger share a header)."""
+    with _schema_lock:
+        SCHEMA_STATS['signatures'] += 1
+    return tuple(map_column(col, unmapped_policy) for col in header)
+
+def note_schema_mapping(mapping):
+    """Add one file's unmapped columns and unit conversions to the run totals."""
+    with _schema_lock:
+        SCHEMA_STATS['files'] += 1
+        for raw, (canonical, conversion, status) in mapping:
+            if status == 'unmapped':
+                key = parse_column_header(raw)[0] or str(raw)
+                UNMAPPED_COLUMNS[key] = UNMAPPED_COLUMNS.get(key, 0) + 1
+            if conversion is not None:
+                key = (canonical, conversion[2])
+                CONVERTED_UNITS[key] = CONVERTED_UNITS.get(key, 0) + 1
+
+def log_schema_report():
+    """Log header signatures compiled, unit conversions and columns the registry does not know."""
+    if not SCHEMA_STATS['files']:
+        return
+    logger.info(f"Column mapping: {SCHEMA_STATS['signatures']} header signature(s) compiled "
+                f"for {SCHEMA_STATS['files']} file(s)")
+    for (canonical, unit), files in sorted(CONVERTED_UNITS.items()):
+        logger.info(f"  Converted {canonical} from {unit} in {files} file(s)")
+    if UNMAPPED_COLUMNS:
+        action = 'kept' if CONFIG['UNMAPPED_COLUMNS'] == 'keep' else 'dropped'
+        logger.warning(f"Unmapped columns ({action}); add a COLUMN_RULES entry to keep them:")
+        for name, files in sorted(UNMAPPED_COLUMNS.items(), key=lambda item: -item[1]):
+            logger.warning(f"  {name!r} in {files} file(s)")
+
+def clean_columns(df):
+    """
+    Map columns onto the canonical schema.
+
+    Each column is looked up in the mapping registry (memoized per header
+    signature), converted to canonical units and renamed. Junk, known
+    unused and unmapped columns are dropped (unmapped ones are kept under
+    their title-cased name with CONFIG['UNMAPPED_COLUMNS'] = 'keep'). A UTC
+    offset in a timestamp header becomes the UTC_OFFSET_COLUMN, which
+    process_datetime_columns uses to convert the timestamps to UTC.
 
-    df.columns = ['station' if c == 'station' else standardize(c) for c in df.columns]
+    Args:
+        df: Input dataframe
 
-    # Dedupe + drop constants
-    df = df.loc[:, ~df.columns.duplicated()]
+    Returns:
+        Cleaned dataframe, columns in CANONICAL_COLUMNS order
+    """
+    raw_positions = [i for i, c in enumerate(df.columns) if c != 'station']
+    raw_columns = [str(df.columns[i]) for i in raw_positions]
+    mapping = column_mapping(tuple(raw_columns))
+    note_schema_mapping(zip(raw_columns, mapping))
+
+    # First source column wins for each canonical name
+    keep, names, conversions = [], [], []
+    utc_offset = None
+    for position, raw, (canonical, conversion, _) in zip(raw_positions, raw_columns, mapping):
+        if canonical is not None and canonical not in names:
+            keep.append(position)
+            names.append(canonical)
+            conversions.append(conversion)
+            if canonical in TIMESTAMP_COLUMNS and utc_offset is None:
+                utc_offset = header_utc_offset(raw)
+    station = df['station'] if 'station' in df.columns else None
+    df = df.iloc[:, keep]
+    df.columns = names
+
+    # Unit conversion to canonical units
+    for name, conversion in zip(names, conversions):
+        if conversion is not None:
+            offset, scale, _ = conversion
+            values = pd.to_numeric(df[name], errors='coerce')
+            df[name] = ((values + offset) * scale).astype(values.dtype)
+
+    # Canonical order, then unmapped columns kept by the 'keep' policy
+    order = [c for c in CANONICAL_COLUMNS if c in names] + [c for c in names if c not in CANONICAL_COLUMNS]
+    df = df[order]
+    if station is not None:
+        df['station'] = station
+
+    # Drop constants
     constant_mask = (df.nunique() <= 1) & (df.columns != 'station')
     df = df.drop(columns=df.columns[constant_mask])
 
+    if utc_offset is not None:
+        df.insert(len(df.columns) - (station is not None), UTC_OFFSET_COLUMN, np.float32(utc_offset))
+
     return df
 
-def process_single_file(url_info):
+def process_single_file(url_info, content_hash=None, cache_index=None):
     """
     Load and clean a single CSV file.
 
     Args:
         url_info: Tuple of (url, path)
+        content_hash: SHA-256 of the file; enables the cleaned-file cache
+        cache_index: Cleaned-file cache index (see load_cleaned_index)
 
     Returns:
         Cleaned dataframe or None
     """
+    use_cache = content_hash is not None and cache_index is not None
+
+    if use_cache:
+        df = load_cleaned_frame(content_hash, cache_index)
+        if df is not None:
+            df['station'] = station_from_path(url_info[1])
+            return df
+
+    started = time.perf_counter()
     df, station, error = load_single_csv(url_info)
 
     if df is None:
@@ -309,238 +1446,736 @@ def process_single_file(url_info):
 
     # Clean columns immediately (clean as you go)
     df = clean_columns(df)
+    if use_cache:
+        save_cleaned_frame(content_hash, df, time.perf_counter() - started, cache_index)
     df['station'] = station
 
     return df
 
-def load_and_clean_local_data(csv_files):
+def dataframe_to_transport(df, transport='pickle'):
+    """
+    Serialize a cleaned dataframe for the trip back from a worker process.
+
+    'pickle' sends the dataframe itself (pickle protocol 5 ships numpy
+    blocks as raw buffers). 'arrow' sends an Arrow IPC stream; it needs
+    pyarrow and falls back to pickle for columns Arrow cannot represent.
+
+    Returns:
+        Tuple of (kind, payload) for dataframe_from_transport
+    """
+    if transport == 'arrow' and HAS_PYARROW:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return 'arrow', sink.getvalue()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+    return 'pickle', df
+
+def dataframe_from_transport(transport):
+    """Rebuild a dataframe produced by dataframe_to_transport."""
+    kind, payload = transport
+    if kind == 'pickle':
+        return payload
+
+    table = pa.ipc.open_stream(payload).read_all()
+    df = table.to_pandas()
+    # Arrow nulls come back as None in text columns; read_csv uses NaN
+    for col, column in zip(df.columns, table.columns):
+        if column.null_count and df[col].dtype == object:
+            df.loc[df[col].isna(), col] = np.nan
+    return df
+
+def clean_file_in_worker(url_info, transport='pickle', dialect=None):
+    """
+    Process-pool worker: load and clean one file.
+
+    Returns:
+        Tuple of (transport or None, seconds spent parsing and cleaning,
+        whether the parse had to be repeated as latin1, raw column names
+        for the parent's schema report)
+    """
+    started = time.perf_counter()
+    retries_before = DIALECT_STATS['retried']
+    df, station, error = load_single_csv(url_info, dialect)
+    retried = DIALECT_STATS['retried'] > retries_before
+    if df is None:
+        return None, 0.0, retried, []
+    raw_columns = [str(c) for c in df.columns]
+    df = clean_columns(df)
+    return dataframe_to_transport(df, transport), time.perf_counter() - started, retried, raw_columns
+
+def get_ingest_workers():
+    """Number of worker processes for INGEST_MODE='process'."""
+    return CONFIG['INGEST_PROCESSES'] or os.cpu_count() or 1
+
+def process_files_in_pool(csv_files, content_hashes, cache_index):
+    """
+    Load and clean files on a process pool.
+
+    Cleaned-file cache hits are served in this process; only misses are
+    sent to workers, and their results are written to the cache here.
+
+    Yields:
+        Tuples of (url_info, dataframe or None, error or None)
+    """
+    pending = []
+    for url_info in csv_files:
+        content_hash = content_hashes.get(url_info[1])
+        df = load_cleaned_frame(content_hash, cache_index) if content_hash else None
+        if df is not None:
+            df['station'] = station_from_path(url_info[1])
+            yield url_info, df, None
+        else:
+            pending.append(url_info)
+
+    if not pending:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(get_ingest_workers(), len(pending))) as executor:
+        # Dialects are sniffed here so the station folder cache and stats stay in one process
+        future_to_url = {}
+        for url_info in pending:
+            try:
+                dialect = get_csv_dialect(url_info[0])
+            except OSError:
+                dialect = None  # The worker reports the read error
+            future = executor.submit(clean_file_in_worker, url_info, CONFIG['INGEST_TRANSPORT'], dialect)
+            future_to_url[future] = url_info
+
+        for future in as_completed(future_to_url):
+            url_info = future_to_url[future]
+            try:
+                transport, clean_seconds, retried, raw_columns = future.result()
+            except Exception as e:
+                yield url_info, None, e
+                continue
+            if retried:
+                note_dialect_retry(url_info[0])
+            if raw_columns:
+                note_schema_mapping(zip(raw_columns, column_mapping(tuple(raw_columns))))
+            if transport is None:
+                yield url_info, None, None
+                continue
+
+            df = dataframe_from_transport(transport)
+            content_hash = content_hashes.get(url_info[1])
+            if content_hash:
+                save_cleaned_frame(content_hash, df, clean_seconds, cache_index)
+            df['station'] = station_from_path(url_info[1])
+            yield url_info, df, None
+
+def process_files_in_threads(csv_files, content_hashes, cache_index, max_workers):
+    """
+    Load and clean files on a thread pool (max_workers=1 runs serially).
+
+    Yields:
+        Tuples of (url_info, dataframe or None, error or None)
+    """
+    if max_workers == 1:
+        for url_info in csv_files:
+            try:
+                yield url_info, process_single_file(url_info, content_hashes.get(url_info[1]), cache_index), None
+            except Exception as e:
+                yield url_info, None, e
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_url = {executor.submit(process_single_file, url_info,
+                                         content_hashes.get(url_info[1]), cache_index): url_info
+                        for url_info in csv_files}
+
+        for future in as_completed(future_to_url):
+            url_info = future_to_url[future]
+            try:
+                yield url_info, future.result(), None
+            except Exception as e:
+                yield url_info, None, e
+
+def load_and_clean_local_data(csv_files, with_paths=False):
     """
     Load and clean all GitHub CSV files using parallel processing.
 
+    CONFIG['INGEST_MODE'] selects a thread pool ('thread', MAX_WORKERS
+    threads), a process pool ('process', INGEST_PROCESSES or one per CPU)
+    or a plain loop ('serial').
+
     Args:
         csv_files: List of (url, path) tuples
+        with_paths: If True, return (relative_path, dataframe) tuples
 
     Returns:
         List of cleaned dataframes
     """
-    logger.info(f"Loading and cleaning {len(csv_files)} files...")
+    mode = CONFIG['INGEST_MODE']
+    if mode not in ('thread', 'process', 'serial'):
+        raise ValueError(f"Unknown INGEST_MODE '{mode}' (expected 'thread', 'process' or 'serial')")
+
+    logger.info(f"Loading and cleaning {len(csv_files)} files ({mode} mode)...")
 
     dataframes = []
     failed_files = []
 
-    # Parallel processing
-    with ThreadPoolExecutor(max_workers=CONFIG['MAX_WORKERS']) as executor:
-        future_to_url = {executor.submit(process_single_file, url_info): url_info 
-                        for url_info in csv_files}
+    # Content hashes for the cleaned-file cache (unchanged files reuse their stored hash)
+    cache_index = None
+    content_hashes = {}
+    if CONFIG['CLEANED_FILE_CACHE']:
+        cache_index = load_cleaned_index()
+        cache_index['files'].update(fingerprint_local_files(csv_files, cache_index['files']))
+        content_hashes = {rel: fp['sha256'] for rel, fp in cache_index['files'].items()}
 
-        for future in as_completed(future_to_url):
-            url_info = future_to_url[future]
-            try:
-                df = future.result()
-                if df is not None:
-                    dataframes.append(df)
-                else:
-                    failed_files.append(url_info[1])
-            except Exception as e:
-                logger.error(f"Error processing {url_info[1]}: {e}")
-                failed_files.append(url_info[1])
+    if mode == 'process':
+        results = process_files_in_pool(csv_files, content_hashes, cache_index)
+    else:
+        max_workers = 1 if mode == 'serial' else CONFIG['MAX_WORKERS']
+        results = process_files_in_threads(csv_files, content_hashes, cache_index, max_workers)
+
+    sentinel_sources = []
+    for url_info, df, error in results:
+        if error is not None:
+            logger.error(f"Error processing {url_info[1]}: {error}")
+            failed_files.append(url_info[1])
+        elif df is not None:
+            dataframes.append((url_info[1], df) if with_paths else df)
+            sentinel_sources.append((station_from_path(url_info[1]), df))
+        else:
+            failed_files.append(url_info[1])
 
     logger.info(f"Successfully loaded {len(dataframes)} files")
+    frames = [df for _, df in dataframes] if with_paths else dataframes
+    loaded_bytes = sum(df.memory_usage(deep=True).sum() for df in frames)
+    logger.info(f"Loaded frames use {loaded_bytes / 1e6:.1f} MB (dtype schema applied at read time)")
     if failed_files:
         logger.warning(f"Failed to load {len(failed_files)} files")
 
+    if cache_index is not None:
+        save_cleaned_index(cache_index)
+        log_cleaned_cache_report()
+    log_dialect_stats()
+    log_schema_report()
+    log_na_sentinel_report(sentinel_sources)
+
     return dataframes
 
+# ============================================================================
+# STATION LAYOUT
+# ============================================================================
+
+def is_station_time_sorted(df):
+    """
+    Check whether rows are already ordered by (station, Datetime_UTC).
+
+    Matches the order ``df.sort_values(['station', 'Datetime_UTC'])`` would
+    produce, so sorted frames can skip the sort (and its copy) entirely.
+    """
+    if len(df) == 0:
+        return True
+    if not pd.api.types.is_datetime64_any_dtype(df['Datetime_UTC']):
+        return False
+
+    station = df['station']
+    if isinstance(station.dtype, pd.CategoricalDtype):
+        codes = station.cat.codes.to_numpy()
+    else:
+        codes, _ = pd.factorize(station, sort=True)
+    times = pd.DatetimeIndex(df['Datetime_UTC'])
+    if (codes < 0).any() or times.hasnans:
+        return False
+
+    times = times.asi8
+    same_station = codes[1:] == codes[:-1]
+    return bool(np.all(codes[1:] >= codes[:-1]) and
+                np.all((times[1:] >= times[:-1]) | ~same_station))
+
+class StationLayout:
+    """
+    Station-partitioned layout of weather data.
+
+    The frame is sorted once by (station, Datetime_UTC) and each station owns
+    the contiguous rows starts[i]:stops[i]. Per-station work takes positional
+    slices (views, no copy) instead of boolean masks over the station column,
+    and frames that are already in order are used as-is.
+    """
+
+    def __init__(self, df):
+        self.resorted = not is_station_time_sorted(df)
+        if self.resorted:
+            df = df.sort_values(['station', 'Datetime_UTC']).reset_index(drop=True)
+        self.df = df
+
+        # Codes follow order of appearance, so in a sorted frame they are
+        # also the station block number of every row
+        codes, uniques = pd.factorize(df['station'])
+        self.codes = codes
+        if len(codes):
+            self.starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+            self.stops = np.r_[self.starts[1:], len(codes)]
+        else:
+            self.starts = self.stops = np.array([], dtype=np.int64)
+        starts = self.starts
+        self.stations = [uniques[codes[start]] for start in starts]
+        self.offsets = {station: (int(start), int(stop))
+                        for station, start, stop in zip(self.stations, self.starts, self.stops)}
+
+    def __len__(self):
+        return len(self.stations)
+
+    def __contains__(self, station):
+        return station in self.offsets
+
+    @property
+    def sizes(self):
+        """Number of rows per station, in layout order."""
+        return self.stops - self.starts
+
+    def slice(self, station):
+        """Rows of one station as a zero-copy positional slice."""
+        start, stop = self.offsets[station]
+        return self.df.iloc[start:stop]
+
+    def items(self):
+        """Iterate (station, slice) pairs in layout order."""
+        for station, (start, stop) in self.offsets.items():
+            yield station, self.df.iloc[start:stop]
+
+    def time_range(self, station, start, end, inclusive='both'):
+        """
+        Positions [lo, hi) of one station's rows with Datetime_UTC between start and end.
+
+        Times are sorted inside each block, so the bounds are two binary
+        searches of that block rather than a mask over the whole frame.
+        Stations not in the layout give an empty range.
+
+        Args:
+            inclusive: 'both', 'neither', 'left' or 'right', as in Series.between
+        """
+        block_start, block_stop = self.offsets.get(station, (0, 0))
+        times = self.df['Datetime_UTC'].array[block_start:block_stop]
+        # NaT sorts to the end of a block and is never inside a range
+        if len(times) and pd.isna(times[-1]):
+            times = times[:int(times.notna().sum())]
+        lo = times.searchsorted(start, side='left' if inclusive in ('both', 'left') else 'right')
+        hi = times.searchsorted(end, side='right' if inclusive in ('both', 'right') else 'left')
+        return block_start + int(lo), block_start + max(int(hi), int(lo))
+
+    def row_blocks(self):
+        """Station block number of every row."""
+        return self.codes
+
 # ============================================================================
 # DATA QUALITY REPORTING
 # ============================================================================
 
-def generate_data_quality_report(df, stage=""):
+QUALITY_SNAPSHOTS = []  # Stage snapshots taken during this run, in order
+RUN_STARTED = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+def take_quality_snapshot(df, stage, level=1, known=None):
     """
-    Generate and log data quality metrics.
+    Collect stage-level quality metrics as a JSON-serializable record.
+
+    Level 1 only reads column metadata and makes one vectorized pass per
+    column: rows, columns, shallow memory, rows per station, date range and
+    missing values per column. Level 2 adds the checks that walk every row
+    as Python objects: deep memory usage and full-row duplicate hashing.
 
     Args:
         df: DataFrame to analyze
-        stage: Stage name for logging
+        stage: Stage name
+        level: Snapshot level (1 or 2)
+        known: Metrics the caller already has, used instead of recomputing
+            them (e.g. {'duplicate_rows': 0} right after deduplication)
+
+    Returns:
+        Dict snapshot record
     """
+    started = time.perf_counter()
+    known = known or {}
+    snapshot = {
+        'run': RUN_STARTED,
+        'stage': stage,
+        'level': level,
+        'rows': len(df),
+        'columns': len(df.columns),
+        'memory_mb': round(df.memory_usage(deep=level >= 2).sum() / 1e6, 1),
+        'memory_deep': level >= 2,
+    }
+
+    if 'station' in df.columns:
+        station_counts = df['station'].value_counts()
+        snapshot['stations'] = {str(station): int(count) for station, count in station_counts.items() if count > 0}
+
+    if 'Datetime_UTC' in df.columns:
+        start, end = df['Datetime_UTC'].min(), df['Datetime_UTC'].max()
+        snapshot['start'] = None if pd.isna(start) else str(start)
+        snapshot['end'] = None if pd.isna(end) else str(end)
+
+    # count() skips the boolean frame isnull().sum() would build
+    missing = (len(df) - df.count()).groupby(level=0, sort=False).sum()
+    snapshot['missing'] = {str(col): int(count) for col, count in missing.items() if count > 0}
+
+    if 'duplicate_rows' in known:
+        snapshot['duplicate_rows'] = int(known['duplicate_rows'])
+    elif level >= 2:
+        snapshot['duplicate_rows'] = int(df.duplicated().sum())
+    else:
+        snapshot['duplicate_rows'] = None
+
+    snapshot['seconds'] = round(time.perf_counter() - started, 3)
+    return snapshot
+
+def log_quality_snapshot(snapshot, column_names):
+    """Log a stage snapshot in the human-readable report format."""
     logger.info(f"\n{'='*60}")
-    logger.info(f"Data Quality Report - {stage}")
+    logger.info(f"Data Quality Report - {snapshot['stage']}")
     logger.info(f"{'='*60}")
 
     # Basic stats
-    logger.info(f"Total rows: {len(df):,}")
-    logger.info(f"Total columns: {len(df.columns)}")
-    logger.info(f"Memory usage: {df.memory_usage(deep=True).sum()/1e6:.1f} MB")
+    logger.info(f"Total rows: {snapshot['rows']:,}")
+    logger.info(f"Total columns: {snapshot['columns']}")
+    logger.info(f"Memory usage: {snapshot['memory_mb']:.1f} MB" + ("" if snapshot['memory_deep'] else " (shallow)"))
 
     # Stations
-    if 'station' in df.columns:
-        logger.info(f"\nStations ({df['station'].nunique()}):")
-        for station, count in df['station'].value_counts().items():
+    if 'stations' in snapshot:
+        logger.info(f"\nStations ({len(snapshot['stations'])}):")
+        for station, count in snapshot['stations'].items():
             logger.info(f"  {station}: {count:,} rows")
 
     # Date range
-    if 'Datetime_UTC' in df.columns:
+    if 'start' in snapshot:
         logger.info(f"\nDate range:")
-        logger.info(f"  Start: {df['Datetime_UTC'].min()}")
-        logger.info(f"  End: {df['Datetime_UTC'].max()}")
+        logger.info(f"  Start: {snapshot['start']}")
+        logger.info(f"  End: {snapshot['end']}")
 
     # Missing data
-    null_pct = (df.isnull().sum() / len(df) * 100).sort_values(ascending=False)
-    if null_pct.any():
+    if snapshot['missing'] and snapshot['rows']:
         logger.info(f"\nMissing data (top 5):")
-        for col, pct in null_pct.head().items():
-            if pct > 0:
-                logger.info(f"  {col}: {pct:.1f}%")
+        top = sorted(snapshot['missing'].items(), key=lambda item: -item[1])[:5]
+        for col, count in top:
+            logger.info(f"  {col}: {count / snapshot['rows'] * 100:.1f}%")
 
     # Duplicates
-    dup_count = df.duplicated().sum()
-    if dup_count > 0:
-        logger.warning(f"\nDuplicate rows: {dup_count:,} ({dup_count/len(df)*100:.1f}%)")
+    dup_count = snapshot['duplicate_rows']
+    if dup_count:
+        logger.warning(f"\nDuplicate rows: {dup_count:,} ({dup_count/snapshot['rows']*100:.1f}%)")
 
     # Columns
-    logger.info(f"\nColumns: {list(df.columns)}")
+    logger.info(f"\nColumns: {column_names}")
+    logger.info(f"Snapshot took {snapshot['seconds']:.3f}s")
     logger.info(f"{'='*60}\n")
 
-def create_data_quality_csv(df):
+def generate_data_quality_report(df, stage="", known=None):
     """
-    Create comprehensive data quality report CSV with statistics.
+    Take, log and record a quality snapshot of a pipeline stage.
 
-    Shows missing values, imputation counts, and statistical measures by station and column.
+    CONFIG['QUALITY_SNAPSHOT_LEVEL'] picks the checks (0 turns snapshots
+    off); each snapshot is appended as one JSON line to
+    CONFIG['QUALITY_SNAPSHOT_FILE'] so runs can be compared.
 
     Args:
-        df: DataFrame with weather data and imputation flags
+        df: DataFrame to analyze
+        stage: Stage name for logging
+        known: Metrics already known from the preceding stage (see take_quality_snapshot)
 
     Returns:
-        DataFrame with data quality metrics
+        Snapshot dict, or None if snapshots are off
     """
-    logger.info("Creating data quality report with statistics...")
+    level = CONFIG['QUALITY_SNAPSHOT_LEVEL']
+    if level <= 0:
+        return None
 
-    # Get all data columns (not imputation flags)
-    data_cols = [c for c in df.columns 
-                if c not in ['Datetime_UTC', 'station'] 
-                and not c.endswith('_imputed')]
+    snapshot = take_quality_snapshot(df, stage, level, known)
+    QUALITY_SNAPSHOTS.append(snapshot)
+    log_quality_snapshot(snapshot, list(df.columns))
+
+    if CONFIG['QUALITY_SNAPSHOT_FILE']:
+        try:
+            with open(CONFIG['QUALITY_SNAPSHOT_FILE'], 'a', encoding='utf-8') as f:
+                f.write(json.dumps(snapshot) + '\n')
+        except OSError as e:
+            logger.warning(f"Could not write quality snapshot: {e}")
+    return snapshot
 
-    # Build report rows
-    report_rows = []
+def build_quality_row(station, col, total_rows, missing_count, flag_counts, valid_data):
+    """
+    Build one data quality report row.
 
-    for station in sorted(df['station'].unique()):
-        station_df = df[df['station'] == station]
-        total_rows = len(station_df)
+    Args:
+        station: Station name (or 'ALL_STATIONS')
+        col: Column name
+        total_rows: Number of rows
+        missing_count: Number of missing values
+        flag_counts: Tuple of (original, interpolated, calculated) counts, or
+            None if the column has no imputation flag
+        valid_data: Series of non-missing values
 
-        for col in data_cols:
-            if col not in station_df.columns:
-                continue
+    Returns:
+        Dict with the report columns
+    """
+    missing_pct = (missing_count / total_rows * 100) if total_rows > 0 else 0
 
-            # Count missing values
-            missing_count = station_df[col].isnull().sum()
-            missing_pct = (missing_count / total_rows * 100) if total_rows > 0 else 0
-
-            # Count imputation types if flag column exists
-            flag_col = f'{col}_imputed'
-            if flag_col in station_df.columns:
-                imputed_0_original = (station_df[flag_col] == 0).sum()
-                imputed_1_interpolated = (station_df[flag_col] == 1).sum()
-                imputed_2_calculated = (station_df[flag_col] == 2).sum()
-                total_imputed = imputed_1_interpolated + imputed_2_calculated
-            else:
-                imputed_0_original = total_rows - missing_count
-                imputed_1_interpolated = 0
-                imputed_2_calculated = 0
-                total_imputed = 0
-
-            # Calculate statistics on non-missing values
-            valid_data = station_df[col].dropna()
-            if len(valid_data) > 0:
-                mean_val = valid_data.mean()
-                median_val = valid_data.median()
-                min_val = valid_data.min()
-                max_val = valid_data.max()
-                q1_val = valid_data.quantile(0.25)
-                q3_val = valid_data.quantile(0.75)
-                iqr_val = q3_val - q1_val
-            else:
-                mean_val = median_val = min_val = max_val = q1_val = q3_val = iqr_val = np.nan
-
-            report_rows.append({
-                'station': station,
-                'column': col,
-                'total_rows': total_rows,
-                'missing_count': missing_count,
-                'missing_percent': round(missing_pct, 2),
-                'original_data_count': imputed_0_original,
-                'interpolated_count': imputed_1_interpolated,
-                'calculated_count': imputed_2_calculated,
-                'total_imputed_count': total_imputed,
-                'imputation_percent': round((total_imputed / total_rows * 100) if total_rows > 0 else 0, 2),
-                'mean': round(mean_val, 2) if not np.isnan(mean_val) else np.nan,
-                'median': round(median_val, 2) if not np.isnan(median_val) else np.nan,
-                'min': round(min_val, 2) if not np.isnan(min_val) else np.nan,
-                'max': round(max_val, 2) if not np.isnan(max_val) else np.nan,
-                'q1': round(q1_val, 2) if not np.isnan(q1_val) else np.nan,
-                'q3': round(q3_val, 2) if not np.isnan(q3_val) else np.nan,
-                'iqr': round(iqr_val, 2) if not np.isnan(iqr_val) else np.nan,
-            })
-
-    # Add summary row for each column across all stations
-    summary_rows = []
-    for col in data_cols:
-        if col not in df.columns:
+    # Count imputation types if flag column exists
+    if flag_counts is not None:
+        imputed_0_original, imputed_1_interpolated, imputed_2_calculated = flag_counts
+        total_imputed = imputed_1_interpolated + imputed_2_calculated
+    else:
+        imputed_0_original = total_rows - missing_count
+        imputed_1_interpolated = 0
+        imputed_2_calculated = 0
+        total_imputed = 0
+
+    # Calculate statistics on non-missing values (in float64, like create_data_quality_csv)
+    valid_data = valid_data.astype(np.float64)
+    if len(valid_data) > 0:
+        mean_val = valid_data.mean()
+        median_val = valid_data.median()
+        min_val = valid_data.min()
+        max_val = valid_data.max()
+        q1_val = valid_data.quantile(0.25)
+        q3_val = valid_data.quantile(0.75)
+        iqr_val = q3_val - q1_val
+    else:
+        mean_val = median_val = min_val = max_val = q1_val = q3_val = iqr_val = np.nan
+
+    return {
+        'station': station,
+        'column': col,
+        'total_rows': total_rows,
+        'missing_count': missing_count,
+        'missing_percent': round(missing_pct, 2),
+        'original_data_count': imputed_0_original,
+        'interpolated_count': imputed_1_interpolated,
+        'calculated_count': imputed_2_calculated,
+        'total_imputed_count': total_imputed,
+        'imputation_percent': round((total_imputed / total_rows * 100) if total_rows > 0 else 0, 2),
+        'mean': round(mean_val, 2) if not np.isnan(mean_val) else np.nan,
+        'median': round(median_val, 2) if not np.isnan(median_val) else np.nan,
+        'min': round(min_val, 2) if not np.isnan(min_val) else np.nan,
+        'max': round(max_val, 2) if not np.isnan(max_val) else np.nan,
+        'q1': round(q1_val, 2) if not np.isnan(q1_val) else np.nan,
+        'q3': round(q3_val, 2) if not np.isnan(q3_val) else np.nan,
+        'iqr': round(iqr_val, 2) if not np.isnan(iqr_val) else np.nan,
+    }
+
+QUALITY_STATS = ['mean', 'median', 'min', 'max', 'q1', 'q3']
+
+def quantiles_from_sorted(ordered, starts, counts, q):
+    """Linearly interpolated q-quantile of each sorted run ordered[start:start + count]."""
+    last = counts - 1
+    position = last * q
+    below = np.floor(position).astype(np.intp)
+    above = np.minimum(below + 1, last)
+    lower, upper = ordered[starts + below], ordered[starts + above]
+    return lower + (upper - lower) * (position - below)
+
+def summarize_quality_stats(values, starts, stops, include_overall=True):
+    """
+    Count, mean, median, min, max and quartiles of every column per station block.
+
+    Rows are in StationLayout order, so each group owns values[starts[i]:stops[i]].
+    Every block of a column is sorted in place (NaN sorts last) and min, max,
+    median and the quartiles are read off it at the block's offset; counts
+    and sums are one reduceat over the block starts. The overall row reuses
+    the group counts and sums, so only its quartiles need another pass.
+    NaN is skipped, like the per-column dropna() it replaces.
+
+    Args:
+        values: DataFrame of data columns, rows grouped into contiguous blocks
+        starts: First row of each block (see StationLayout.starts)
+        stops: Row after the last row of each block (see StationLayout.stops)
+        include_overall: Append a row summarizing all groups together
+
+    Returns:
+        Tuple of (valid counts of shape (rows, n_columns), stats of shape
+        (rows, n_columns, len(QUALITY_STATS))), where rows is the number of
+        blocks plus one for the overall row
+    """
+    n_groups = len(starts)
+    n_rows = n_groups + include_overall
+    counts = np.zeros((n_rows, values.shape[1]), dtype=np.int64)
+    stats = np.full((n_rows, values.shape[1], len(QUALITY_STATS)), np.nan)
+    if n_groups == 0:
+        return counts, stats
+
+    for j, col in enumerate(values.columns):
+        ordered = np.array(values[col].to_numpy(dtype=np.float64, na_value=np.nan), dtype=np.float64)
+        valid = ~np.isnan(ordered)
+        n = np.add.reduceat(valid, starts, dtype=np.int64)
+        counts[:n_groups, j] = n
+        if not valid.any():
             continue
+        sums = np.add.reduceat(np.where(valid, ordered, 0.0), starts)
+
+        # Sorting each block in place puts its values first, in order
+        for start, stop in zip(starts, stops):
+            ordered[start:stop].sort()
+
+        has_values = n > 0
+        block_starts = starts[has_values]
+        sizes = n[has_values]
+        stats[:n_groups][has_values, j] = np.column_stack([
+            sums[has_values] / sizes,
+            quantiles_from_sorted(ordered, block_starts, sizes, 0.5),
+            ordered[block_starts],
+            ordered[block_starts + sizes - 1],
+            quantiles_from_sorted(ordered, block_starts, sizes, 0.25),
+            quantiles_from_sorted(ordered, block_starts, sizes, 0.75),
+        ])
+
+        if include_overall:
+            present = ordered[~np.isnan(ordered)]
+            q1, median, q3 = np.percentile(present, [25, 50, 75])
+            counts[n_groups, j] = present.size
+            stats[n_groups, j] = [sums.sum() / present.size, median, present.min(), present.max(), q1, q3]
+    return counts, stats
+
+def count_flags_by_group(flags, groups, n_groups):
+    """
+    Count (original, interpolated, calculated) flags per group.
 
-        total_rows = len(df)
-        missing_count = df[col].isnull().sum()
-        missing_pct = (missing_count / total_rows * 100) if total_rows > 0 else 0
+    Args:
+        flags: Imputation flag values (NaN where a partition had no flag)
+        groups: Per-row group ids in [0, n_groups)
+        n_groups: Number of groups
 
+    Returns:
+        Array of shape (n_groups, 3)
+    """
+    flags = np.asarray(flags)
+    known = (flags >= 0) & (flags <= 2)
+    if known.all():
+        cells = groups * 3 + flags
+    else:
+        cells = groups[known] * 3 + flags[known].astype(np.intp)
+    return np.bincount(cells, minlength=n_groups * 3).reshape(n_groups, 3)
+
+def gap_histogram_columns():
+    """Quality report columns of the gap-length histogram (CONFIG['GAP_HISTOGRAM_HOURS'])."""
+    edges = CONFIG['GAP_HISTOGRAM_HOURS']
+    bins = [f"gaps_upto_{edges[0]:g}h"]
+    bins += [f"gaps_{low:g}_{high:g}h" for low, high in zip(edges[:-1], edges[1:])]
+    bins.append(f"gaps_over_{edges[-1]:g}h")
+    return ['gap_count'] + bins + ['longest_gap_hours']
+
+def summarize_gaps(layout, data_cols, include_overall=True):
+    """
+    Gap-length histogram of every station and column.
+
+    Gaps come from the gap index (build_gap_index) of the values missing
+    before imputation, so after the one pass that finds them the histogram
+    costs one bincount over the gaps, not a scan per station and column.
+
+    Args:
+        layout: StationLayout of the weather data and imputation flags
+        data_cols: Columns to summarize
+        include_overall: Append a row summarizing all stations together
+
+    Returns:
+        Array of shape (rows, n_columns, len(gap_histogram_columns())), rows
+        as in summarize_quality_stats; gaps with an unknown length (NaT
+        timestamps) count towards gap_count only
+    """
+    index = build_gap_index(layout.df, data_cols, layout, originally_missing=True)
+    edges = np.asarray(CONFIG['GAP_HISTOGRAM_HOURS'], dtype=np.float64)
+    n_groups, n_cols, n_bins = len(layout), len(data_cols), len(edges) + 1
+
+    cells = (pd.Index(layout.stations).get_indexer(index['station']) * n_cols +
+             pd.Index(data_cols).get_indexer(index['variable']))
+    hours = index['hours'].to_numpy(dtype=np.float64)
+    known = ~np.isnan(hours)
+
+    summary = np.zeros((n_groups + include_overall, n_cols, n_bins + 2))
+    summary[:n_groups, :, 0] = np.bincount(cells, minlength=n_groups * n_cols).reshape(n_groups, n_cols)
+    bins = np.searchsorted(edges, hours[known], side='left')
+    summary[:n_groups, :, 1:n_bins + 1] = np.bincount(
+        cells[known] * n_bins + bins, minlength=n_groups * n_cols * n_bins).reshape(n_groups, n_cols, n_bins)
+    longest = np.full(n_groups * n_cols, np.nan)
+    np.fmax.at(longest, cells, hours)
+    summary[:n_groups, :, -1] = longest.reshape(n_groups, n_cols)
+
+    if include_overall:
+        summary[n_groups, :, :-1] = summary[:n_groups, :, :-1].sum(axis=0)
+        summary[n_groups, :, -1] = np.fmax.reduce(summary[:n_groups, :, -1], axis=0)
+    return summary
+
+def create_data_quality_csv(df, include_summary=True):
+    """
+    Create comprehensive data quality report CSV with statistics.
+
+    Shows missing values, imputation counts, statistical measures and a
+    gap-length histogram by station and column. Every station and column is
+    summarized in one vectorized pass per column instead of a
+    filter-and-describe per (station, column) pair.
+
+    Args:
+        df: DataFrame with weather data and imputation flags
+        include_summary: Add the ALL_STATIONS summary rows
+
+    Returns:
+        DataFrame with data quality metrics
+    """
+    logger.info("Creating data quality report with statistics...")
+
+    # Get all data columns (not imputation or QC flags)
+    data_cols = [c for c in df.columns 
+                if c not in ['Datetime_UTC', 'station', QC_FLAG_COLUMN]
+                and not c.endswith('_imputed')]
+
+    # Stations in sorted order, each one a contiguous block of rows
+    layout = StationLayout(df)
+    df = layout.df
+    codes = layout.row_blocks().astype(np.intp)
+    n_stations, n_cols = len(layout), len(data_cols)
+    names = list(layout.stations) + (['ALL_STATIONS'] if include_summary else [])
+    if not data_cols or not names:
+        logger.info("Data quality report complete: 0 rows")
+        return pd.DataFrame()
+
+    totals = layout.sizes
+    if include_summary:
+        totals = np.append(totals, len(df))
+    valid_counts, stats = summarize_quality_stats(df[data_cols], layout.starts, layout.stops, include_summary)
+    missing = totals[:, None] - valid_counts
+
+    flag_counts = np.zeros((len(names), n_cols, 3), dtype=np.int64)
+    for j, col in enumerate(data_cols):
         flag_col = f'{col}_imputed'
         if flag_col in df.columns:
-            imputed_0_original = (df[flag_col] == 0).sum()
-            imputed_1_interpolated = (df[flag_col] == 1).sum()
-            imputed_2_calculated = (df[flag_col] == 2).sum()
-            total_imputed = imputed_1_interpolated + imputed_2_calculated
-        else:
-            imputed_0_original = total_rows - missing_count
-            imputed_1_interpolated = 0
-            imputed_2_calculated = 0
-            total_imputed = 0
-
-        # Calculate statistics across all stations
-        valid_data = df[col].dropna()
-        if len(valid_data) > 0:
-            mean_val = valid_data.mean()
-            median_val = valid_data.median()
-            min_val = valid_data.min()
-            max_val = valid_data.max()
-            q1_val = valid_data.quantile(0.25)
-            q3_val = valid_data.quantile(0.75)
-            iqr_val = q3_val - q1_val
+            flag_counts[:n_stations, j] = count_flags_by_group(df[flag_col], codes, n_stations)
+            if include_summary:
+                flag_counts[n_stations, j] = flag_counts[:n_stations, j].sum(axis=0)
         else:
-            mean_val = median_val = min_val = max_val = q1_val = q3_val = iqr_val = np.nan
-
-        summary_rows.append({
-            'station': 'ALL_STATIONS',
-            'column': col,
-            'total_rows': total_rows,
-            'missing_count': missing_count,
-            'missing_percent': round(missing_pct, 2),
-            'original_data_count': imputed_0_original,
-            'interpolated_count': imputed_1_interpolated,
-            'calculated_count': imputed_2_calculated,
-            'total_imputed_count': total_imputed,
-            'imputation_percent': round((total_imputed / total_rows * 100) if total_rows > 0 else 0, 2),
-            'mean': round(mean_val, 2) if not np.isnan(mean_val) else np.nan,
-            'median': round(median_val, 2) if not np.isnan(median_val) else np.nan,
-            'min': round(min_val, 2) if not np.isnan(min_val) else np.nan,
-            'max': round(max_val, 2) if not np.isnan(max_val) else np.nan,
-            'q1': round(q1_val, 2) if not np.isnan(q1_val) else np.nan,
-            'q3': round(q3_val, 2) if not np.isnan(q3_val) else np.nan,
-            'iqr': round(iqr_val, 2) if not np.isnan(iqr_val) else np.nan,
-        })
-
-    summary_df = pd.DataFrame(summary_rows)
-
-    # Combine station-specific and summary data
-    quality_df = pd.DataFrame(report_rows)
-    quality_df = pd.concat([quality_df, summary_df], ignore_index=True)
+            # No flag column: every present value counts as original
+            flag_counts[:, j, 0] = valid_counts[:, j]
+
+    total_rows = np.repeat(totals, n_cols)
+    imputed = flag_counts[:, :, 1:].sum(axis=2).ravel()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        missing_pct = np.where(total_rows > 0, missing.ravel() / total_rows * 100, 0)
+        imputed_pct = np.where(total_rows > 0, imputed / total_rows * 100, 0)
+
+    quality_df = pd.DataFrame({
+        'station': np.repeat(np.array(names, dtype=object), n_cols),
+        'column': np.tile(np.array(data_cols, dtype=object), len(names)),
+        'total_rows': total_rows,
+        'missing_count': missing.ravel(),
+        'missing_percent': np.round(missing_pct, 2),
+        'original_data_count': flag_counts[:, :, 0].ravel(),
+        'interpolated_count': flag_counts[:, :, 1].ravel(),
+        'calculated_count': flag_counts[:, :, 2].ravel(),
+        'total_imputed_count': imputed,
+        'imputation_percent': np.round(imputed_pct, 2),
+    })
+    for k, stat in enumerate(QUALITY_STATS):
+        quality_df[stat] = stats[:, :, k].ravel()
+    quality_df['iqr'] = quality_df['q3'] - quality_df['q1']
+    quality_df[QUALITY_STATS + ['iqr']] = quality_df[QUALITY_STATS + ['iqr']].round(2)
+
+    gaps = summarize_gaps(layout, data_cols, include_summary)
+    for k, name in enumerate(gap_histogram_columns()):
+        values = gaps[:, :, k].ravel()
+        quality_df[name] = values.round(2) if name == 'longest_gap_hours' else values.astype(np.int64)
 
     logger.info(f"Data quality report complete: {len(quality_df)} rows")
 
@@ -550,6 +2185,141 @@ def create_data_quality_csv(df):
 # DATA PROCESSING
 # ============================================================================
 
+def assembled_dtype(column, dtypes, complete, schema=True):
+    """
+    Output dtype of one column when source frames are stacked.
+
+    Args:
+        column: Column name
+        dtypes: Dtypes of the column in the frames that have it
+        complete: Whether every frame has the column
+        schema: Apply VARIABLE_DTYPES; False gives the dtype pd.concat would
+            pick (used to report what preallocation saves)
+
+    Returns:
+        numpy dtype to preallocate, or None if the column needs pd.concat
+        (extension dtypes, mixed datetimes)
+    """
+    if schema and column in VARIABLE_DTYPES:
+        return np.dtype(VARIABLE_DTYPES[column])
+    if any(not isinstance(dtype, np.dtype) for dtype in dtypes):
+        return None
+
+    kinds = {dtype.kind for dtype in dtypes}
+    if kinds <= set('iuf'):
+        dtype = np.result_type(*dtypes)
+        # Rows from frames without the column are NaN
+        return dtype if complete or dtype.kind == 'f' else np.dtype('float64')
+    if kinds == {'b'} and complete:
+        return np.dtype(bool)
+    if kinds == {'M'} and len(set(dtypes)) == 1:
+        return dtypes[0]
+    if kinds == {'M'} or 'm' in kinds:
+        return None
+    return np.dtype(object)
+
+def assemble_frames(frames):
+    """
+    Stack cleaned source frames into one preallocated frame.
+
+    Replaces pd.concat over heterogeneous frames: the output columns (union
+    in encounter order, as concat gives) and each column's dtype are fixed
+    first, then every frame's values are copied into the output arrays at its
+    row offset. Canonical variables are always VARIABLE_DTYPES, so one file
+    with text in a numeric column doesn't turn the whole column into objects,
+    and station is built directly as a category.
+
+    Args:
+        frames: List of cleaned dataframes (see clean_columns)
+
+    Returns:
+        Combined dataframe with a RangeIndex
+    """
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return pd.DataFrame()
+
+    started = time.perf_counter()
+    columns = []
+    dtypes = {}
+    for frame in frames:
+        ordered_union(columns, frame.columns)
+        for column, dtype in frame.dtypes.items():
+            dtypes.setdefault(column, []).append(dtype)
+    offsets = np.cumsum([0] + [len(frame) for frame in frames])
+    total = int(offsets[-1])
+
+    # Output arrays, allocated once and filled with each column's missing value
+    arrays = {}
+    fallback = []
+    concat_bytes = 0
+    for column in columns:
+        complete = len(dtypes[column]) == len(frames)
+        concat_dtype = assembled_dtype(column, dtypes[column], complete, schema=False)
+        concat_bytes += total * (concat_dtype.itemsize if concat_dtype is not None else 8)
+        if column == 'station':
+            continue
+        dtype = assembled_dtype(column, dtypes[column], complete)
+        if dtype is None:
+            fallback.append(column)
+        elif dtype.kind in 'fO':
+            arrays[column] = np.full(total, np.nan, dtype=dtype)
+        elif dtype.kind == 'M':
+            arrays[column] = np.full(total, np.datetime64('NaT'), dtype=dtype)
+        else:
+            arrays[column] = np.empty(total, dtype=dtype)
+
+    # Station codes in encounter order, sorted once at the end; frames are usually one station
+    stations = {}
+    station_codes = np.full(total, -1, dtype=np.int32) if 'station' in columns else None
+    coerced = {}
+    for frame, start, stop in zip(frames, offsets[:-1], offsets[1:]):
+        for column, values in frame.items():
+            if column == 'station':
+                local_codes, uniques = pd.factorize(values.to_numpy())
+                mapping = [stations.setdefault(str(name), len(stations)) for name in uniques]
+                station_codes[start:stop] = np.array(mapping + [-1], dtype=np.int32)[local_codes]
+                continue
+            out = arrays.get(column)
+            if out is None:
+                continue
+            if column in VARIABLE_DTYPES and not pd.api.types.is_numeric_dtype(values):
+                numeric = pd.to_numeric(values, errors='coerce')
+                coerced[column] = coerced.get(column, 0) + int(numeric.isna().sum() - values.isna().sum())
+                values = numeric
+            if out.dtype.kind == 'f':
+                out[start:stop] = values.to_numpy(dtype=out.dtype, na_value=np.nan)
+            else:
+                out[start:stop] = values.to_numpy(dtype=out.dtype)
+
+    data = {column: pd.Series(values, dtype=values.dtype, copy=False)
+            for column, values in arrays.items()}
+    for column in fallback:
+        parts = [frame[column] if column in frame.columns else pd.Series(np.nan, index=range(len(frame)))
+                 for frame in frames]
+        data[column] = pd.concat(parts, ignore_index=True)
+    if station_codes is not None:
+        names = np.array(list(stations), dtype=object)
+        order = np.argsort(names)
+        rank = np.empty(len(names) + 1, dtype=np.int32)
+        rank[order] = np.arange(len(names))
+        rank[-1] = -1
+        data['station'] = pd.Series(pd.Categorical.from_codes(rank[station_codes], categories=names[order]),
+                                    copy=False)
+
+    combined = pd.DataFrame(data, columns=columns, copy=False)
+
+    elapsed = time.perf_counter() - started
+    assembled_mb = combined.memory_usage().sum() / 1e6
+    logger.info(f"Assembled {len(frames)} frames into {total:,} rows x {len(columns)} columns "
+                f"({assembled_mb:.1f} MB) in {elapsed:.2f}s; pd.concat would have built "
+                f"{concat_bytes / 1e6:.1f} MB before dtype repair")
+    for column, count in coerced.items():
+        if count:
+            logger.info(f"  {column}: {count:,} non-numeric values read as NaN")
+
+    return combined
+
 def merge_duplicate_columns(df):
     """Merge duplicate numeric columns."""
     numeric_cols = df.select_dtypes(include='number').columns
@@ -570,11 +2340,142 @@ def merge_duplicate_columns(df):
 
     return df
 
+# Logger timestamp layouts tried when a station's first value can't be guessed
+DATETIME_FORMATS = [
+    '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M', '%m/%d/%y %I:%M:%S %p', '%m/%d/%y %H:%M:%S',
+    '%m/%d/%y %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M:%S',
+    '%d/%m/%Y %H:%M:%S', '%d/%m/%Y %H:%M',
+]
+
+def infer_datetime_format(values, sample_size=500):
+    """
+    Pick the strftime format that parses the most of a sample of strings.
+
+    Args:
+        values: Series of datetime strings from one source
+        sample_size: Number of distinct values checked, spread evenly
+
+    Returns:
+        Format string, or None if no candidate parses any sampled value
+    """
+    unique = values.dropna().unique()
+    if len(unique) == 0:
+        return None
+    # Spread the sample over the whole source so day-first dates past the
+    # 12th rule out month-first layouts
+    step = max(len(unique) // sample_size, 1)
+    sample = pd.Series(unique[::step][:sample_size])
+
+    candidates = list(DATETIME_FORMATS)
+    guessed = guess_datetime_format(sample.iloc[0]) if guess_datetime_format else None
+    if guessed:
+        candidates.insert(0, guessed)
+
+    best_format, best_count = None, 0
+    for fmt in candidates:
+        count = pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum()
+        if count > best_count:
+            best_format, best_count = fmt, count
+        if count == len(sample):
+            break
+    return best_format
+
+def get_time_zone(station):
+    """Time zone of a station's local timestamps (None = already UTC)."""
+    zone = CONFIG['LOCAL_TIME_ZONES'].get(station)
+    if zone is None or isinstance(zone, str):
+        return zone
+    return timezone(timedelta(hours=zone))
+
+def parse_station_datetimes(values, stations, label, utc_offsets=None):
+    """
+    Parse timestamps with one inferred format per station.
+
+    Each station's strings are parsed vectorized with the format inferred
+    from a sample; only rows that don't match it go through the slow
+    per-element parser. Rows with a UTC offset from their file's header are
+    shifted by it; otherwise stations listed in CONFIG['LOCAL_TIME_ZONES']
+    are localized to their zone and converted to UTC, and all others are
+    taken as UTC.
+
+    Args:
+        values: Series of datetime strings (or naive datetimes)
+        stations: Series of station names aligned with values
+        label: Column description for the log
+        utc_offsets: Optional Series of header UTC offsets in hours aligned
+            with values (NaN where the header had none)
+
+    Returns:
+        Series of tz-aware UTC timestamps (NaT where unparseable)
+    """
+    started = time.perf_counter()
+    parsed = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]')
+    fallback_rows = failed_rows = 0
+    formats = {}
+    header_offsets = {}
+
+    for station, positions in stations.groupby(stations, observed=True, sort=False).indices.items():
+        group = values.iloc[positions]
+        if group.isna().all():
+            continue
+        if pd.api.types.is_datetime64_any_dtype(group):
+            naive = group.dt.tz_localize(None) if group.dt.tz is not None else group
+            formats[station] = 'native'
+        else:
+            group = group.astype('string')
+            fmt = infer_datetime_format(group)
+            formats[station] = fmt
+            naive = (pd.to_datetime(group, format=fmt, errors='coerce') if fmt
+                     else pd.Series(pd.NaT, index=group.index, dtype='datetime64[ns]'))
+            unmatched = naive.isna() & group.notna()
+            if unmatched.any():
+                # Slow path only for rows that don't match the station's format
+                fallback_rows += int(unmatched.sum())
+                naive = naive.astype('datetime64[ns]')
+                naive[unmatched] = pd.to_datetime(group[unmatched], format='mixed', errors='coerce').astype('datetime64[ns]')
+            failed_rows += int((naive.isna() & group.notna()).sum())
+
+        zone = get_time_zone(station)
+        if zone is None:
+            utc = naive.dt.tz_localize('UTC')
+        else:
+            utc = naive.dt.tz_localize(zone, ambiguous='NaT', nonexistent='shift_forward').dt.tz_convert('UTC')
+            failed_rows += int((utc.isna() & naive.notna()).sum())
+        utc = utc.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+
+        if utc_offsets is not None:
+            # The file's own header offset wins over the station's configured zone
+            hours = utc_offsets.iloc[positions].to_numpy(dtype=np.float64, na_value=np.nan)
+            has_offset = ~np.isnan(hours)
+            if has_offset.any():
+                naive_values = naive.to_numpy(dtype='datetime64[ns]')
+                shift = (hours[has_offset] * 3_600_000_000_000).round().astype('timedelta64[ns]')
+                utc[has_offset] = naive_values[has_offset] - shift
+                header_offsets.setdefault(station, set()).update(np.unique(hours[has_offset]).tolist())
+        parsed[positions] = utc
+
+    elapsed = time.perf_counter() - started
+    rate = len(values) / elapsed if elapsed > 0 else float('inf')
+    logger.info(f"Parsed {label}: {len(values):,} rows in {elapsed:.2f}s ({rate:,.0f} rows/s), "
+                f"{fallback_rows:,} rows needed the slow parser, {failed_rows:,} unparseable")
+    for station, fmt in formats.items():
+        zone = CONFIG['LOCAL_TIME_ZONES'].get(station)
+        offsets = ", ".join(f"{hours:+g}h" for hours in sorted(header_offsets.get(station, ())))
+        logger.info(f"  {station or 'source'}: format {fmt}" + (f", local time {zone}" if zone is not None else "")
+                    + (f", header UTC offset {offsets}" if offsets else ""))
+    return pd.Series(parsed, index=values.index).dt.tz_localize('UTC')
+
 def process_datetime_columns(df):
     """Process and standardize datetime columns."""
+    stations = df['station'] if 'station' in df.columns else pd.Series('', index=df.index)
+    utc_offsets = None
+    if UTC_OFFSET_COLUMN in df.columns:
+        utc_offsets = df[UTC_OFFSET_COLUMN]
+        df = df.drop(columns=[UTC_OFFSET_COLUMN])
+
     # Handle Date/Time column from ECCC
     if 'Date/Time' in df.columns:
-        date_time_parsed = pd.to_datetime(df['Date/Time'], utc=True, errors='coerce')
+        date_time_parsed = parse_station_datetimes(df['Date/Time'], stations, 'Date/Time', utc_offsets)
 
         if 'Datetime_UTC' in df.columns:
             df['Datetime_UTC'] = df['Datetime_UTC'].fillna(date_time_parsed)
@@ -593,8 +2494,10 @@ def process_datetime_columns(df):
 
     if date_cols and time_cols:
         date_col, time_col = date_cols[0], time_cols[0]
-        datetime_combined = df[date_col].astype(str) + ' ' + df[time_col].astype(str)
-        temp_datetime = pd.to_datetime(datetime_combined, utc=True, errors='coerce')
+        # Missing dates or times stay missing instead of becoming 'nan' text
+        datetime_combined = df[date_col].astype('string') + ' ' + df[time_col].astype('string')
+        temp_datetime = parse_station_datetimes(datetime_combined, stations,
+                                                f"{date_col} + {time_col}", utc_offsets)
 
         if 'Datetime_UTC' in df.columns:
             df['Datetime_UTC'] = df['Datetime_UTC'].fillna(temp_datetime)
@@ -608,8 +2511,125 @@ def process_datetime_columns(df):
 
     return df
 
-def clean_weather_data(df):
-    """Apply all cleaning operations to weather data."""
+def update_column_profile(profile, df):
+    """
+    Record up to two distinct non-null values per column.
+
+    Merging profiles across partitions tells whether a column is constant
+    (or all-NaN) over the whole dataset without holding it in memory.
+
+    Args:
+        profile: Dict of column -> set of sample values (updated in place)
+        df: DataFrame (or partition) to profile
+    """
+    for col in df.columns:
+        if col in ['station', 'Datetime_UTC']:
+            continue
+        values = profile.setdefault(col, set())
+        if len(values) < 2:
+            values.update(df[col].dropna().unique()[:2].tolist())
+
+def constant_columns_from_profile(profile):
+    """Columns with at most one distinct value across everything profiled."""
+    return [col for col, values in profile.items() if len(values) <= 1]
+
+DUPLICATE_POLICIES = ['exact', 'first', 'most_complete', 'mean']
+
+def exact_duplicate_rows(df):
+    """
+    Mask of rows that repeat an earlier identical row.
+
+    Every row is hashed once and only the rows whose hash repeats are
+    compared, so the full-row comparison runs on a handful of candidates.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False)
+    candidates = row_hashes.duplicated(keep=False).to_numpy()
+    # Hash collisions are possible, so confirm on the few candidate rows
+    drop = np.zeros(len(df), dtype=bool)
+    drop[candidates] = df[candidates].duplicated(keep='first').to_numpy()
+    return drop
+
+def deduplicate_rows(df, policy='exact'):
+    """
+    Remove duplicate rows in a single pass.
+
+    'exact' hashes every row once and only compares the rows whose hash
+    repeats, dropping later copies of identical rows (the previous
+    behaviour). The other policies key rows on (station, Datetime_UTC), so
+    overlapping exports that disagree still collapse to one row per time:
+    'first' keeps the first row, 'most_complete' the row with the most
+    values (first on ties) and 'mean' averages numeric values, using a
+    circular mean for wind direction and the first value for text.
+    Rows without a timestamp are never merged by key; identical copies of
+    them are dropped as under 'exact', so no policy keeps more than 'exact'.
+
+    Args:
+        df: Cleaned dataframe with station and Datetime_UTC
+        policy: One of DUPLICATE_POLICIES
+
+    Returns:
+        Tuple of (deduplicated dataframe, Series of rows removed per station)
+    """
+    if policy not in DUPLICATE_POLICIES:
+        raise ValueError(f"Unknown DUPLICATE_POLICY {policy!r}; use one of {DUPLICATE_POLICIES}")
+
+    if policy == 'exact':
+        drop = exact_duplicate_rows(df)
+    else:
+        keys = df.groupby(['station', 'Datetime_UTC'], sort=False, observed=True, dropna=True).ngroup()
+        keys = keys.to_numpy()
+        has_key = keys >= 0
+        drop = np.zeros(len(df), dtype=bool)
+        drop[has_key] = pd.Series(keys[has_key]).duplicated(keep='first').to_numpy()
+        if not has_key.all():
+            drop[~has_key] = exact_duplicate_rows(df[~has_key])
+        conflicted = has_key & pd.Series(keys).duplicated(keep=False).to_numpy()
+
+        if policy != 'first' and conflicted.any():
+            positions = np.flatnonzero(conflicted)
+            group_ids = keys[positions]
+            rows = df.iloc[positions]
+
+            if policy == 'most_complete':
+                filled = rows.notna().sum(axis=1).to_numpy()
+                # Per key: most values first, then earliest row
+                order = np.lexsort((positions, -filled, group_ids))
+                winners = positions[order][np.r_[True, group_ids[order][1:] != group_ids[order][:-1]]]
+                drop[positions] = True
+                drop[winners] = False
+            else:
+                # Merged values go into the first row of each key
+                first_rows = positions[~pd.Series(group_ids).duplicated().to_numpy()]
+                grouped = rows.groupby(group_ids, sort=False)
+                float_cols = [c for c in rows.columns if pd.api.types.is_float_dtype(rows[c])]
+                other_cols = [c for c in rows.columns
+                              if c not in float_cols and c not in ['station', 'Datetime_UTC']]
+                merged = pd.concat([grouped[float_cols].mean(), grouped[other_cols].first()], axis=1)
+                if 'Wind Direction' in float_cols:
+                    merged['Wind Direction'] = circular_mean_by_group(rows, group_ids, 'Wind Direction')['Wind Direction']
+                df = df.copy()
+                for col in float_cols:
+                    # Means come back as float64; cast so float32 variables keep their dtype
+                    df.iloc[first_rows, df.columns.get_loc(col)] = merged[col].to_numpy(dtype=df[col].dtype)
+                for col in other_cols:
+                    df.iloc[first_rows, df.columns.get_loc(col)] = merged[col].to_numpy()
+
+    removed = df['station'][drop].value_counts()
+    removed = removed[removed > 0]
+    if not drop.any():
+        return df, removed
+    return df[~drop].reset_index(drop=True), removed
+
+def clean_weather_data(df, drop_constant_columns=True):
+    """
+    Apply all cleaning operations to weather data.
+
+    Args:
+        df: Combined raw dataframe
+        drop_constant_columns: Drop zero-variance/all-NaN columns. Incremental
+            and streaming runs disable this so a partition keeps the full
+            output schema.
+    """
     logger.info("Starting data cleaning...")
 
     # Merge duplicates
@@ -634,25 +2654,17 @@ def clean_weather_data(df):
     # DUPLICATE REMOVAL (NEW IN VERSION 2.6)
     # ============================================================================
 
-    # Count duplicates before removal
-    dup_count_before = df.duplicated().sum()
-
-    if dup_count_before > 0:
-        logger.info(f"\nFound {dup_count_before:,} duplicate rows ({dup_count_before/len(df)*100:.1f}%)")
+    # One pass finds, counts (per station) and removes duplicates
+    rows_before = len(df)
+    df, removed_by_station = deduplicate_rows(df, CONFIG['DUPLICATE_POLICY'])
+    rows_removed = rows_before - len(df)
 
-        # Show duplicates by station
-        dup_mask = df.duplicated(keep=False)
-        if dup_mask.sum() > 0:
-            dup_by_station = df[dup_mask].groupby('station').size()
-            logger.info("Duplicates by station:")
-            for station, count in dup_by_station.items():
-                logger.info(f"  {station}: {count:,} rows")
-
-        # Remove duplicates (keep first occurrence)
-        df = df.drop_duplicates(keep='first')
-
-        rows_removed = dup_count_before
-        logger.info(f"Removed {rows_removed:,} duplicate rows (kept first occurrence)")
+    if rows_removed > 0:
+        logger.info(f"\nFound {rows_removed:,} duplicate rows ({rows_removed/rows_before*100:.1f}%), "
+                    f"policy '{CONFIG['DUPLICATE_POLICY']}'")
+        logger.info("Duplicates removed by station:")
+        for station, count in removed_by_station.items():
+            logger.info(f"  {station}: {count:,} rows")
         logger.info(f"Rows after duplicate removal: {len(df):,}")
     else:
         logger.info("\nNo duplicate rows found")
@@ -661,31 +2673,223 @@ def clean_weather_data(df):
     # END DUPLICATE REMOVAL
     # ============================================================================
 
-    # Reorder columns
-    if 'Datetime_UTC' in df.columns:
-        other_cols = [col for col in df.columns if col not in ['Datetime_UTC', 'station']]
-        col_order = ['Datetime_UTC', 'station'] + other_cols
-        df = df[col_order]
+    # Reorder columns
+    if 'Datetime_UTC' in df.columns:
+        other_cols = [col for col in df.columns if col not in ['Datetime_UTC', 'station']]
+        col_order = ['Datetime_UTC', 'station'] + other_cols
+        df = df[col_order]
+
+    # Drop zero variance columns
+    if drop_constant_columns:
+        zero_var_cols = (df.nunique() == 1) | df.isnull().all()
+        df = df.drop(columns=df.columns[zero_var_cols])
+
+    # Optimize dtypes (columns outside the read-time schema)
+    int_cols = df.select_dtypes(include=['int64']).columns
+    df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast='integer')
+    float_cols = df.select_dtypes(include=['float64']).columns
+    df[float_cols] = df[float_cols].apply(pd.to_numeric, downcast='float')
+    df['station'] = df['station'].astype(STATION_DTYPE)
+
+    logger.info("Data cleaning complete")
+
+    return df
+
+# ============================================================================
+# QUALITY CONTROL
+# ============================================================================
+
+# Bit-packed QC results: variable i of QC_VARIABLES owns bits 4*i .. 4*i+3,
+# one per test in QC_TESTS order ('step' covers steps and single-reading spikes)
+QC_FLAG_COLUMN = 'QC_Flags'
+QC_FLAG_DTYPE = 'uint32'
+QC_VARIABLES = list(VARIABLE_DTYPES)
+QC_TESTS = ['range', 'step', 'flatline', 'consistency']
+
+# Plausible values per variable; strings are CONFIG keys
+QC_RANGES = {
+    'Temperature': ('TEMP_MIN', 'TEMP_MAX'),
+    'Rh': ('RH_MIN', 'RH_MAX'),
+    'Dew': ('DEW_MIN', 'DEW_MAX'),
+    'Wind Speed': (0, 200),
+    'Wind Gust Speed': (0, 250),
+    'Wind Direction': (0, 360),
+    'Rain': (0, 100),
+}
+
+# Largest plausible change between consecutive readings up to
+# QC_STEP_MAX_GAP_HOURS apart (wind direction and rain change freely)
+QC_STEP_LIMITS = {
+    'Temperature': 10.0,
+    'Dew': 10.0,
+    'Rh': 50.0,
+    'Wind Speed': 60.0,
+    'Wind Gust Speed': 80.0,
+}
+QC_STEP_MAX_GAP_HOURS = 1
+
+# Hours a reading may repeat exactly before the sensor counts as stuck
+# (Rh sits at 100% through long fog, so it is not tested)
+QC_FLATLINE_HOURS = {
+    'Temperature': 6,
+    'Dew': 6,
+}
+
+# Dew point may exceed temperature by sensor tolerance only (°C)
+QC_DEW_TOLERANCE = 0.5
+
+def qc_bit(variable, test):
+    """Bit mask of one QC test for one variable in the QC_Flags column."""
+    return 1 << (4 * QC_VARIABLES.index(variable) + QC_TESTS.index(test))
+
+def decode_qc_flags(flags):
+    """
+    Unpack a QC_Flags column into one boolean column per failed variable/test.
+
+    Returns:
+        DataFrame with '<variable> <test>' columns for bits that are set anywhere
+    """
+    flags = np.asarray(flags, dtype=np.uint32)
+    decoded = {}
+    for variable in QC_VARIABLES:
+        for test in QC_TESTS:
+            hits = (flags & qc_bit(variable, test)) != 0
+            if hits.any():
+                decoded[f'{variable} {test}'] = hits
+    return pd.DataFrame(decoded)
+
+def step_spike_mask(values, times, same_block, limit):
+    """
+    Flag readings that jump by more than limit from the previous reading.
+
+    A reading that jumps away and straight back (a spike) is flagged alone;
+    otherwise the first reading after a step is flagged.
+
+    Args:
+        values: float64 array in station/time order (NaN = missing)
+        times: int64 ns timestamps
+        same_block: same_block[i] is True if rows i and i+1 are one station
+        limit: Largest plausible change
+
+    Returns:
+        Boolean array
+    """
+    n = len(values)
+    diffs = np.diff(values)
+    gaps_ok = same_block & (np.diff(times) <= QC_STEP_MAX_GAP_HOURS * 3_600_000_000_000)
+    jump = np.zeros(n + 1, dtype=bool)  # jump[i]: rows i-1 -> i changed too much
+    with np.errstate(invalid='ignore'):
+        jump[1:n] = gaps_ok & (np.abs(diffs) > limit)
+    rising = np.zeros(n + 1, dtype=bool)
+    rising[1:n] = diffs > 0
+
+    spike = jump[:n] & jump[1:] & (rising[:n] != rising[1:])
+    step = jump[:n] & ~spike
+    step[1:] &= ~spike[:-1]
+    return spike | step
+
+def flatline_mask(values, times, same_block, hours):
+    """
+    Flag runs of identical readings lasting at least `hours` in one station.
+
+    Args:
+        values: float64 array in station/time order (NaN = missing)
+        times: int64 ns timestamps
+        same_block: same_block[i] is True if rows i and i+1 are one station
+        hours: Minimum run duration
 
-    # Drop zero variance columns
-    zero_var_cols = (df.nunique() == 1) | df.isnull().all()
-    df = df.drop(columns=df.columns[zero_var_cols])
+    Returns:
+        Boolean array
+    """
+    n = len(values)
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    repeats = same_block & (values[1:] == values[:-1])
+    run_starts = np.flatnonzero(np.r_[True, ~repeats])
+    run_stops = np.r_[run_starts[1:], n]
+    durations = times[run_stops - 1] - times[run_starts]
+    stuck = (run_stops - run_starts > 1) & (durations >= hours * 3_600_000_000_000)
+    return np.repeat(stuck, run_stops - run_starts) & ~np.isnan(values)
+
+def apply_quality_control(df):
+    """
+    Vectorized QC of the weather variables, run before imputation.
 
-    # Replace 'ERROR' strings with NaN
-    error_mask = df == 'ERROR'
-    num_errors = error_mask.sum().sum()
-    if num_errors > 0:
-        df[error_mask] = pd.NA
-        logger.info(f"Replaced {num_errors} 'ERROR' values with NaN")
+    Tests every variable in QC_VARIABLES over all station blocks at once
+    (StationLayout): range checks (QC_RANGES), step/spike tests on
+    consecutive readings (QC_STEP_LIMITS), stuck-sensor flat lines
+    (QC_FLATLINE_HOURS) and Dew <= Temperature. Failed readings become NaN
+    so imputation can fill short gaps, except Rh outside its range, which is
+    clipped (saturation overshoot). Results go to the bit-packed QC_Flags
+    column (see qc_bit and decode_qc_flags); flags already present, e.g. on
+    incremental context rows, are kept.
 
-    # Optimize dtypes
-    int_cols = df.select_dtypes(include=['int64']).columns
-    df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast='integer')
-    float_cols = df.select_dtypes(include=['float64']).columns
-    df[float_cols] = df[float_cols].apply(pd.to_numeric, downcast='float')
-    df['station'] = df['station'].astype('category')
+    Args:
+        df: Cleaned dataframe with station and Datetime_UTC
 
-    logger.info("Data cleaning complete")
+    Returns:
+        DataFrame in station/time order with QC_Flags added
+    """
+    layout = StationLayout(df)
+    df = layout.df if layout.resorted else layout.df.reset_index(drop=True)
+    n = len(df)
+
+    flags = np.zeros(n, dtype=QC_FLAG_DTYPE)
+    if QC_FLAG_COLUMN in df.columns:
+        flags |= df[QC_FLAG_COLUMN].fillna(0).to_numpy().astype(QC_FLAG_DTYPE)
+
+    times_dt = df['Datetime_UTC']
+    times = times_dt.to_numpy(dtype='datetime64[ns]').view('i8')
+    has_time = times_dt.notna().to_numpy()
+    codes = layout.row_blocks()
+    same_block = (codes[1:] == codes[:-1]) & has_time[1:] & has_time[:-1]
+
+    counts = {}
+    values = {}
+    for variable in QC_VARIABLES:
+        if variable not in df.columns:
+            continue
+        x = df[variable].to_numpy(dtype=np.float64, na_value=np.nan)
+        failed = {}
+
+        low, high = (CONFIG[b] if isinstance(b, str) else b for b in QC_RANGES[variable])
+        with np.errstate(invalid='ignore'):
+            failed['range'] = (x < low) | (x > high)
+        if variable == 'Rh':
+            x = np.clip(x, low, high)
+        else:
+            x[failed['range']] = np.nan
+
+        if variable in QC_STEP_LIMITS:
+            failed['step'] = step_spike_mask(x, times, same_block, QC_STEP_LIMITS[variable])
+        if variable in QC_FLATLINE_HOURS:
+            failed['flatline'] = flatline_mask(x, times, same_block, QC_FLATLINE_HOURS[variable])
+        for test in ('step', 'flatline'):
+            if test in failed:
+                x[failed[test]] = np.nan
+
+        for test, mask in failed.items():
+            if mask.any():
+                flags[mask] |= np.uint32(qc_bit(variable, test))
+                counts[(variable, test)] = int(mask.sum())
+        values[variable] = x
+
+    if 'Dew' in values and 'Temperature' in values:
+        with np.errstate(invalid='ignore'):
+            inconsistent = values['Dew'] > values['Temperature'] + QC_DEW_TOLERANCE
+        if inconsistent.any():
+            values['Dew'][inconsistent] = np.nan
+            flags[inconsistent] |= np.uint32(qc_bit('Dew', 'consistency'))
+            counts[('Dew', 'consistency')] = int(inconsistent.sum())
+
+    for variable, x in values.items():
+        df[variable] = x.astype(df[variable].dtype, copy=False)
+    df[QC_FLAG_COLUMN] = flags
+
+    flagged = int(np.count_nonzero(flags))
+    logger.info(f"Quality control: {flagged:,} of {n:,} rows flagged ({QC_FLAG_COLUMN})")
+    for (variable, test), count in counts.items():
+        logger.info(f"  {variable} {test}: {count:,} readings")
 
     return df
 
@@ -720,20 +2924,184 @@ def calculate_rh_from_temp_dew(temp, dew):
     except (ValueError, TypeError, ZeroDivisionError, OverflowError):
         return np.nan
 
-def impute_missing_values(df):
+def find_gaps(missing, times, starts, stops):
+    """
+    Run-length table of the missing runs of one column.
+
+    Runs never cross a station block. A gap's length is the time between the
+    valid readings on either side of it, so it does not depend on the
+    station's logging interval. Gaps at the start or end of a block are
+    measured from the one valid reading they touch to their far end, and a
+    block with no valid reading at all from its first to its last timestamp.
+
+    Args:
+        missing: Per-row boolean mask in station/time order
+        times: Per-row float64 timestamps (ns since epoch, NaN for NaT)
+        starts: First row of every station block (StationLayout.starts)
+        stops: One past the last row of every station block
+
+    Returns:
+        Dict of per-gap arrays: 'block', 'first' (first missing row), 'stop'
+        (one past the last), 'before'/'after' (a valid reading precedes/follows
+        the gap in its block) and 'hours' (NaN if a timestamp is NaT)
+    """
+    missing = np.asarray(missing, dtype=bool)
+    if not missing.any():
+        empty = np.zeros(0, dtype=np.intp)
+        return {'block': empty, 'first': empty, 'stop': empty, 'before': empty.astype(bool),
+                'after': empty.astype(bool), 'hours': empty.astype(np.float64)}
+
+    n = len(missing)
+    block_first = np.zeros(n, dtype=bool)
+    block_first[starts] = True
+    block_last = np.zeros(n, dtype=bool)
+    block_last[stops - 1] = True
+
+    first = np.flatnonzero(missing & (block_first | ~np.r_[False, missing[:-1]]))
+    stop = np.flatnonzero(missing & (block_last | ~np.r_[missing[1:], False])) + 1
+    block = np.searchsorted(stops, first, side='right')
+    before = first > starts[block]
+    after = stop < stops[block]
+
+    # Measure between the bracketing valid readings where there are any
+    low = np.where(before, first - 1, first)
+    high = np.where(after, stop, stop - 1)
+    hours = (times[high] - times[low]) / 3_600_000_000_000
+    return {'block': block, 'first': first, 'stop': stop, 'before': before, 'after': after, 'hours': hours}
+
+def build_gap_index(df, columns, layout, originally_missing=False):
+    """
+    Gap index of a station/time ordered frame: one row per missing run per
+    station and column (see find_gaps).
+
+    Args:
+        df: DataFrame in layout order (layout.df)
+        columns: Columns to index
+        layout: StationLayout of df
+        originally_missing: Also count values filled by imputation (nonzero
+            *_imputed flag), so the index describes the gaps imputation saw
+
+    Returns:
+        DataFrame with station, variable, start/end (first and last missing
+        timestamp), rows and hours
+    """
+    times = df['Datetime_UTC'].to_numpy(dtype='datetime64[ns]')
+    time_values = np.where(np.isnat(times), np.nan, times.view('i8').astype(np.float64))
+    stations = np.array(layout.stations, dtype=object)
+
+    tables = []
+    for col in columns:
+        missing = df[col].isnull().to_numpy()
+        flag_col = f'{col}_imputed'
+        if originally_missing and flag_col in df.columns:
+            missing |= df[flag_col].to_numpy(dtype=np.float64, na_value=0) != 0
+        gaps = find_gaps(missing, time_values, layout.starts, layout.stops)
+        tables.append(pd.DataFrame({
+            'station': stations[gaps['block']],
+            'variable': col,
+            'start': times[gaps['first']],
+            'end': times[gaps['stop'] - 1],
+            'rows': gaps['stop'] - gaps['first'],
+            'hours': gaps['hours'],
+        }))
+
+    if not tables:
+        return pd.DataFrame(columns=['station', 'variable', 'start', 'end', 'rows', 'hours'])
+    return pd.concat(tables, ignore_index=True)
+
+def interpolate_time_segments(values, times, blocks, gaps, fill_allowed, limit_hours):
+    """
+    Time-weighted linear interpolation of the short gaps of one column.
+
+    Only gaps from the gap index (find_gaps) lasting at most ``limit_hours``
+    are touched, so the work is proportional to the rows being filled.
+    Interior gaps are interpolated like ``series.interpolate(method='time')``
+    and gaps at the start or end of a station block take the nearest valid
+    value.
+
+    Args:
+        values: 1D float array with NaN gaps (not modified)
+        times: 1D float64 array of timestamps (ns since epoch)
+        blocks: Per-row station block number
+        gaps: Gap index of values (find_gaps)
+        fill_allowed: Per-row boolean mask of rows that may be filled
+        limit_hours: Longest gap to fill, in hours
+
+    Returns:
+        Tuple of (filled float64 array, boolean mask of filled positions)
+    """
+    n = len(values)
+    result = values.astype(np.float64, copy=True)
+    fill = np.zeros(n, dtype=bool)
+
+    short = (gaps['before'] | gaps['after']) & (gaps['hours'] <= limit_hours)
+    first, stop = gaps['first'][short], gaps['stop'][short]
+    lengths = stop - first
+    rows = np.repeat(first, lengths) + np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    p, q = np.repeat(first - 1, lengths), np.repeat(stop, lengths)
+    hp, hn = np.repeat(gaps['before'][short], lengths), np.repeat(gaps['after'][short], lengths)
+
+    allowed = fill_allowed[rows]
+    rows, p, q, hp, hn = rows[allowed], p[allowed], q[allowed], hp[allowed], hn[allowed]
+    if len(rows) == 0:
+        return result, fill
+    fill[rows] = True
+    filled = np.empty(len(rows), dtype=np.float64)
+
+    # Like np.interp, a gap sharing its timestamp with the next valid value
+    # takes the last valid value recorded at that timestamp
+    q_safe = np.minimum(q, n - 1)
+    same_time = hn & (times[q_safe] == times[rows])
+    q_tied = q_safe
+    if same_time.any():
+        valid_pos = np.flatnonzero(~np.isnan(result))
+        valid_times = times[valid_pos]
+        run_break = np.r_[(valid_times[1:] != valid_times[:-1]) |
+                          (blocks[valid_pos[1:]] != blocks[valid_pos[:-1]]), True]
+        run_last = np.minimum.accumulate(np.where(run_break, valid_pos, n)[::-1])[::-1]
+        q_rank = np.minimum(np.searchsorted(valid_pos, q_safe), len(valid_pos) - 1)
+        q_tied = np.where(same_time, run_last[q_rank], q_safe)
+
+    # Leading/trailing gaps take the nearest valid value
+    filled[~hp] = result[q_tied[~hp]]
+    filled[~hn] = result[p[~hn]]
+
+    # Interior gaps: same arithmetic as np.interp
+    inner = hp & hn
+    xp, xn, xi = times[p[inner]], times[q[inner]], times[rows[inner]]
+    yp, yn = result[p[inner]], result[q[inner]]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (yn - yp) / (xn - xp)
+        filled[inner] = np.where(same_time[inner], result[q_tied[inner]], slope * (xi - xp) + yp)
+
+    result[rows] = filled
+    return result, fill
+
+def impute_missing_values(df, outside_counts=None):
     """
     Implement tiered imputation strategy for weather data.
 
     NEW: Skip imputation for station-column combinations with >=25% missing data.
 
     Tiers:
-    1. Linear interpolation for gaps < 3 hours
-    2. Forward/backward fill for gaps < 6 hours
-    3. Variable-specific rules (Rain=0, Rh from Temp+Dew, etc.)
-    4. Leave long gaps as NaN (sensor failures)
+    1. Time-weighted linear interpolation of gaps lasting at most
+       INTERPOLATE_LIMIT_HOURS, measured between the valid readings on either
+       side (not a row count). Gaps at a station's first or last rows take
+       the nearest valid value.
+    2. Variable-specific rules (Rain=0, gust from Wind Speed, Rh from Temp+Dew)
+    3. Leave the remaining, longer gaps as NaN (sensor failures)
+
+    The data is laid out once by station and time (StationLayout); missing
+    percentages for every station/column come from a single groupby, and each
+    tier is applied to all stations at once using masks over the contiguous
+    station blocks. Each column's gaps come from one run-length pass
+    (find_gaps), and interpolate_time_segments only touches the short ones.
 
     Args:
         df: DataFrame with weather data
+        outside_counts: Optional DataFrame indexed by station with 'total_rows'
+            and per-column missing counts for rows NOT in df. Incremental runs
+            use this so the skip threshold reflects each station's full history.
 
     Returns:
         df: DataFrame with imputed values and imputation flags
@@ -743,12 +3111,14 @@ def impute_missing_values(df):
     logger.info(f"Threshold: Skip imputation if >={CONFIG['IMPUTATION_THRESHOLD_PCT']}% missing")
     logger.info("="*60)
 
-    # Ensure sorted by time within each station
-    df = df.sort_values(['station', 'Datetime_UTC']).reset_index(drop=True)
+    # Station-partitioned layout (sorted by station and time). The layout only
+    # copies when it has to sort, and imputation writes to its frame.
+    layout = StationLayout(df)
+    df = layout.df if layout.resorted else layout.df.reset_index(drop=True)
 
-    # Get all columns except datetime and station
+    # Get all columns except datetime, station and flags
     all_cols = [c for c in df.columns 
-                if c not in ['Datetime_UTC', 'station'] 
+                if c not in ['Datetime_UTC', 'station', QC_FLAG_COLUMN]
                 and not c.endswith('_imputed')]
 
     # FIXED: Exclude columns that shouldn't be imputed
@@ -771,6 +3141,31 @@ def impute_missing_values(df):
             df[col] = pd.to_numeric(df[col], errors='coerce')
             logger.info(f"Converted {col} from {df[col].dtype} to numeric")
 
+    # Station blocks
+    stations, starts, stops = layout.stations, layout.starts, layout.stops
+    block_sizes = layout.sizes
+    row_block = layout.row_blocks()
+
+    times = df['Datetime_UTC']
+    # Time interpolation is skipped for stations with NaN datetimes
+    nat_counts = np.add.reduceat(times.isnull().to_numpy().astype(np.int64), starts) if len(starts) else []
+    stations_with_nat = {s for s, count in zip(stations, nat_counts) if count > 0}
+    for station in stations_with_nat:
+        logger.warning(f"  Skipping {station} for interpolation: Has NaN datetime values")
+    time_values = times.to_numpy(dtype='datetime64[ns]')
+    time_values = np.where(np.isnat(time_values), np.nan, time_values.view('i8').astype(np.float64))
+
+    # Missing counts for every station/column in one pass
+    missing_by_station = (df[numeric_cols].isnull()
+                          .groupby(row_block).sum()
+                          .set_axis(stations, axis=0))
+    rows_by_station = pd.Series(block_sizes, index=stations)
+    if outside_counts is not None:
+        extra = outside_counts.reindex(index=stations, columns=numeric_cols + ['total_rows']).fillna(0)
+        missing_by_station = missing_by_station + extra[numeric_cols].astype(int)
+        rows_by_station = rows_by_station + extra['total_rows'].astype(int)
+    missing_pct_by_station = missing_by_station.div(rows_by_station, axis=0) * 100
+
     # Track statistics
     imputation_stats = {}
 
@@ -787,51 +3182,32 @@ def impute_missing_values(df):
         # Create imputation flag column
         # 0 = original data, 1 = interpolated, 2 = calculated/special
         flag_col = f'{col}_imputed'
-        df[flag_col] = 0
-        df.loc[df[col].isnull(), flag_col] = 1
+        flags = df[col].isnull().to_numpy().astype(FLAG_DTYPE)
 
         # NEW: Check missing percentage per station and decide which to impute
-        stations_to_impute = []
-        stations_to_skip = []
-
-        for station in df['station'].unique():
-            station_mask = df['station'] == station
-            station_total = station_mask.sum()
-            station_missing = df.loc[station_mask, col].isnull().sum()
-            station_missing_pct = (station_missing / station_total * 100) if station_total > 0 else 0
-
-            if station_missing_pct >= CONFIG['IMPUTATION_THRESHOLD_PCT']:
-                stations_to_skip.append(station)
-                logger.info(f"  SKIPPING {station}: {station_missing_pct:.1f}% missing (>={CONFIG['IMPUTATION_THRESHOLD_PCT']}%)")
-            else:
-                stations_to_impute.append(station)
+        station_pct = missing_pct_by_station[col]
+        skip_station = (station_pct >= CONFIG['IMPUTATION_THRESHOLD_PCT']).to_numpy()
+        stations_to_skip = [s for s, skip in zip(stations, skip_station) if skip]
+        for station in stations_to_skip:
+            logger.info(f"  SKIPPING {station}: {station_pct[station]:.1f}% missing (>={CONFIG['IMPUTATION_THRESHOLD_PCT']}%)")
 
         if stations_to_skip:
-            logger.info(f"  Imputing for {len(stations_to_impute)} stations, skipping {len(stations_to_skip)}")
-
-        # TIER 1: Linear interpolation for short gaps (< 3 hours)
-        for station in stations_to_impute:
-            mask = df['station'] == station
-            station_df = df.loc[mask].copy()
-
-            # FIXED: Skip if datetime has NaN values
-            if station_df['Datetime_UTC'].isnull().any():
-                logger.warning(f"  Skipping {station} for {col}: Has NaN datetime values")
-                continue
-
-            # Set datetime index for time-based interpolation
-            station_df = station_df.set_index('Datetime_UTC')
-
-            # Interpolate with time-based method
-            station_df[col] = station_df[col].interpolate(
-                method='time', 
-                limit=CONFIG['INTERPOLATE_LIMIT_HOURS'],
-                limit_direction='both'
-            )
-
-            # Reset index and update original dataframe
-            station_df = station_df.reset_index()
-            df.loc[mask, col] = station_df[col].values
+            logger.info(f"  Imputing for {len(stations) - len(stations_to_skip)} stations, skipping {len(stations_to_skip)}")
+
+        impute_rows = ~skip_station[row_block]
+        interpolate_rows = impute_rows & ~np.isin(row_block, [i for i, s in enumerate(stations)
+                                                               if s in stations_with_nat])
+
+        # TIER 1: Linear interpolation for short gaps (by duration, not rows)
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        gaps = find_gaps(np.isnan(values), time_values, starts, stops)
+        short_gaps = np.count_nonzero(gaps['hours'] <= CONFIG['INTERPOLATE_LIMIT_HOURS'])
+        logger.info(f"  Gap index: {len(gaps['first']):,} gaps, {short_gaps:,} up to "
+                    f"{CONFIG['INTERPOLATE_LIMIT_HOURS']} hours")
+        filled, _ = interpolate_time_segments(
+            values, time_values, row_block, gaps, interpolate_rows,
+            CONFIG['INTERPOLATE_LIMIT_HOURS'])
+        df[col] = filled.astype(df[col].dtype, copy=False)
 
         after_tier1 = df[col].isnull().sum()
         tier1_imputed = original_missing - after_tier1
@@ -840,17 +3216,15 @@ def impute_missing_values(df):
         # Since Tier 2 (forward/backward fill) was removed, skip directly to variable-specific
         after_tier2 = after_tier1
 
-        # TIER 2: Variable-specific imputation
+        # TIER 2: Variable-specific imputation (all imputed stations at once)
         tier2_imputed = 0
+        missing_mask = df[col].isnull().to_numpy() & impute_rows
 
         if col == 'Rain':
             # Missing rain data almost certainly means no rain
             # Only impute for stations under threshold
-            for station in stations_to_impute:
-                mask = df['station'] == station
-                missing_rain = df.loc[mask, col].isnull()
-                df.loc[mask & missing_rain, flag_col] = 2
-                df.loc[mask & missing_rain, col] = 0
+            flags[missing_mask] = 2
+            df.loc[missing_mask, col] = 0
 
             after_tier2_special = df[col].isnull().sum()
             tier2_imputed = after_tier2 - after_tier2_special
@@ -859,14 +3233,9 @@ def impute_missing_values(df):
         elif col == 'Wind Gust Speed':
             # If Wind Gust Speed missing but Wind Speed available, use Wind Speed
             if 'Wind Speed' in df.columns:
-                for station in stations_to_impute:
-                    mask = df['station'] == station
-                    missing_gust = df.loc[mask, col].isnull()
-                    has_wind_speed = df.loc[mask, 'Wind Speed'].notnull()
-                    impute_mask_station = mask & missing_gust & has_wind_speed
-
-                    df.loc[impute_mask_station, flag_col] = 2
-                    df.loc[impute_mask_station, col] = df.loc[impute_mask_station, 'Wind Speed']
+                impute_mask = missing_mask & df['Wind Speed'].notnull().to_numpy()
+                flags[impute_mask] = 2
+                df.loc[impute_mask, col] = df.loc[impute_mask, 'Wind Speed']
 
                 after_tier2_special = df[col].isnull().sum()
                 tier2_imputed = after_tier2 - after_tier2_special
@@ -877,19 +3246,15 @@ def impute_missing_values(df):
         elif col == 'Rh':
             # Calculate Rh from Temperature and Dew Point where possible
             if 'Temperature' in df.columns and 'Dew' in df.columns:
-                for station in stations_to_impute:
-                    mask = df['station'] == station
-                    missing_rh = df.loc[mask, col].isnull()
-                    has_temp_dew = df.loc[mask, 'Temperature'].notnull() & df.loc[mask, 'Dew'].notnull()
-                    impute_mask_station = mask & missing_rh & has_temp_dew
-
-                    if impute_mask_station.sum() > 0:
-                        df.loc[impute_mask_station, flag_col] = 2
-                        calculated_rh = calculate_rh_from_temp_dew(
-                            df.loc[impute_mask_station, 'Temperature'],
-                            df.loc[impute_mask_station, 'Dew']
-                        )
-                        df.loc[impute_mask_station, col] = calculated_rh
+                impute_mask = (missing_mask &
+                               df['Temperature'].notnull().to_numpy() &
+                               df['Dew'].notnull().to_numpy())
+                if impute_mask.any():
+                    flags[impute_mask] = 2
+                    df.loc[impute_mask, col] = calculate_rh_from_temp_dew(
+                        df.loc[impute_mask, 'Temperature'],
+                        df.loc[impute_mask, 'Dew']
+                    ).clip(CONFIG['RH_MIN'], CONFIG['RH_MAX'])
 
                 after_tier2_special = df[col].isnull().sum()
                 tier2_imputed = after_tier2 - after_tier2_special
@@ -899,26 +3264,7 @@ def impute_missing_values(df):
         else:
             after_tier2_special = after_tier2
 
-        # Apply bounds checking
-        if col == 'Temperature':
-            out_of_bounds = (df[col] < CONFIG['TEMP_MIN']) | (df[col] > CONFIG['TEMP_MAX'])
-            if out_of_bounds.sum() > 0:
-                logger.warning(f"  Found {out_of_bounds.sum()} out-of-bounds temperatures, setting to NaN")
-                df.loc[out_of_bounds, col] = np.nan
-
-        elif col == 'Rh':
-            out_of_bounds = (df[col] < CONFIG['RH_MIN']) | (df[col] > CONFIG['RH_MAX'])
-            if out_of_bounds.sum() > 0:
-                logger.warning(f"  Found {out_of_bounds.sum()} out-of-bounds Rh values, clipping")
-                df[col] = df[col].clip(CONFIG['RH_MIN'], CONFIG['RH_MAX'])
-
-        elif col == 'Dew':
-            out_of_bounds = (df[col] < CONFIG['DEW_MIN']) | (df[col] > CONFIG['DEW_MAX'])
-            if out_of_bounds.sum() > 0:
-                logger.warning(f"  Found {out_of_bounds.sum()} out-of-bounds Dew values, setting to NaN")
-                df.loc[out_of_bounds, col] = np.nan
-                # Update imputation flags for removed values
-                df.loc[out_of_bounds, flag_col] = 0
+        df[flag_col] = flags
 
         # Final statistics
         final_missing = df[col].isnull().sum()
@@ -992,6 +3338,73 @@ def circular_mean_degrees(angles):
 
     return mean_angle_deg
 
+def get_aggregation_rule(col):
+    """
+    Per-variable aggregation rule shared by all aggregation functions.
+
+    Returns:
+        'max' (gusts), 'sum' (rain/precipitation), 'circular' (wind direction)
+        or 'default' (min/max/mean depending on the product)
+    """
+    col_lower = col.lower()
+    if 'wind gust speed' in col_lower or 'gust speed' in col_lower:
+        return 'max'
+    if 'rain' in col_lower or 'precipitation' in col_lower:
+        return 'sum'
+    if 'wind direction' in col_lower or col == 'Wind Direction':
+        return 'circular'
+    return 'default'
+
+def finalize_circular_mean(sin_sum, cos_sum, counts, angle_col, with_steadiness=False):
+    """
+    Turn per-group sin/cos sums and counts into a circular mean in [0, 360).
+
+    Returns:
+        DataFrame with angle_col (and '{angle_col}_steadiness' if requested)
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sin_mean = sin_sum / counts
+        cos_mean = cos_sum / counts
+    mean_deg = np.rad2deg(np.arctan2(sin_mean, cos_mean))
+    mean_deg = mean_deg.where(mean_deg >= 0, mean_deg + 360)
+    # Directions a rounding error below 0 (e.g. sin(2*pi)) wrap to 0, not 360;
+    # groups with no valid angles have count 0 -> NaN
+    mean_deg = mean_deg.where(mean_deg < 360 - 1e-9, 0.0).where(counts > 0)
+
+    result = pd.DataFrame({angle_col: mean_deg})
+    if with_steadiness:
+        result[f'{angle_col}_steadiness'] = np.sqrt(sin_mean ** 2 + cos_mean ** 2)
+    return result
+
+def circular_mean_by_group(df, group_keys, angle_col, with_steadiness=False):
+    """
+    Vectorized circular mean of an angular column (degrees) per group.
+
+    Sin/cos components are computed once per row and reduced with built-in
+    groupby sums and counts; arctan2 is applied once per group at the end.
+    Works for any angular column and any grouping (hourly, daily, resampled).
+
+    Args:
+        df: DataFrame containing the group keys and angle column
+        group_keys: List of column names to group by, or an array of group ids
+            aligned with df
+        angle_col: Name of the angular column in degrees
+        with_steadiness: Also return the resultant vector length (0 = variable,
+            1 = perfectly steady direction) as '{angle_col}_steadiness'
+
+    Returns:
+        DataFrame indexed by group keys with the circular mean in [0, 360)
+    """
+    angles_rad = np.deg2rad(pd.to_numeric(df[angle_col], errors='coerce').to_numpy(dtype=np.float64))
+    components = pd.DataFrame({'sin': np.sin(angles_rad), 'cos': np.cos(angles_rad)}, index=df.index)
+
+    keys = [df[k] for k in group_keys] if isinstance(group_keys, list) else group_keys
+    grouped = components.groupby(keys, observed=True)
+    sums = grouped.sum()
+    counts = grouped['sin'].count()
+
+    return finalize_circular_mean(sums['sin'], sums['cos'], counts, angle_col, with_steadiness)
+
 def create_hourly_aggregates(df):
     """Create hourly aggregated weather data."""
     logger.info("Creating hourly aggregates...")
@@ -1021,15 +3434,16 @@ def create_hourly_aggregates(df):
 
     logger.info(f"Rows in time window: {len(hourly_data):,} of {len(df):,}")
 
-    # Drop imputation flag columns before aggregating
-    flag_cols = [c for c in hourly_data.columns if c.endswith('_imputed')]
+    # Drop imputation and QC flag columns before aggregating
+    flag_cols = [c for c in hourly_data.columns if c.endswith('_imputed') or c == QC_FLAG_COLUMN]
     hourly_data = hourly_data.drop(columns=flag_cols)
 
     # Group by station and hour
     grouped = hourly_data.groupby(['station', 'hour_label'], observed=True)
 
-    # Build aggregation dictionary
+    # Build aggregation dictionary (circular columns are aggregated separately)
     agg_dict = {}
+    circular_cols = []
     for col in hourly_data.columns:
         if col in ['station', 'hour_label', 'Datetime_UTC', 'minutes_from_hour']:
             continue
@@ -1037,19 +3451,24 @@ def create_hourly_aggregates(df):
         if not pd.api.types.is_numeric_dtype(hourly_data[col]):
             continue
 
-        col_lower = col.lower()
-
-        if 'wind gust speed' in col_lower or 'gust speed' in col_lower:
-            agg_dict[col] = 'max'
-        elif 'rain' in col_lower or 'precipitation' in col_lower:
-            agg_dict[col] = 'sum'
-        elif 'wind direction' in col_lower or col == 'Wind Direction':
-            agg_dict[col] = circular_mean_degrees
-        else:
-            agg_dict[col] = 'mean'
+        rule = get_aggregation_rule(col)
+        agg_dict[col] = 'mean' if rule == 'default' else rule
+        if rule == 'circular':
+            circular_cols.append(col)
 
     # Perform aggregation
-    hourly_aggregated = grouped.agg(agg_dict).reset_index()
+    hourly_aggregated = grouped.agg({c: f for c, f in agg_dict.items() if f != 'circular'})
+    for col in circular_cols:
+        circular = circular_mean_by_group(hourly_data, ['station', 'hour_label'], col,
+                                          with_steadiness=CONFIG['WIND_DIRECTION_STEADINESS'])
+        for circular_col in circular.columns:
+            hourly_aggregated[circular_col] = circular[circular_col]
+
+    # Keep the original column order (steadiness follows its direction column)
+    ordered_cols = []
+    for col in agg_dict:
+        ordered_cols += [col] + ([f'{col}_steadiness'] if f'{col}_steadiness' in hourly_aggregated.columns else [])
+    hourly_aggregated = hourly_aggregated[ordered_cols].reset_index()
     hourly_aggregated = hourly_aggregated.rename(columns={'hour_label': 'Datetime_UTC'})
 
     # Round numeric columns
@@ -1068,7 +3487,10 @@ def create_hourly_aggregates(df):
 def create_daily_aggregates(df):
     """
     Create daily aggregated weather data with min, max, and mean statistics.
-    Uses pd.concat() for mixed aggregation types.
+
+    The (station, UTC day) grouping key is built once with floor('D') on the
+    datetime column, and every min/max/mean/sum statistic is computed in a
+    single named-aggregation call; circular columns reuse the same grouper.
 
     Args:
         df: DataFrame with weather data (must have Datetime_UTC and station columns)
@@ -1089,47 +3511,57 @@ def create_daily_aggregates(df):
     for col in numeric_cols_to_fix:
         df[col] = pd.to_numeric(df[col], errors='coerce')
 
-    # Create date label (UTC date)
-    df['date_label'] = df['Datetime_UTC'].dt.date
+    # Create date label (UTC day as datetime64, not Python date objects)
+    date_label = df['Datetime_UTC'].dt.floor('D').dt.tz_localize(None).rename('date_label')
 
-    # Drop imputation flag columns before aggregating
-    flag_cols = [c for c in df.columns if c.endswith('_imputed')]
-    df_for_agg = df.drop(columns=flag_cols)
-
-    # Build list of aggregations to perform
-    agg_list = []
+    # Build named aggregations (imputation flag columns are not aggregated)
+    named_aggs = {}
+    circular_cols = []
+    output_cols = []
 
-    for col in df_for_agg.columns:
-        if col in ['station', 'date_label', 'Datetime_UTC']:
+    for col in df.columns:
+        if col in ['station', 'Datetime_UTC', QC_FLAG_COLUMN] or col.endswith('_imputed'):
             continue
 
-        if not pd.api.types.is_numeric_dtype(df_for_agg[col]):
+        if not pd.api.types.is_numeric_dtype(df[col]):
             continue
 
-        col_lower = col.lower()
+        rule = get_aggregation_rule(col)
 
         # Special handling for specific columns
-        if 'wind gust speed' in col_lower or 'gust speed' in col_lower:
+        if rule == 'max':
             # Wind gust: daily maximum
-            agg_list.append(df_for_agg.groupby(['station', 'date_label'], observed=True)[col].max().rename(col))
-        elif 'rain' in col_lower or 'precipitation' in col_lower:
+            named_aggs[col] = (col, 'max')
+            output_cols.append(col)
+        elif rule == 'sum':
             # Rain: daily sum
-            agg_list.append(df_for_agg.groupby(['station', 'date_label'], observed=True)[col].sum().rename(col))
-        elif 'wind direction' in col_lower or col == 'Wind Direction':
+            named_aggs[col] = (col, 'sum')
+            output_cols.append(col)
+        elif rule == 'circular':
             # Wind direction: circular mean for the day
-            agg_list.append(df_for_agg.groupby(['station', 'date_label'], observed=True)[col].agg(circular_mean_degrees).rename(col))
+            circular_cols.append(col)
+            output_cols.append(col)
+            if CONFIG['WIND_DIRECTION_STEADINESS']:
+                output_cols.append(f'{col}_steadiness')
         else:
             # For all other variables: min, max, and mean
-            agg_list.append(df_for_agg.groupby(['station', 'date_label'], observed=True)[col].min().rename(f'{col}_min'))
-            agg_list.append(df_for_agg.groupby(['station', 'date_label'], observed=True)[col].max().rename(f'{col}_max'))
-            agg_list.append(df_for_agg.groupby(['station', 'date_label'], observed=True)[col].mean().rename(f'{col}_mean'))
+            for stat in ['min', 'max', 'mean']:
+                named_aggs[f'{col}_{stat}'] = (col, stat)
+                output_cols.append(f'{col}_{stat}')
 
-    # Combine all aggregations
-    daily_aggregated = pd.concat(agg_list, axis=1).reset_index()
+    # Single groupby for all statistics
+    grouped = df.groupby([df['station'], date_label], observed=True)
+    daily_aggregated = grouped.agg(**named_aggs) if named_aggs else grouped.size().to_frame('_rows')
 
-    # Convert date_label back to datetime for consistency
-    daily_aggregated['Datetime_UTC'] = pd.to_datetime(daily_aggregated['date_label'])
-    daily_aggregated = daily_aggregated.drop(columns=['date_label'])
+    for col in circular_cols:
+        circular = circular_mean_by_group(df[['station', col]].assign(date_label=date_label),
+                                          ['station', 'date_label'], col,
+                                          with_steadiness=CONFIG['WIND_DIRECTION_STEADINESS'])
+        for circular_col in circular.columns:
+            daily_aggregated[circular_col] = circular[circular_col]
+
+    daily_aggregated = daily_aggregated[output_cols].reset_index()
+    daily_aggregated = daily_aggregated.rename(columns={'date_label': 'Datetime_UTC'})
 
     # Round numeric columns to 2 decimal places
     numeric_columns = daily_aggregated.select_dtypes(include=[np.number]).columns
@@ -1145,6 +3577,953 @@ def create_daily_aggregates(df):
 
     return daily_aggregated
 
+# Helper columns added by the hourly/daily functions, never aggregated
+AGGREGATION_HELPER_COLS = ['station', 'Datetime_UTC', 'hour_label', 'date_label', 'minutes_from_hour']
+
+CALENDAR_MONTH_FREQS = ('MS', 'M', 'ME')
+
+def period_start(times, freq):
+    """
+    Label timestamps with the start of their resampling period.
+
+    Fixed frequencies ('10min', 'h', '3h', 'D') use floor(); calendar months
+    ('MS') use the first day of the month. Labels keep the input timezone.
+    """
+    times = pd.Series(times)
+    if freq in CALENDAR_MONTH_FREQS:
+        tz = times.dt.tz
+        naive = times.dt.tz_localize(None) if tz is not None else times
+        labels = naive.dt.to_period('M').dt.start_time
+        return labels.dt.tz_localize(tz) if tz is not None else labels
+    return times.dt.floor(freq)
+
+def freq_divides(parent_freq, child_freq):
+    """True if every child period is an exact union of parent periods."""
+    if parent_freq in CALENDAR_MONTH_FREQS:
+        return False
+    parent = pd.Timedelta(pd.tseries.frequencies.to_offset(parent_freq))
+    if child_freq in CALENDAR_MONTH_FREQS:
+        return pd.Timedelta(days=1) % parent == pd.Timedelta(0)
+    child = pd.Timedelta(pd.tseries.frequencies.to_offset(child_freq))
+    return child > parent and child % parent == pd.Timedelta(0)
+
+def freq_sort_key(freq):
+    """Approximate period length used to order products from fine to coarse."""
+    if freq in CALENDAR_MONTH_FREQS:
+        return pd.Timedelta(days=31)
+    return pd.Timedelta(pd.tseries.frequencies.to_offset(freq))
+
+def build_partial_aggregates(df, freq):
+    """
+    Aggregate raw rows into mergeable partial statistics per (station, period).
+
+    Partials are sums, counts, minima, maxima and sin/cos sums, so coarser
+    periods can be rolled up from them without rescanning the raw rows.
+    Columns are named '{col}__{stat}'.
+
+    Args:
+        df: Cleaned/imputed weather data
+        freq: Resampling frequency
+
+    Returns:
+        DataFrame indexed by (station, period)
+    """
+    components = {}
+    named_aggs = {}
+
+    for col in df.columns:
+        if col in AGGREGATION_HELPER_COLS or col == QC_FLAG_COLUMN or col.endswith('_imputed'):
+            continue
+        values = df[col]
+        if values.dtype == 'object':
+            values = pd.to_numeric(values, errors='coerce')
+        if not pd.api.types.is_numeric_dtype(values):
+            continue
+
+        rule = get_aggregation_rule(col)
+        if rule == 'circular':
+            angles_rad = np.deg2rad(values.to_numpy(dtype=np.float64))
+            components[f'{col}__sin'] = np.sin(angles_rad)
+            components[f'{col}__cos'] = np.cos(angles_rad)
+            named_aggs[f'{col}__sin'] = (f'{col}__sin', 'sum')
+            named_aggs[f'{col}__cos'] = (f'{col}__cos', 'sum')
+            named_aggs[f'{col}__n'] = (f'{col}__sin', 'count')
+            continue
+
+        components[col] = values.astype(np.float64)
+        if rule == 'max':
+            named_aggs[f'{col}__max'] = (col, 'max')
+        elif rule == 'sum':
+            named_aggs[f'{col}__sum'] = (col, 'sum')
+        else:
+            named_aggs[f'{col}__sum'] = (col, 'sum')
+            named_aggs[f'{col}__n'] = (col, 'count')
+            named_aggs[f'{col}__min'] = (col, 'min')
+            named_aggs[f'{col}__max'] = (col, 'max')
+
+    frame = pd.DataFrame(components, index=df.index)
+    period = period_start(df['Datetime_UTC'], freq).rename('period')
+    return frame.groupby([df['station'], period], observed=True).agg(**named_aggs)
+
+def rollup_partial_aggregates(partials, freq):
+    """Combine finer partial statistics into coarser periods."""
+    period = period_start(partials.index.get_level_values('period'), freq).rename('period')
+    station = pd.Series(partials.index.get_level_values('station'), name='station')
+    how = {}
+    for partial_col in partials.columns:
+        stat = partial_col.rsplit('__', 1)[1]
+        how[partial_col] = stat if stat in ('min', 'max') else 'sum'
+    partials = partials.reset_index(drop=True)
+    return partials.groupby([station, period], observed=True).agg(how)
+
+def finalize_partial_aggregates(partials, stats):
+    """
+    Convert partial statistics into output columns.
+
+    Gust (max), rain (sum) and circular columns keep their variable name; other
+    variables get one column per statistic in stats ('{col}_{stat}'), or just
+    '{col}' when only one statistic is requested.
+    """
+    variables = list(dict.fromkeys(c.rsplit('__', 1)[0] for c in partials.columns))
+    result = pd.DataFrame(index=partials.index)
+
+    for col in variables:
+        rule = get_aggregation_rule(col)
+        if rule == 'circular':
+            circular = finalize_circular_mean(partials[f'{col}__sin'], partials[f'{col}__cos'],
+                                              partials[f'{col}__n'], col,
+                                              with_steadiness=CONFIG['WIND_DIRECTION_STEADINESS'])
+            for circular_col in circular.columns:
+                result[circular_col] = circular[circular_col]
+        elif rule == 'max':
+            result[col] = partials[f'{col}__max']
+        elif rule == 'sum':
+            result[col] = partials[f'{col}__sum']
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = partials[f'{col}__sum'] / partials[f'{col}__n']
+            values = {'mean': mean.where(partials[f'{col}__n'] > 0),
+                      'min': partials[f'{col}__min'],
+                      'max': partials[f'{col}__max']}
+            for stat in stats:
+                result[col if len(stats) == 1 else f'{col}_{stat}'] = values[stat]
+
+    result = result.reset_index().rename(columns={'period': 'Datetime_UTC'})
+    numeric_columns = result.select_dtypes(include=[np.number]).columns
+    result[numeric_columns] = result[numeric_columns].round(2)
+    col_order = ['Datetime_UTC', 'station'] + [c for c in result.columns
+                                               if c not in ['Datetime_UTC', 'station']]
+    return result[col_order]
+
+def sample_at_local_time(df, local_time='12:00', utc_offset_hours=-4, tolerance_minutes=30):
+    """
+    Pick the observation nearest a fixed local standard time each day.
+
+    Used for fire-weather style noon values: with utc_offset_hours=-4 (Atlantic
+    Standard Time, no daylight saving) '12:00' selects the reading closest to
+    16:00 UTC, within tolerance_minutes, for every station and local day.
+
+    Returns:
+        DataFrame with the selected rows plus a 'Date_Local' column
+    """
+    offset = pd.Timedelta(hours=utc_offset_hours)
+    local = df['Datetime_UTC'].dt.tz_localize(None) + offset
+    local_date = local.dt.floor('D')
+    distance = (local - (local_date + pd.Timedelta(f'{local_time}:00'))).abs()
+
+    candidates = distance <= pd.Timedelta(minutes=tolerance_minutes)
+    helper_cols = [c for c in AGGREGATION_HELPER_COLS if c in df.columns and c not in ['station', 'Datetime_UTC']]
+    sampled = df.loc[candidates].drop(columns=helper_cols)
+    sampled.insert(2, 'Date_Local', local_date[candidates])
+    sampled['_distance'] = distance[candidates]
+
+    sampled = (sampled.sort_values(['station', 'Date_Local', '_distance'], kind='stable')
+                      .drop_duplicates(['station', 'Date_Local'], keep='first')
+                      .drop(columns=['_distance'])
+                      .reset_index(drop=True))
+    return sampled
+
+def resample_weather_data(df, products=None):
+    """
+    Produce all configured resampled products in one call.
+
+    Each aggregated product is built from the finest already-computed product
+    whose period evenly divides its own (10min -> 3h -> monthly), so raw rows
+    are only scanned once per independent resolution. Products with
+    'at_local_time' sample the raw rows instead (e.g. noon-local daily values).
+
+    Args:
+        df: Cleaned/imputed weather data
+        products: List of product dicts (defaults to CONFIG['RESAMPLE_PRODUCTS'])
+            with keys 'name', 'freq', 'output' and optional 'stats'
+            (default ['mean']) or 'at_local_time'/'utc_offset_hours'
+
+    Returns:
+        Dict of product name -> DataFrame
+    """
+    products = CONFIG['RESAMPLE_PRODUCTS'] if products is None else products
+    results = {}
+    partials_by_freq = {}
+
+    for product in sorted(products, key=lambda p: freq_sort_key(p['freq'])):
+        name, freq = product['name'], product['freq']
+
+        if 'at_local_time' in product:
+            logger.info(f"Resampling '{name}': nearest reading to {product['at_local_time']} local time")
+            results[name] = sample_at_local_time(
+                df, product['at_local_time'],
+                product.get('utc_offset_hours', -4),
+                product.get('tolerance_minutes', 30))
+            continue
+
+        if freq not in partials_by_freq:
+            parents = [f for f in partials_by_freq if freq_divides(f, freq)]
+            if parents:
+                parent = max(parents, key=freq_sort_key)
+                logger.info(f"Resampling '{name}' ({freq}) from {parent} aggregates")
+                partials_by_freq[freq] = rollup_partial_aggregates(partials_by_freq[parent], freq)
+            else:
+                logger.info(f"Resampling '{name}' ({freq}) from {len(df):,} raw rows")
+                partials_by_freq[freq] = build_partial_aggregates(df, freq)
+
+        results[name] = finalize_partial_aggregates(partials_by_freq[freq], product.get('stats', ['mean']))
+        logger.info(f"  {name}: {results[name].shape}")
+
+    return results
+
+# ============================================================================
+# OUTPUT BACKENDS
+# ============================================================================
+
+def write_csv_output(df, path, stations=None, append=False):
+    """
+    Write an output as a single CSV file (full rewrite, or append rows without a header).
+
+    Unlike the Parquet backend, stations is ignored: one CSV file can't be
+    rewritten in part, so df must be the complete output (incremental runs
+    pass the spliced frame) and the file is always rewritten in full.
+    """
+    df.to_csv(path, index=False, mode='a' if append else 'w', header=not append)
+
+def read_csv_output(path):
+    """Read a CSV output, restoring datetime and station dtypes."""
+    df = pd.read_csv(path, low_memory=False)
+    if 'Datetime_UTC' in df.columns:
+        # Timestamps with an offset come back tz-aware; daily dates stay naive
+        df['Datetime_UTC'] = pd.to_datetime(df['Datetime_UTC'], format='ISO8601')
+    if 'station' in df.columns:
+        df['station'] = df['station'].astype('category')
+    return df
+
+def write_parquet_output(df, path, stations=None, append=False):
+    """
+    Write an output as Parquet, partitioned by station and year.
+
+    Time series outputs become a hive-partitioned dataset directory
+    (station=.../year=.../*.parquet); tables without Datetime_UTC (the
+    quality report) are written as a single file. Float32/category dtypes are
+    kept and *_imputed flags are stored as int8.
+
+    Args:
+        df: DataFrame to write
+        path: Output path (directory for partitioned outputs)
+        stations: If given, only rewrite these stations' partitions
+        append: Add df's stations to an existing dataset (streaming runs)
+    """
+    df = df.copy()
+    flag_cols = [c for c in df.columns if c.endswith('_imputed')]
+    df[flag_cols] = df[flag_cols].astype('int8')
+
+    path = Path(path)
+    if 'Datetime_UTC' not in df.columns:
+        df.to_parquet(path, index=False, compression=CONFIG['PARQUET_COMPRESSION'])
+        return
+
+    df['station'] = df['station'].astype(str)
+    df['year'] = df['Datetime_UTC'].dt.year.astype('Int16')
+    if append:
+        stations = df['station'].unique()
+
+    if stations is None:
+        if path.is_dir():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+    else:
+        df = df[df['station'].isin([str(s) for s in stations])]
+
+    df.to_parquet(path, index=False, compression=CONFIG['PARQUET_COMPRESSION'],
+                  partition_cols=['station', 'year'],
+                  existing_data_behavior='delete_matching')
+
+def read_parquet_output(path):
+    """Read a Parquet output (partitioned dataset or single file)."""
+    path = Path(path)
+    if not path.is_dir():
+        return pd.read_parquet(path)
+
+    # Explicit partition schema so numeric-looking station names stay strings
+    partitioning = pa_dataset.partitioning(
+        pa.schema([('station', pa.string()), ('year', pa.int16())]), flavor='hive')
+    df = pd.read_parquet(path, partitioning=partitioning).drop(columns=['year'])
+
+    col_order = ['Datetime_UTC', 'station'] + [c for c in df.columns
+                                               if c not in ['Datetime_UTC', 'station']]
+    df = df[col_order]
+    df['station'] = df['station'].astype('category')
+    df = df.sort_values(['station', 'Datetime_UTC'], kind='stable').reset_index(drop=True)
+    return df
+
+OUTPUT_BACKENDS = {
+    'csv': {'suffix': '.csv', 'write': write_csv_output, 'read': read_csv_output},
+    'parquet': {'suffix': '.parquet', 'write': write_parquet_output, 'read': read_parquet_output},
+}
+
+@functools.lru_cache(maxsize=None)
+def resolve_output_format(output_format):
+    """
+    Output format actually used for CONFIG['OUTPUT_FORMAT'].
+
+    'parquet' falls back to 'csv' when pyarrow is not installed; the fallback
+    is logged once per process and CONFIG is left as configured.
+    """
+    output_format = output_format.lower()
+    if output_format not in OUTPUT_BACKENDS:
+        raise ValueError(f"Unknown OUTPUT_FORMAT '{output_format}' "
+                         f"(expected one of {list(OUTPUT_BACKENDS)})")
+    if output_format == 'parquet' and not HAS_PYARROW:
+        logger.warning("pyarrow is not installed - falling back to CSV output")
+        return 'csv'
+    return output_format
+
+def get_output_backend():
+    """Return the configured output backend, falling back to CSV if unavailable."""
+    return OUTPUT_BACKENDS[resolve_output_format(CONFIG['OUTPUT_FORMAT'])]
+
+def get_output_path(output_key):
+    """
+    Get the on-disk path of an output for the configured backend.
+
+    Args:
+        output_key: CONFIG key (e.g. 'OUTPUT_HOURLY') or a plain file name
+            (used for resampled products)
+    """
+    file_name = CONFIG[output_key] if output_key in CONFIG else output_key
+    return Path(file_name).with_suffix(get_output_backend()['suffix'])
+
+def write_output(df, output_key, stations=None, append=False):
+    """
+    Write a pipeline output with the configured backend and return its path.
+
+    Args:
+        df: DataFrame to write
+        output_key: CONFIG key or plain file name (see get_output_path)
+        stations: Only rewrite these stations (incremental runs)
+        append: Append to the output written earlier in this run (streaming runs)
+    """
+    output_path = get_output_path(output_key)
+    get_output_backend()['write'](df, output_path, stations=stations, append=append)
+    return output_path
+
+def read_output(output_key):
+    """Read a previously written pipeline output with the configured backend."""
+    return get_output_backend()['read'](get_output_path(output_key))
+
+# ============================================================================
+# INCREMENTAL RUN SUPPORT
+# ============================================================================
+
+def get_manifest_path():
+    """Get path to the source manifest file."""
+    return Path(CONFIG['CACHE_DIR']) / CONFIG['MANIFEST_FILE']
+
+def load_manifest():
+    """Load the source manifest from the previous run (empty dict if none)."""
+    manifest_path = get_manifest_path()
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load manifest {manifest_path}: {e}")
+    return {}
+
+def save_manifest(manifest):
+    """Save the source manifest atomically."""
+    try:
+        ensure_cache_dir()
+        manifest_path = get_manifest_path()
+        tmp_path = manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        tmp_path.replace(manifest_path)
+        logger.info(f"Saved manifest with {len(manifest)} sources: {manifest_path}")
+    except Exception as e:
+        logger.warning(f"Failed to save manifest: {e}")
+
+def hash_file_contents(full_path, chunk_size=1 << 20):
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    sha = hashlib.sha256()
+    with open(full_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def hash_dataframe(df):
+    """Return a content hash of a dataframe (used for downloaded ECCC months)."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()
+
+def eccc_source_key(df):
+    """Manifest key for a downloaded ECCC period, namespaced by station and timeframe (see eccc_cache_key)."""
+    station_id = df.attrs['eccc_station_id']
+    timeframe, year, month = df.attrs['eccc_period']
+    return f"eccc/{station_id}/{ECCC_TIMEFRAMES[timeframe]}/{year}-{month:02d}"
+
+def fingerprint_local_files(csv_files, manifest):
+    """
+    Fingerprint local CSV files (size, mtime, content hash).
+
+    Files whose size and mtime match the manifest reuse the stored hash,
+    so only touched files are read from disk.
+
+    Args:
+        csv_files: List of (full_path, relative_path) tuples
+        manifest: Manifest from the previous run
+
+    Returns:
+        Dict of relative_path -> fingerprint dict
+    """
+    fingerprints = {}
+    rehashed = 0
+
+    for full_path, relative_path in csv_files:
+        stat = os.stat(full_path)
+        previous = manifest.get(relative_path, {})
+
+        if previous.get('size') == stat.st_size and previous.get('mtime') == stat.st_mtime:
+            sha = previous['sha256']
+        else:
+            sha = hash_file_contents(full_path)
+            rehashed += 1
+
+        fingerprints[relative_path] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'sha256': sha,
+        }
+
+    logger.info(f"Fingerprinted {len(fingerprints)} files ({rehashed} re-hashed)")
+    return fingerprints
+
+def get_source_time_range(df):
+    """
+    Get the (start, end) UTC time range covered by a single cleaned source.
+
+    Returns:
+        Tuple of ISO timestamps, or (None, None) if no datetime columns parse
+    """
+    dt_cols = [c for c in df.columns
+               if 'date' in str(c).lower() or 'time' in str(c).lower()]
+    if not dt_cols:
+        return None, None
+    # Header GMT offsets turn local logger times into UTC, as in a full run
+    if UTC_OFFSET_COLUMN in df.columns:
+        dt_cols.append(UTC_OFFSET_COLUMN)
+
+    try:
+        parsed = process_datetime_columns(df[dt_cols + ['station']].copy())['Datetime_UTC'].dropna()
+    except KeyError:
+        return None, None
+
+    if parsed.empty:
+        return None, None
+    return parsed.min().isoformat(), parsed.max().isoformat()
+
+def build_manifest_entry(fingerprint, df):
+    """Combine a source fingerprint with the station and time range it covers."""
+    start, end = get_source_time_range(df)
+    entry = dict(fingerprint)
+    entry.update({
+        'station': str(df['station'].iloc[0]),
+        'start': start,
+        'end': end,
+    })
+    return entry
+
+def unimpute(df):
+    """
+    Revert imputed values to NaN using the *_imputed flags.
+
+    Rows flagged 1 or 2 were missing in the source data, so clearing them
+    recovers the pre-imputation values for re-running imputation.
+    """
+    df = df.copy()
+    flag_cols = [c for c in df.columns if c.endswith('_imputed')]
+    for flag_col in flag_cols:
+        col = flag_col[:-len('_imputed')]
+        if col in df.columns:
+            df.loc[df[flag_col] != 0, col] = np.nan
+    return df.drop(columns=flag_cols)
+
+def splice_rows(existing, new_rows, windows, time_floor=None):
+    """
+    Replace existing rows inside per-station time windows with new rows.
+
+    Args:
+        existing: Existing output dataframe
+        new_rows: Recomputed rows for the windows
+        windows: Dict of station -> (start, end) Timestamps (inclusive)
+        time_floor: Optional function applied to window bounds (e.g. day floor)
+
+    Returns:
+        Spliced dataframe sorted by station and Datetime_UTC
+    """
+    # Outputs reloaded from CSV are float64; take the recomputed rows' float
+    # dtypes so a spliced output is written exactly like a full rebuild
+    existing = existing.astype({col: dtype for col, dtype in new_rows.dtypes.items()
+                                if col in existing.columns and dtype.kind == 'f'})
+    existing_layout, new_layout = StationLayout(existing), StationLayout(new_rows)
+    existing, new_rows = existing_layout.df, new_layout.df
+    replace_mask = np.zeros(len(existing), dtype=bool)
+    keep_new = np.zeros(len(new_rows), dtype=bool)
+
+    for station, (start, end) in windows.items():
+        if time_floor is not None:
+            start, end = time_floor(start), time_floor(end)
+        # Outputs may be tz-naive (daily) while windows are UTC
+        if existing['Datetime_UTC'].dt.tz is None:
+            start, end = start.tz_localize(None), end.tz_localize(None)
+
+        lo, hi = existing_layout.time_range(station, start, end)
+        replace_mask[lo:hi] = True
+        lo, hi = new_layout.time_range(station, start, end)
+        keep_new[lo:hi] = True
+
+    new_columns = [c for c in new_rows.columns if c not in existing.columns]
+    if new_columns:
+        logger.warning(f"New columns not in existing output (run a full rebuild to include): {new_columns}")
+
+    new_rows = new_rows.loc[keep_new].reindex(columns=existing.columns)
+    flag_cols = [c for c in existing.columns if c.endswith('_imputed')]
+    new_rows[flag_cols] = new_rows[flag_cols].fillna(0).astype(int)
+
+    spliced = pd.concat([existing.loc[~replace_mask], new_rows], ignore_index=True)
+    spliced['station'] = spliced['station'].astype(str).astype('category')
+    spliced = spliced.sort_values(['station', 'Datetime_UTC'], kind='stable').reset_index(drop=True)
+
+    logger.info(f"Spliced {keep_new.sum():,} rows, replacing {replace_mask.sum():,}")
+    return spliced
+
+def expand_windows(windows, manifest, keys_to_load):
+    """
+    Grow per-station windows until they cover every overlapping source.
+
+    Any unchanged source of an affected station that overlaps a window must be
+    reloaded too, otherwise its rows inside the window would be lost.
+    """
+    changed = True
+    while changed:
+        changed = False
+        for key, entry in manifest.items():
+            station = entry.get('station')
+            if key in keys_to_load or station not in windows or entry.get('start') is None:
+                continue
+            start, end = pd.Timestamp(entry['start']), pd.Timestamp(entry['end'])
+            win_start, win_end = windows[station]
+            if start <= win_end and end >= win_start:
+                windows[station] = (min(win_start, start), max(win_end, end))
+                keys_to_load.add(key)
+                changed = True
+    return windows, keys_to_load
+
+def run_incremental_update(csv_files):
+    """
+    Reprocess only new or changed sources and splice results into existing outputs.
+
+    Changed sources are detected from the manifest (size, mtime, content hash).
+    For each affected station the pipeline re-runs cleaning and imputation on the
+    changed time window plus an overlap margin of context, then recomputes only
+    the hourly/daily aggregates for the days that window touches.
+
+    Args:
+        csv_files: List of (full_path, relative_path) tuples
+
+    Returns:
+        True if outputs were updated incrementally, False if a full run is needed
+    """
+    manifest = load_manifest()
+    outputs = ['OUTPUT_ALL_DATA', 'OUTPUT_HOURLY', 'OUTPUT_DAILY']
+    if not manifest or not all(get_output_path(key).exists() for key in outputs):
+        logger.info("Incremental mode: no previous manifest or outputs, running full pipeline")
+        return False
+
+    logger.info("="*60)
+    logger.info("Incremental update")
+    logger.info("="*60)
+
+    # Fingerprint all sources
+    fingerprints = fingerprint_local_files(csv_files, manifest)
+    file_info_by_key = {rel: (full, rel) for full, rel in csv_files}
+
+    eccc_frames = {eccc_source_key(df): df for df in download_eccc_data()}
+    for key, df in eccc_frames.items():
+        fingerprints[key] = {'sha256': hash_dataframe(df)}
+
+    changed_keys = {k for k, fp in fingerprints.items()
+                    if manifest.get(k, {}).get('sha256') != fp['sha256']}
+    removed_keys = {k for k in manifest if k not in fingerprints}
+
+    logger.info(f"Changed/new sources: {len(changed_keys)}, removed: {len(removed_keys)}")
+
+    if not changed_keys and not removed_keys:
+        logger.info("No source changes detected - outputs are up to date")
+        for key, fp in fingerprints.items():
+            manifest[key].update(fp)
+        save_manifest(manifest)
+        return True
+
+    # Load changed sources
+    def load_source(key):
+        if key in eccc_frames:
+            return clean_columns(eccc_frames[key].copy())
+        return process_single_file(file_info_by_key[key])
+
+    raw_frames = {}
+    for key in changed_keys:
+        df = load_source(key)
+        if df is not None:
+            raw_frames[key] = df
+
+    # Build per-station windows from old (manifest) and new time ranges
+    new_entries = {key: build_manifest_entry(fingerprints[key], df)
+                   for key, df in raw_frames.items()}
+
+    windows = {}
+    for entry in [manifest[k] for k in (changed_keys | removed_keys) if k in manifest] + list(new_entries.values()):
+        if entry.get('start') is None:
+            continue
+        start, end = pd.Timestamp(entry['start']), pd.Timestamp(entry['end'])
+        station = entry['station']
+        if station in windows:
+            start, end = min(start, windows[station][0]), max(end, windows[station][1])
+        windows[station] = (start, end)
+
+    if not windows:
+        logger.warning("Changed sources have no parseable timestamps, running full pipeline")
+        return False
+
+    unchanged_manifest = {k: v for k, v in manifest.items()
+                          if k not in changed_keys and k not in removed_keys}
+    windows, keys_to_load = expand_windows(windows, unchanged_manifest, set(raw_frames))
+
+    for key in keys_to_load - set(raw_frames):
+        df = load_source(key)
+        if df is not None:
+            raw_frames[key] = df
+            new_entries[key] = build_manifest_entry(fingerprints[key], df)
+
+    for station, (start, end) in windows.items():
+        logger.info(f"  {station}: reprocessing {start} to {end}")
+
+    # Context rows around each window, reverted to pre-imputation values
+    margin = pd.Timedelta(hours=CONFIG['INCREMENTAL_OVERLAP_HOURS'])
+    existing = read_output('OUTPUT_ALL_DATA')
+    # Outputs are reloaded as float64; a full run works on float32 variables,
+    # so restore them or recomputed windows and aggregates drift from a rebuild
+    existing = existing.astype({col: dtype for col, dtype in VARIABLE_DTYPES.items()
+                                if col in existing.columns})
+    layout = StationLayout(existing)
+    existing = layout.df
+
+    context_mask = np.zeros(len(existing), dtype=bool)
+    # Missing counts for the rest of each affected station's history, so the
+    # imputation skip threshold matches a full run
+    outside_mask = np.zeros(len(existing), dtype=bool)
+    for station, (start, end) in windows.items():
+        lo, hi = layout.time_range(station, start - 2 * margin, start, inclusive='left')
+        context_mask[lo:hi] = True
+        lo, hi = layout.time_range(station, end, end + 2 * margin, inclusive='right')
+        context_mask[lo:hi] = True
+        block_start, block_stop = layout.offsets.get(station, (0, 0))
+        lo, hi = layout.time_range(station, start - 2 * margin, end + 2 * margin)
+        outside_mask[block_start:lo] = True
+        outside_mask[hi:block_stop] = True
+    context = unimpute(existing.loc[context_mask])
+    logger.info(f"Using {len(context):,} context rows for interpolation")
+
+    outside = unimpute(existing.loc[outside_mask])
+    outside_counts = (outside.drop(columns=['Datetime_UTC', 'station']).isnull()
+                      .groupby(outside['station'], observed=True).sum())
+    outside_counts['total_rows'] = outside.groupby('station', observed=True).size()
+
+    # Clean and impute the affected windows
+    window_data = assemble_frames([context] + list(raw_frames.values()))
+    window_data = clean_weather_data(window_data, drop_constant_columns=False)
+    window_data = apply_quality_control(window_data)
+    window_data = impute_missing_values(window_data, outside_counts=outside_counts)
+
+    spliced_windows = {s: (start - margin, end + margin) for s, (start, end) in windows.items()}
+    all_weather_data = splice_rows(existing, window_data, spliced_windows)
+    del existing, layout, context, outside, window_data, raw_frames
+    gc.collect()
+
+    # Recompute aggregates only for the days the windows touch
+    day_windows = {s: (start.floor('D'), end.floor('D') + pd.Timedelta(days=1) - pd.Timedelta(1, 'ns'))
+                   for s, (start, end) in spliced_windows.items()}
+    layout = StationLayout(all_weather_data)
+    all_weather_data = layout.df
+    agg_mask = np.zeros(len(all_weather_data), dtype=bool)
+    for station, (start, end) in day_windows.items():
+        lo, hi = layout.time_range(station, start, end)
+        agg_mask[lo:hi] = True
+
+    affected = all_weather_data.loc[agg_mask].copy()
+    affected['station'] = affected['station'].astype('category')
+    hourly_new = create_hourly_aggregates(affected)
+    daily_new = create_daily_aggregates(affected)
+
+    hourly_aggregated = splice_rows(read_output('OUTPUT_HOURLY'), hourly_new, day_windows)
+    daily_aggregated = splice_rows(read_output('OUTPUT_DAILY'), daily_new, day_windows,
+                                   time_floor=lambda t: t.floor('D'))
+
+    # Quality report is a per-station summary, so recompute it from the spliced data
+    data_quality_report = create_data_quality_csv(all_weather_data)
+
+    # Resampled products are cheap vectorized roll-ups; rebuild them whole
+    for name, product_df in resample_weather_data(all_weather_data).items():
+        product = next(p for p in CONFIG['RESAMPLE_PRODUCTS'] if p['name'] == name)
+        write_output(product_df, product['output'])
+
+    # Partitioned backends only rewrite the affected stations
+    affected_stations = list(windows)
+    write_output(data_quality_report, 'OUTPUT_DATA_QUALITY')
+    write_output(all_weather_data, 'OUTPUT_ALL_DATA', stations=affected_stations)
+    write_output(hourly_aggregated, 'OUTPUT_HOURLY', stations=affected_stations)
+    write_output(daily_aggregated, 'OUTPUT_DAILY', stations=affected_stations)
+
+    # Update manifest
+    for key in removed_keys:
+        manifest.pop(key, None)
+    for key, fp in fingerprints.items():
+        if key in new_entries:
+            manifest[key] = new_entries[key]
+        elif key in manifest:
+            manifest[key].update(fp)
+    save_manifest(manifest)
+
+    logger.info("Incremental update complete")
+    return True
+
+# ============================================================================
+# STREAMING PIPELINE
+# ============================================================================
+
+def group_sources_by_station(csv_files):
+    """
+    Group local files and ECCC registry entries by station name.
+
+    Returns:
+        Dict of station -> {'local': [(full_path, relative_path), ...], 'eccc': [registry entries]}
+    """
+    partitions = {}
+    for file_info in csv_files:
+        station = station_from_path(file_info[1])
+        partitions.setdefault(station, {'local': [], 'eccc': []})['local'].append(file_info)
+    for eccc_station in get_eccc_stations():
+        partitions.setdefault(eccc_station['name'], {'local': [], 'eccc': []})['eccc'].append(eccc_station)
+    return dict(sorted(partitions.items()))
+
+def load_station_sources(sources):
+    """Load and clean_columns one station's local files and ECCC downloads (None if empty)."""
+    frames = load_and_clean_local_data(sources['local']) if sources['local'] else []
+    if sources['eccc']:
+        frames += [clean_columns(df) for df in download_eccc_data(sources['eccc'])]
+    if not frames:
+        return None
+    return assemble_frames(frames)
+
+def ordered_union(columns, new_columns):
+    """Append new_columns to the columns list in encounter order (in place)."""
+    seen = set(columns)
+    columns.extend(c for c in new_columns if c not in seen)
+
+def order_flag_columns(columns):
+    """Keep data columns in order and move *_imputed flags after them, in data column order."""
+    data_cols = [c for c in columns if not c.endswith('_imputed')]
+    position = {c: i for i, c in enumerate(data_cols)}
+    flag_cols = sorted((c for c in columns if c.endswith('_imputed')),
+                       key=lambda c: position.get(c[:-len('_imputed')], len(position)))
+    return data_cols + flag_cols
+
+def align_partition(df, columns):
+    """
+    Project a partition result onto the run-wide column list.
+
+    Flag columns a partition never created mean nothing was imputed there,
+    so they are rebuilt as 1 where the value is missing and 0 elsewhere.
+    """
+    for col in columns:
+        if col in df.columns:
+            continue
+        base = col[:-len('_imputed')]
+        if col.endswith('_imputed') and base in df.columns:
+            df[col] = df[base].isnull().astype('int8')
+        else:
+            df[col] = np.nan
+    return df[columns]
+
+def process_station_partition(raw, raw_columns, constant_cols):
+    """
+    Run cleaning, imputation and aggregation on one station's data.
+
+    Args:
+        raw: The station's combined raw dataframe
+        raw_columns: Run-wide raw column list, so datetime handling and
+            column dropping behave exactly as on the combined dataset
+        constant_cols: Columns that are constant across the whole dataset
+
+    Returns:
+        Dict of output name -> DataFrame ('all', 'hourly', 'daily' and any
+        resampled products)
+    """
+    df = clean_weather_data(raw.reindex(columns=raw_columns), drop_constant_columns=False)
+    df = df.drop(columns=[c for c in constant_cols if c in df.columns])
+    if df.empty:
+        return {}
+
+    df = apply_quality_control(df)
+    df = impute_missing_values(df)
+    results = {'all': df}
+    results['hourly'] = create_hourly_aggregates(df)
+    results['daily'] = create_daily_aggregates(df)
+    results.update(resample_weather_data(df))
+    results['all'] = df.drop(columns=['hour_label', 'minutes_from_hour'])
+    return results
+
+def build_streaming_summary(quality_rows, value_dir, data_cols, flag_cols):
+    """
+    Build ALL_STATIONS quality rows from per-station rows and spilled values.
+
+    Counts are summed from the station rows; statistics are computed one
+    column at a time from the valid values spilled during finalisation.
+
+    Args:
+        quality_rows: Per-station quality report rows
+        value_dir: Folder of '{column index}_{partition}.npy' value files
+        data_cols: Data columns in report order
+        flag_cols: Flag columns present in the all-data output
+    """
+    station_rows = pd.DataFrame(quality_rows)
+    summary_rows = []
+    for j, col in enumerate(data_cols):
+        col_rows = station_rows[station_rows['column'] == col]
+        values = [np.load(f, allow_pickle=True) for f in sorted(value_dir.glob(f"{j:04d}_*.npy"))]
+        valid_data = pd.Series(np.concatenate(values) if values else np.array([], dtype=np.float64))
+        flag_counts = None
+        if f"{col}_imputed" in flag_cols:
+            flag_counts = (col_rows['original_data_count'].sum(), col_rows['interpolated_count'].sum(),
+                           col_rows['calculated_count'].sum())
+        row = build_quality_row('ALL_STATIONS', col, col_rows['total_rows'].sum(),
+                                col_rows['missing_count'].sum(), flag_counts, valid_data)
+        gap_cols = gap_histogram_columns()
+        row.update(col_rows[gap_cols[:-1]].sum().to_dict())
+        row['longest_gap_hours'] = col_rows['longest_gap_hours'].max()
+        summary_rows.append(row)
+    return pd.DataFrame(summary_rows)
+
+def run_streaming_pipeline(csv_files):
+    """
+    Process the archive one station at a time with bounded memory.
+
+    Pass 1 loads each station's sources, records the run-wide raw column
+    list and a constant-column profile, and spills the raw partition to
+    disk. Pass 2 cleans, imputes and aggregates each station on its own
+    (interpolation never crosses stations, so no edge context is needed)
+    and spills the results. Finalisation aligns every partition to the
+    run-wide schema and appends it to the outputs. Peak memory is set by
+    the largest station, plus one column of values for the ALL_STATIONS
+    quality summary.
+
+    Args:
+        csv_files: List of (full_path, relative_path) tuples
+
+    Returns:
+        Dict of output name -> written path
+    """
+    partitions = group_sources_by_station(csv_files)
+    logger.info(f"Streaming mode: {len(partitions)} station partitions")
+
+    ensure_cache_dir()
+    spill_dir = Path(tempfile.mkdtemp(prefix='streaming_', dir=CONFIG['CACHE_DIR']))
+    try:
+        # Pass 1: load sources, learn the run-wide schema, spill raw partitions
+        raw_columns = []
+        profile = {}
+        raw_paths = {}
+        for i, (station, sources) in enumerate(partitions.items()):
+            raw = load_station_sources(sources)
+            if raw is None:
+                continue
+            ordered_union(raw_columns, raw.columns)
+            update_column_profile(profile, raw)
+            raw_paths[station] = spill_dir / f"raw_{i:05d}.pkl"
+            raw.to_pickle(raw_paths[station])
+            logger.info(f"Loaded {station}: {len(raw):,} rows "
+                        f"({raw.memory_usage(deep=True).sum() / 1e6:.1f} MB)")
+            del raw
+        constant_cols = constant_columns_from_profile(profile)
+
+        # Pass 2: clean, impute and aggregate each station, spill the results
+        output_columns = {}
+        result_paths = []
+        for station, raw_path in raw_paths.items():
+            logger.info(f"Processing station partition: {station}")
+            results = process_station_partition(pd.read_pickle(raw_path), raw_columns, constant_cols)
+            raw_path.unlink()
+            paths = {}
+            for name, result in results.items():
+                ordered_union(output_columns.setdefault(name, []), result.columns)
+                paths[name] = raw_path.with_name(f"{raw_path.stem}_{name}.pkl")
+                result.to_pickle(paths[name])
+            result_paths.append(paths)
+            del results
+            gc.collect()
+
+        # Finalise: align to the run-wide schema and append to the outputs
+        output_keys = {'all': 'OUTPUT_ALL_DATA', 'hourly': 'OUTPUT_HOURLY', 'daily': 'OUTPUT_DAILY'}
+        output_keys.update({p['name']: p['output'] for p in CONFIG['RESAMPLE_PRODUCTS']})
+        output_columns = {name: order_flag_columns(columns) for name, columns in output_columns.items()}
+        written = {}
+        quality_rows = []
+        data_cols = [c for c in output_columns['all']
+                     if c not in ['Datetime_UTC', 'station', QC_FLAG_COLUMN] and not c.endswith('_imputed')]
+        flag_cols = [c for c in output_columns['all'] if c.endswith('_imputed')]
+        value_dir = spill_dir / 'values'
+        value_dir.mkdir()
+
+        for i, paths in enumerate(result_paths):
+            for name, path in paths.items():
+                result = align_partition(pd.read_pickle(path), output_columns[name])
+                path.unlink()
+                written[name] = write_output(result, output_keys[name], append=name in written)
+
+                # Station quality rows now; values kept on disk for the ALL_STATIONS summary
+                if name == 'all':
+                    quality_rows += create_data_quality_csv(result, include_summary=False).to_dict('records')
+                    for j, col in enumerate(data_cols):
+                        np.save(value_dir / f"{j:04d}_{i:05d}.npy", result[col].dropna().to_numpy())
+                del result
+
+        data_quality_report = pd.concat([pd.DataFrame(quality_rows),
+                                         build_streaming_summary(quality_rows, value_dir, data_cols, flag_cols)],
+                                        ignore_index=True)
+        written['quality'] = write_output(data_quality_report, 'OUTPUT_DATA_QUALITY')
+        logger.info(f"Streaming run complete: {len(result_paths)} stations written")
+        return written
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+
 # ============================================================================
 # MAIN PIPELINE
 # ============================================================================
@@ -1160,20 +4539,49 @@ def main():
         # Step 1: Fetch local CSV data
         csv_files = get_csv_files_from_local()
 
+        # Streaming mode: one station at a time, never the whole archive in memory
+        if CONFIG['STREAMING_MODE']:
+            if CONFIG['INCREMENTAL_MODE']:
+                logger.warning("INCREMENTAL_MODE is ignored in streaming mode")
+            written = run_streaming_pipeline(csv_files)
+            logger.info("="*60)
+            logger.info("Pipeline completed successfully!")
+            logger.info("="*60)
+            logger.info("\nOutput files:")
+            for i, output_path in enumerate(written.values(), start=1):
+                logger.info(f"  {i}. {output_path}")
+            return
+
+        # Incremental mode: only reprocess changed sources if possible
+        if CONFIG['INCREMENTAL_MODE'] and run_incremental_update(csv_files):
+            return
+
         # Step 2: Load and clean local CSV data in parallel
-        local_dataframes = load_and_clean_local_data(csv_files)
+        local_sources = load_and_clean_local_data(csv_files, with_paths=True)
+        local_dataframes = [df for _, df in local_sources]
 
         # Step 3: Download ECCC data with caching
-        eccc_dataframes = download_eccc_stanhope_data()
+        eccc_dataframes = download_eccc_data()
+
+        # Record source fingerprints so the next run can be incremental
+        if CONFIG['INCREMENTAL_MODE']:
+            manifest = {}
+            fingerprints = fingerprint_local_files(csv_files, load_manifest())
+            for relative_path, df in local_sources:
+                manifest[relative_path] = build_manifest_entry(fingerprints[relative_path], df)
+            for df in eccc_dataframes:
+                manifest[eccc_source_key(df)] = build_manifest_entry(
+                    {'sha256': hash_dataframe(df)}, clean_columns(df.copy()))
+        del local_sources
 
         # Step 4: Clean ECCC dataframes
         logger.info("Cleaning ECCC dataframes...")
         eccc_cleaned = [clean_columns(df) for df in eccc_dataframes]
 
-        # Step 5: Combine all dataframes
+        # Step 5: Combine all dataframes with their dtypes projected
         logger.info("Combining all dataframes...")
         all_dataframes = local_dataframes + eccc_cleaned
-        all_weather_data = pd.concat(all_dataframes, axis=0, ignore_index=True, sort=False)
+        all_weather_data = assemble_frames(all_dataframes)
 
         # Free memory
         del local_dataframes, eccc_dataframes, eccc_cleaned, all_dataframes
@@ -1186,9 +4594,11 @@ def main():
         all_weather_data = clean_weather_data(all_weather_data)
 
         # Step 8: Generate quality report after cleaning
-        generate_data_quality_report(all_weather_data, "After Cleaning")
+        # Every policy leaves at most one row per key and drops identical rows without one
+        generate_data_quality_report(all_weather_data, "After Cleaning", known={'duplicate_rows': 0})
 
-        # Step 9: IMPUTE MISSING VALUES (with 25% threshold and Dew bounds)
+        # Step 9: QUALITY CONTROL, then IMPUTE MISSING VALUES (with 25% threshold)
+        all_weather_data = apply_quality_control(all_weather_data)
         all_weather_data = impute_missing_values(all_weather_data)
 
         # Step 10: Generate quality report after imputation
@@ -1196,37 +4606,43 @@ def main():
 
         # Step 11: CREATE DATA QUALITY CSV REPORT (with statistics)
         data_quality_report = create_data_quality_csv(all_weather_data)
-        quality_output = CONFIG['OUTPUT_DATA_QUALITY']
-        data_quality_report.to_csv(quality_output, index=False)
+        quality_output = write_output(data_quality_report, 'OUTPUT_DATA_QUALITY')
         logger.info(f"Saved data quality report to: {quality_output}")
 
         # Step 12: Save all data
-        output_file = CONFIG['OUTPUT_ALL_DATA']
-        all_weather_data.to_csv(output_file, index=False)
+        output_file = write_output(all_weather_data, 'OUTPUT_ALL_DATA')
         logger.info(f"Saved all weather data to: {output_file}")
 
         # Step 13: Create hourly aggregates
         hourly_aggregated = create_hourly_aggregates(all_weather_data)
 
         # Step 14: Generate quality report for hourly data
-        generate_data_quality_report(hourly_aggregated, "Hourly Aggregated")
+        generate_data_quality_report(hourly_aggregated, "Hourly Aggregated", known={'duplicate_rows': 0})
 
         # Step 15: Save hourly data
-        hourly_output = CONFIG['OUTPUT_HOURLY']
-        hourly_aggregated.to_csv(hourly_output, index=False)
+        hourly_output = write_output(hourly_aggregated, 'OUTPUT_HOURLY')
         logger.info(f"Saved hourly weather data to: {hourly_output}")
 
         # Step 16: Create daily aggregates
         daily_aggregated = create_daily_aggregates(all_weather_data)
 
         # Step 17: Generate quality report for daily data
-        generate_data_quality_report(daily_aggregated, "Daily Aggregated")
+        generate_data_quality_report(daily_aggregated, "Daily Aggregated", known={'duplicate_rows': 0})
 
         # Step 18: Save daily data
-        daily_output = CONFIG['OUTPUT_DAILY']
-        daily_aggregated.to_csv(daily_output, index=False)
+        daily_output = write_output(daily_aggregated, 'OUTPUT_DAILY')
         logger.info(f"Saved daily weather data to: {daily_output}")
 
+        # Step 19: Create and save additional resampled products
+        resampled_outputs = []
+        for name, product_df in resample_weather_data(all_weather_data).items():
+            product = next(p for p in CONFIG['RESAMPLE_PRODUCTS'] if p['name'] == name)
+            resampled_outputs.append(write_output(product_df, product['output']))
+            logger.info(f"Saved {name} weather data to: {resampled_outputs[-1]}")
+
+        if CONFIG['INCREMENTAL_MODE']:
+            save_manifest(manifest)
+
         logger.info("="*60)
         logger.info("Pipeline completed successfully!")
         logger.info("="*60)
@@ -1235,7 +4651,9 @@ def main():
         logger.info(f"  2. {hourly_output} - Hourly aggregates")
         logger.info(f"  3. {daily_output} - Daily aggregates")
         logger.info(f"  4. {quality_output} - Data quality report with statistics")
-        logger.info("\nNOTE: Imputation flags (*_imputed columns) saved in all_weather_data.csv")
+        for i, resampled_output in enumerate(resampled_outputs, start=5):
+            logger.info(f"  {i}. {resampled_output} - Resampled product")
+        logger.info(f"\nNOTE: Imputation flags (*_imputed columns) saved in {output_file}")
         logger.info("  0 = original data")
         logger.info("  1 = interpolated (< 3 hours)")
         logger.info("  2 = calculated or special method")